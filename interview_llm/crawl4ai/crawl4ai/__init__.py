@@ -1,111 +1,238 @@
 # __init__.py
+"""
+Public API of crawl4ai.
+
+Names are resolved lazily through the module-level ``__getattr__`` (PEP 562):
+``import crawl4ai`` only loads this file, and each subsystem (browser stack,
+extraction strategies, adaptive crawler, C4A script compiler, ...) with its
+heavy dependencies is imported the first time one of its names is used.
+``python -m crawl4ai.import_benchmark`` measures the resulting cold start.
+"""
+import importlib
 import warnings
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_webcrawler import AsyncWebCrawler, CacheMode
+    # MODIFIED: Add SeedingConfig and VirtualScrollConfig here
+    from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, LLMConfig, ProxyConfig, GeolocationConfig, SeedingConfig, VirtualScrollConfig, LinkPreviewConfig, MatchMode, ResourceBlockingConfig
+
+    from .content_scraping_strategy import (
+        ContentScrapingStrategy,
+        LXMLWebScrapingStrategy,
+        WebScrapingStrategy,  # Backward compatibility alias
+    )
+    from .async_logger import (
+        AsyncLoggerBase,
+        AsyncLogger,
+    )
+    from .proxy_strategy import (
+        ProxyRotationStrategy,
+        RoundRobinProxyStrategy,
+    )
+    from .extraction_strategy import (
+        ExtractionStrategy,
+        LLMExtractionStrategy,
+        CosineStrategy,
+        JsonCssExtractionStrategy,
+        JsonXPathExtractionStrategy,
+        JsonLxmlExtractionStrategy,
+        RegexExtractionStrategy
+    )
+    from .chunking_strategy import ChunkingStrategy, RegexChunking
+    from .markdown_generation_strategy import DefaultMarkdownGenerator
+    from .table_extraction import (
+        TableExtractionStrategy,
+        DefaultTableExtraction,
+        NoTableExtraction,
+        LLMTableExtraction,
+    )
+    from .content_filter_strategy import (
+        PruningContentFilter,
+        BM25ContentFilter,
+        LLMContentFilter,
+        RelevantContentFilter,
+    )
+    from .models import CrawlResult, MarkdownGenerationResult, DisplayMode
+    from .components.crawler_monitor import CrawlerMonitor
+    from .link_preview import LinkPreview
+    from .async_dispatcher import (
+        MemoryAdaptiveDispatcher,
+        SemaphoreDispatcher,
+        RateLimiter,
+        BaseDispatcher,
+    )
+    from .docker_client import Crawl4aiDockerClient
+    from .hub import CrawlerHub
+    from .browser_profiler import BrowserProfiler
+    from .deep_crawling import (
+        DeepCrawlStrategy,
+        BFSDeepCrawlStrategy,
+        FilterChain,
+        URLPatternFilter,
+        DomainFilter,
+        ContentTypeFilter,
+        URLFilter,
+        FilterStats,
+        SEOFilter,
+        KeywordRelevanceScorer,
+        URLScorer,
+        CompositeScorer,
+        DomainAuthorityScorer,
+        FreshnessScorer,
+        PathDepthScorer,
+        BestFirstCrawlingStrategy,
+        DFSDeepCrawlStrategy,
+        DeepCrawlDecorator,
+        SQLiteFrontier,
+    )
+    # NEW: Import AsyncUrlSeeder
+    from .async_url_seeder import AsyncUrlSeeder
+    # Adaptive Crawler
+    from .adaptive_crawler import (
+        AdaptiveCrawler,
+        AdaptiveConfig,
+        CrawlState,
+        CrawlStrategy,
+        StatisticalStrategy
+    )
+
+    # C4A Script Language Support
+    from .script import (
+        compile as c4a_compile,
+        validate as c4a_validate,
+        compile_file as c4a_compile_file,
+        CompilationResult,
+        ValidationResult,
+        ErrorDetail
+    )
+
+    # Browser Adapters
+    from .browser_adapter import (
+        BrowserAdapter,
+        PlaywrightAdapter,
+        UndetectedAdapter
+    )
+
+    from .utils import (
+        start_colab_display_server,
+        setup_colab_environment,
+        hooks_to_string
+    )
+
+
+# Public name -> (submodule, attribute), imported on first access
+_LAZY_IMPORTS = {
+    "AsyncWebCrawler": (".async_webcrawler", "AsyncWebCrawler"),
+    "CacheMode": (".cache_context", "CacheMode"),
+
+    "BrowserConfig": (".async_configs", "BrowserConfig"),
+    "CrawlerRunConfig": (".async_configs", "CrawlerRunConfig"),
+    "HTTPCrawlerConfig": (".async_configs", "HTTPCrawlerConfig"),
+    "LLMConfig": (".async_configs", "LLMConfig"),
+    "ProxyConfig": (".async_configs", "ProxyConfig"),
+    "GeolocationConfig": (".async_configs", "GeolocationConfig"),
+    "SeedingConfig": (".async_configs", "SeedingConfig"),
+    "VirtualScrollConfig": (".async_configs", "VirtualScrollConfig"),
+    "LinkPreviewConfig": (".async_configs", "LinkPreviewConfig"),
+    "ResourceBlockingConfig": (".async_configs", "ResourceBlockingConfig"),
+    "MatchMode": (".async_configs", "MatchMode"),
+
+    "ContentScrapingStrategy": (".content_scraping_strategy", "ContentScrapingStrategy"),
+    "LXMLWebScrapingStrategy": (".content_scraping_strategy", "LXMLWebScrapingStrategy"),
+    "WebScrapingStrategy": (".content_scraping_strategy", "WebScrapingStrategy"),
+
+    "AsyncLoggerBase": (".async_logger", "AsyncLoggerBase"),
+    "AsyncLogger": (".async_logger", "AsyncLogger"),
+
+    "ProxyRotationStrategy": (".proxy_strategy", "ProxyRotationStrategy"),
+    "RoundRobinProxyStrategy": (".proxy_strategy", "RoundRobinProxyStrategy"),
+
+    "ExtractionStrategy": (".extraction_strategy", "ExtractionStrategy"),
+    "LLMExtractionStrategy": (".extraction_strategy", "LLMExtractionStrategy"),
+    "CosineStrategy": (".extraction_strategy", "CosineStrategy"),
+    "JsonCssExtractionStrategy": (".extraction_strategy", "JsonCssExtractionStrategy"),
+    "JsonXPathExtractionStrategy": (".extraction_strategy", "JsonXPathExtractionStrategy"),
+    "JsonLxmlExtractionStrategy": (".extraction_strategy", "JsonLxmlExtractionStrategy"),
+    "RegexExtractionStrategy": (".extraction_strategy", "RegexExtractionStrategy"),
+
+    "ChunkingStrategy": (".chunking_strategy", "ChunkingStrategy"),
+    "RegexChunking": (".chunking_strategy", "RegexChunking"),
+
+    "DefaultMarkdownGenerator": (".markdown_generation_strategy", "DefaultMarkdownGenerator"),
+
+    "TableExtractionStrategy": (".table_extraction", "TableExtractionStrategy"),
+    "DefaultTableExtraction": (".table_extraction", "DefaultTableExtraction"),
+    "NoTableExtraction": (".table_extraction", "NoTableExtraction"),
+    "LLMTableExtraction": (".table_extraction", "LLMTableExtraction"),
+
+    "PruningContentFilter": (".content_filter_strategy", "PruningContentFilter"),
+    "BM25ContentFilter": (".content_filter_strategy", "BM25ContentFilter"),
+    "LLMContentFilter": (".content_filter_strategy", "LLMContentFilter"),
+    "RelevantContentFilter": (".content_filter_strategy", "RelevantContentFilter"),
 
-from .async_webcrawler import AsyncWebCrawler, CacheMode
-# MODIFIED: Add SeedingConfig and VirtualScrollConfig here
-from .async_configs import BrowserConfig, CrawlerRunConfig, HTTPCrawlerConfig, LLMConfig, ProxyConfig, GeolocationConfig, SeedingConfig, VirtualScrollConfig, LinkPreviewConfig, MatchMode
-
-from .content_scraping_strategy import (
-    ContentScrapingStrategy,
-    LXMLWebScrapingStrategy,
-    WebScrapingStrategy,  # Backward compatibility alias
-)
-from .async_logger import (
-    AsyncLoggerBase,
-    AsyncLogger,
-)
-from .proxy_strategy import (
-    ProxyRotationStrategy,
-    RoundRobinProxyStrategy,
-)
-from .extraction_strategy import (
-    ExtractionStrategy,
-    LLMExtractionStrategy,
-    CosineStrategy,
-    JsonCssExtractionStrategy,
-    JsonXPathExtractionStrategy,
-    JsonLxmlExtractionStrategy,
-    RegexExtractionStrategy
-)
-from .chunking_strategy import ChunkingStrategy, RegexChunking
-from .markdown_generation_strategy import DefaultMarkdownGenerator
-from .table_extraction import (
-    TableExtractionStrategy,
-    DefaultTableExtraction,
-    NoTableExtraction,
-    LLMTableExtraction,
-)
-from .content_filter_strategy import (
-    PruningContentFilter,
-    BM25ContentFilter,
-    LLMContentFilter,
-    RelevantContentFilter,
-)
-from .models import CrawlResult, MarkdownGenerationResult, DisplayMode
-from .components.crawler_monitor import CrawlerMonitor
-from .link_preview import LinkPreview
-from .async_dispatcher import (
-    MemoryAdaptiveDispatcher,
-    SemaphoreDispatcher,
-    RateLimiter,
-    BaseDispatcher,
-)
-from .docker_client import Crawl4aiDockerClient
-from .hub import CrawlerHub
-from .browser_profiler import BrowserProfiler
-from .deep_crawling import (
-    DeepCrawlStrategy,
-    BFSDeepCrawlStrategy,
-    FilterChain,
-    URLPatternFilter,
-    DomainFilter,
-    ContentTypeFilter,
-    URLFilter,
-    FilterStats,
-    SEOFilter,
-    KeywordRelevanceScorer,
-    URLScorer,
-    CompositeScorer,
-    DomainAuthorityScorer,
-    FreshnessScorer,
-    PathDepthScorer,
-    BestFirstCrawlingStrategy,
-    DFSDeepCrawlStrategy,
-    DeepCrawlDecorator,
-)
-# NEW: Import AsyncUrlSeeder
-from .async_url_seeder import AsyncUrlSeeder
-# Adaptive Crawler
-from .adaptive_crawler import (
-    AdaptiveCrawler,
-    AdaptiveConfig,
-    CrawlState,
-    CrawlStrategy,
-    StatisticalStrategy
-)
-
-# C4A Script Language Support
-from .script import (
-    compile as c4a_compile,
-    validate as c4a_validate,
-    compile_file as c4a_compile_file,
-    CompilationResult,
-    ValidationResult,
-    ErrorDetail
-)
-
-# Browser Adapters
-from .browser_adapter import (
-    BrowserAdapter,
-    PlaywrightAdapter,
-    UndetectedAdapter
-)
-
-from .utils import (
-    start_colab_display_server,
-    setup_colab_environment,
-    hooks_to_string
-)
+    "CrawlResult": (".models", "CrawlResult"),
+    "MarkdownGenerationResult": (".models", "MarkdownGenerationResult"),
+    "DisplayMode": (".models", "DisplayMode"),
+
+    "CrawlerMonitor": (".components.crawler_monitor", "CrawlerMonitor"),
+
+    "LinkPreview": (".link_preview", "LinkPreview"),
+
+    "MemoryAdaptiveDispatcher": (".async_dispatcher", "MemoryAdaptiveDispatcher"),
+    "SemaphoreDispatcher": (".async_dispatcher", "SemaphoreDispatcher"),
+    "RateLimiter": (".async_dispatcher", "RateLimiter"),
+    "BaseDispatcher": (".async_dispatcher", "BaseDispatcher"),
+
+    "Crawl4aiDockerClient": (".docker_client", "Crawl4aiDockerClient"),
+
+    "CrawlerHub": (".hub", "CrawlerHub"),
+
+    "BrowserProfiler": (".browser_profiler", "BrowserProfiler"),
+
+    "DeepCrawlStrategy": (".deep_crawling", "DeepCrawlStrategy"),
+    "BFSDeepCrawlStrategy": (".deep_crawling", "BFSDeepCrawlStrategy"),
+    "FilterChain": (".deep_crawling", "FilterChain"),
+    "URLPatternFilter": (".deep_crawling", "URLPatternFilter"),
+    "DomainFilter": (".deep_crawling", "DomainFilter"),
+    "ContentTypeFilter": (".deep_crawling", "ContentTypeFilter"),
+    "URLFilter": (".deep_crawling", "URLFilter"),
+    "FilterStats": (".deep_crawling", "FilterStats"),
+    "SEOFilter": (".deep_crawling", "SEOFilter"),
+    "KeywordRelevanceScorer": (".deep_crawling", "KeywordRelevanceScorer"),
+    "URLScorer": (".deep_crawling", "URLScorer"),
+    "CompositeScorer": (".deep_crawling", "CompositeScorer"),
+    "DomainAuthorityScorer": (".deep_crawling", "DomainAuthorityScorer"),
+    "FreshnessScorer": (".deep_crawling", "FreshnessScorer"),
+    "PathDepthScorer": (".deep_crawling", "PathDepthScorer"),
+    "BestFirstCrawlingStrategy": (".deep_crawling", "BestFirstCrawlingStrategy"),
+    "DFSDeepCrawlStrategy": (".deep_crawling", "DFSDeepCrawlStrategy"),
+    "DeepCrawlDecorator": (".deep_crawling", "DeepCrawlDecorator"),
+    "SQLiteFrontier": (".deep_crawling", "SQLiteFrontier"),
+
+    "AsyncUrlSeeder": (".async_url_seeder", "AsyncUrlSeeder"),
+
+    "AdaptiveCrawler": (".adaptive_crawler", "AdaptiveCrawler"),
+    "AdaptiveConfig": (".adaptive_crawler", "AdaptiveConfig"),
+    "CrawlState": (".adaptive_crawler", "CrawlState"),
+    "CrawlStrategy": (".adaptive_crawler", "CrawlStrategy"),
+    "StatisticalStrategy": (".adaptive_crawler", "StatisticalStrategy"),
+
+    "c4a_compile": (".script", "compile"),
+    "c4a_validate": (".script", "validate"),
+    "c4a_compile_file": (".script", "compile_file"),
+    "CompilationResult": (".script", "CompilationResult"),
+    "ValidationResult": (".script", "ValidationResult"),
+    "ErrorDetail": (".script", "ErrorDetail"),
+
+    "BrowserAdapter": (".browser_adapter", "BrowserAdapter"),
+    "PlaywrightAdapter": (".browser_adapter", "PlaywrightAdapter"),
+    "UndetectedAdapter": (".browser_adapter", "UndetectedAdapter"),
+
+    "start_colab_display_server": (".utils", "start_colab_display_server"),
+    "setup_colab_environment": (".utils", "setup_colab_environment"),
+    "hooks_to_string": (".utils", "hooks_to_string"),
+}
 
 __all__ = [
     "AsyncLoggerBase",
@@ -129,6 +256,7 @@ __all__ = [
     "BFSDeepCrawlStrategy",
     "BestFirstCrawlingStrategy",
     "DFSDeepCrawlStrategy",
+    "SQLiteFrontier",
     "FilterChain",
     "URLPatternFilter",
     "ContentTypeFilter",
@@ -196,7 +324,8 @@ __all__ = [
     "BrowserAdapter",
     "PlaywrightAdapter", 
     "UndetectedAdapter",
-    "LinkPreviewConfig"
+    "LinkPreviewConfig",
+    "ResourceBlockingConfig",
 ]
 
 
@@ -223,6 +352,29 @@ __all__ = [
 #     # import warnings
 #     # print("Warning: Synchronous WebCrawler is not available. Install crawl4ai[sync] for synchronous support. However, please note that the synchronous version will be deprecated soon.")
 
+
+
+def __getattr__(name: str):
+    target = _LAZY_IMPORTS.get(name)
+    if target is None:
+        # Keep submodules reachable as attributes (crawl4ai.utils, ...), as
+        # they were when everything was imported eagerly
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
 # Disable all Pydantic warnings
 warnings.filterwarnings("ignore", module="pydantic")
 # pydantic_warnings.filter_warnings()
\ No newline at end of file
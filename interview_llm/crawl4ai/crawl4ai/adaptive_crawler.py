@@ -21,8 +21,18 @@ from pathlib import Path
 from crawl4ai.async_webcrawler import AsyncWebCrawler
 from crawl4ai.async_configs import CrawlerRunConfig, LinkPreviewConfig, LLMConfig
 from crawl4ai.models import Link, CrawlResult
+from crawl4ai.deep_crawling.frontier import SQLiteFrontier
+from crawl4ai.embedding_store import EmbeddingStore, IncrementalNNIndex, QueryCoverage
 import numpy as np
 
+# State paths with these suffixes are persisted through SQLiteFrontier instead of JSON
+SQLITE_STATE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+# Append-only tables CrawlState keeps in a SQLite state file
+_CRAWL_STATE_LOGS = (
+    'knowledge_base', 'kb_embeddings', 'crawl_order', 'new_terms_history',
+    'doc_terms', 'term_frequency_deltas',
+)
+
 @dataclass
 class CrawlState:
     """Tracks the current state of adaptive crawling"""
@@ -38,6 +48,12 @@ class CrawlState:
     documents_with_terms: Dict[str, Set[int]] = field(default_factory=lambda: defaultdict(set))
     total_documents: int = 0
     
+    # Incremental consistency tracking: one term set per knowledge_base entry plus
+    # running pairwise-Jaccard totals. Not persisted; rebuilt from knowledge_base.
+    doc_term_sets: List[Set[str]] = field(default_factory=list)
+    overlap_sum: float = 0.0
+    overlap_pairs: int = 0
+    
     # History tracking for saturation
     new_terms_history: List[int] = field(default_factory=list)
     crawl_order: List[str] = field(default_factory=list)
@@ -50,39 +66,116 @@ class CrawlState:
     semantic_gaps: List[Tuple[List[float], float]] = field(default_factory=list)  # Serializable
     embedding_model: str = ""
     
+    # (path, total_documents, term_frequencies) as of the last SQLite save or
+    # load, so the next save to the same file only appends what changed
+    _last_sqlite_save: Optional[Tuple[str, int, Dict[str, int]]] = field(default=None, init=False, repr=False, compare=False)
+    
     def save(self, path: Union[str, Path]):
-        """Save state to disk for persistence"""
+        """
+        Save state to disk for persistence.
+
+        Paths ending in .db/.sqlite/.sqlite3 are written to a SQLiteFrontier:
+        crawled URLs are added to its visited set, and knowledge-base documents,
+        embedding rows, crawl order and term statistics go to append-only logs,
+        so each save only writes what was added since the previous one. The
+        pending-link queue and the small scalar state are rewritten.
+        Any other path is written as a single JSON file.
+        """
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         
+        if path.suffix in SQLITE_STATE_SUFFIXES:
+            self._save_sqlite(path)
+            return
+        
         # Convert CrawlResult objects to dicts for serialization
         state_dict = {
             'crawled_urls': list(self.crawled_urls),
             'knowledge_base': [self._crawl_result_to_dict(cr) for cr in self.knowledge_base],
             'pending_links': [link.model_dump() for link in self.pending_links],
-            'query': self.query,
-            'metrics': self.metrics,
             'term_frequencies': dict(self.term_frequencies),
             'document_frequencies': dict(self.document_frequencies),
             'documents_with_terms': {k: list(v) for k, v in self.documents_with_terms.items()},
-            'total_documents': self.total_documents,
             'new_terms_history': self.new_terms_history,
             'crawl_order': self.crawl_order,
             # Embedding-specific fields (convert numpy arrays to lists for JSON)
             'kb_embeddings': self.kb_embeddings.tolist() if self.kb_embeddings is not None else None,
+            **self._scalar_state(),
+        }
+        
+        with open(path, 'w') as f:
+            json.dump(state_dict, f, indent=2)
+    
+    def _scalar_state(self) -> Dict[str, Any]:
+        """The part of the state that does not grow with the number of crawled pages"""
+        return {
+            'query': self.query,
+            'metrics': self.metrics,
+            'total_documents': self.total_documents,
             'query_embeddings': self.query_embeddings.tolist() if self.query_embeddings is not None else None,
             'expanded_queries': self.expanded_queries,
             'semantic_gaps': self.semantic_gaps,
             'embedding_model': self.embedding_model
         }
-        
-        with open(path, 'w') as f:
-            json.dump(state_dict, f, indent=2)
+    
+    def _save_sqlite(self, path: Path) -> None:
+        with SQLiteFrontier(path) as frontier:
+            frontier.visited.update(self.crawled_urls)
+            frontier.clear_queue()
+            frontier.push_many(
+                (link.href, None, 0, 0.0, link.model_dump()) for link in self.pending_links
+            )
+            
+            # Logs are only appended to when this state was the last one saved
+            # to (or loaded from) this file; otherwise they are rewritten
+            saved_docs = frontier.log_length('doc_terms')
+            last_save = self._last_sqlite_save
+            if last_save is None or last_save[0] != str(path) or last_save[1] != saved_docs:
+                for name in _CRAWL_STATE_LOGS:
+                    frontier.clear_log(name)
+                saved_docs, saved_tf = 0, {}
+            else:
+                saved_tf = last_save[2]
+            
+            def append_new(name, rows, convert=lambda row: row):
+                saved = frontier.log_length(name)
+                frontier.extend_log(name, (convert(row) for row in rows[saved:]))
+            
+            append_new('knowledge_base', self.knowledge_base, self._crawl_result_to_dict)
+            append_new('kb_embeddings', self.kb_embeddings if self.kb_embeddings is not None else [],
+                       lambda row: row.tolist())
+            append_new('crawl_order', self.crawl_order)
+            append_new('new_terms_history', self.new_terms_history)
+            
+            # Term statistics: the terms of each new document, plus one row with
+            # the term-frequency changes since the last save
+            new_docs = self.total_documents - saved_docs
+            doc_terms: List[List[str]] = [[] for _ in range(new_docs)]
+            for term, doc_ids in self.documents_with_terms.items():
+                candidates = doc_ids if len(doc_ids) <= new_docs else range(saved_docs, self.total_documents)
+                for doc_id in candidates:
+                    if doc_id >= saved_docs and doc_id in doc_ids:
+                        doc_terms[doc_id - saved_docs].append(term)
+            frontier.extend_log('doc_terms', doc_terms)
+            
+            tf_delta = {
+                term: count - saved_tf.get(term, 0)
+                for term, count in self.term_frequencies.items()
+                if count != saved_tf.get(term, 0)
+            }
+            if tf_delta:
+                frontier.extend_log('term_frequency_deltas', [tf_delta])
+            
+            frontier.set_state('adaptive_state', self._scalar_state())
+        self._last_sqlite_save = (str(path), self.total_documents, dict(self.term_frequencies))
     
     @classmethod
     def load(cls, path: Union[str, Path]) -> 'CrawlState':
-        """Load state from disk"""
+        """Load state from disk (JSON file or SQLiteFrontier database)"""
         path = Path(path)
+        if path.suffix in SQLITE_STATE_SUFFIXES:
+            return cls._load_sqlite(path)
+        
         with open(path, 'r') as f:
             state_dict = json.load(f)
         
@@ -90,25 +183,57 @@ class CrawlState:
         state.crawled_urls = set(state_dict['crawled_urls'])
         state.knowledge_base = [cls._dict_to_crawl_result(d) for d in state_dict['knowledge_base']]
         state.pending_links = [Link(**link_dict) for link_dict in state_dict['pending_links']]
-        state.query = state_dict['query']
-        state.metrics = state_dict['metrics']
         state.term_frequencies = defaultdict(int, state_dict['term_frequencies'])
         state.document_frequencies = defaultdict(int, state_dict['document_frequencies'])
         state.documents_with_terms = defaultdict(set, {k: set(v) for k, v in state_dict['documents_with_terms'].items()})
-        state.total_documents = state_dict['total_documents']
         state.new_terms_history = state_dict['new_terms_history']
         state.crawl_order = state_dict['crawl_order']
         
         # Load embedding-specific fields (convert lists back to numpy arrays)
         
         state.kb_embeddings = np.array(state_dict['kb_embeddings']) if state_dict.get('kb_embeddings') is not None else None
-        state.query_embeddings = np.array(state_dict['query_embeddings']) if state_dict.get('query_embeddings') is not None else None
-        state.expanded_queries = state_dict.get('expanded_queries', [])
-        state.semantic_gaps = state_dict.get('semantic_gaps', [])
-        state.embedding_model = state_dict.get('embedding_model', '')
+        state._load_scalar_state(state_dict)
         
         return state
     
+    @classmethod
+    def _load_sqlite(cls, path: Path) -> 'CrawlState':
+        state = cls()
+        with SQLiteFrontier(path) as frontier:
+            scalar_state = frontier.get_state('adaptive_state')
+            if scalar_state is None:
+                raise FileNotFoundError(f"No saved crawl state in {path}")
+            state.crawled_urls = set(frontier.visited)
+            state.pending_links = [Link(**item[4]) for item in frontier.iter_queue()]
+            state.knowledge_base = [cls._dict_to_crawl_result(d) for d in frontier.iter_log('knowledge_base')]
+            kb_embeddings = list(frontier.iter_log('kb_embeddings'))
+            state.kb_embeddings = np.array(kb_embeddings) if kb_embeddings else None
+            state.crawl_order = list(frontier.iter_log('crawl_order'))
+            state.new_terms_history = list(frontier.iter_log('new_terms_history'))
+            
+            for tf_delta in frontier.iter_log('term_frequency_deltas'):
+                for term, count in tf_delta.items():
+                    state.term_frequencies[term] += count
+            saved_docs = 0
+            for doc_id, terms in enumerate(frontier.iter_log('doc_terms')):
+                for term in terms:
+                    state.document_frequencies[term] += 1
+                    state.documents_with_terms[term].add(doc_id)
+                saved_docs = doc_id + 1
+        
+        state._load_scalar_state(scalar_state)
+        state._last_sqlite_save = (str(path), saved_docs, dict(state.term_frequencies))
+        return state
+    
+    def _load_scalar_state(self, state_dict: Dict[str, Any]) -> None:
+        self.query = state_dict['query']
+        self.metrics = state_dict['metrics']
+        self.total_documents = state_dict['total_documents']
+        self.query_embeddings = np.array(state_dict['query_embeddings']) if state_dict.get('query_embeddings') is not None else None
+        self.expanded_queries = state_dict.get('expanded_queries', [])
+        self.semantic_gaps = state_dict.get('semantic_gaps', [])
+        self.embedding_model = state_dict.get('embedding_model', '')
+    
     @staticmethod
     def _crawl_result_to_dict(cr: CrawlResult) -> Dict:
         """Convert CrawlResult to serializable dict"""
@@ -222,6 +347,10 @@ class AdaptiveConfig:
     # Example: Validated system with learning_score=0.5 → confidence = 0.7 + (0.5-0.4)*0.833 = 0.78
     # These control how internal scores map to user-friendly confidence percentages
     
+    # Embedding persistence
+    persist_embeddings: bool = False  # Opt-in: cache embeddings on disk, keyed by (model, text hash)
+    embedding_cache_dir: Optional[str] = None  # Defaults to ~/.crawl4ai/embeddings
+    
     def validate(self):
         """Validate configuration parameters"""
         assert 0 <= self.confidence_threshold <= 1, "confidence_threshold must be between 0 and 1"
@@ -369,32 +498,50 @@ class StatisticalStrategy(CrawlStrategy):
         return min(1.0, math.sqrt(coverage))
     
     def _calculate_consistency(self, state: CrawlState) -> float:
-        """Information overlap between pages - high overlap suggests coherent topic coverage"""
+        """Information overlap between pages - high overlap suggests coherent topic coverage
+        
+        Average pairwise Jaccard similarity of document term sets. The pairwise
+        totals are kept on the state and extended as documents arrive, so only
+        documents not yet seen are tokenized and compared here.
+        """
         if len(state.knowledge_base) < 2:
             return 1.0  # Single or no documents are perfectly consistent
-            
-        # Calculate pairwise term overlap
-        overlaps = []
         
-        for i in range(len(state.knowledge_base)):
-            for j in range(i + 1, len(state.knowledge_base)):
-                # Get terms from both documents
-                terms_i = set(self._get_document_terms(state.knowledge_base[i]))
-                terms_j = set(self._get_document_terms(state.knowledge_base[j]))
-                
-                if terms_i and terms_j:
-                    # Jaccard similarity
-                    overlap = len(terms_i & terms_j) / len(terms_i | terms_j)
-                    overlaps.append(overlap)
+        self._sync_term_sets(state)
         
-        if overlaps:
+        if state.overlap_pairs:
             # Average overlap as consistency measure
-            consistency = sum(overlaps) / len(overlaps)
+            consistency = state.overlap_sum / state.overlap_pairs
         else:
             consistency = 0.0
             
         return consistency
     
+    def _sync_term_sets(self, state: CrawlState) -> None:
+        """Bring state.doc_term_sets in line with state.knowledge_base"""
+        if len(state.doc_term_sets) > len(state.knowledge_base):
+            # Knowledge base was replaced or trimmed - start over
+            state.doc_term_sets = []
+            state.overlap_sum = 0.0
+            state.overlap_pairs = 0
+        for result in state.knowledge_base[len(state.doc_term_sets):]:
+            self._add_term_set(state, set(self._get_document_terms(result)))
+    
+    def _add_term_set(self, state: CrawlState, terms: Set[str]) -> None:
+        """Append a document's term set and add its Jaccard overlap with every earlier document"""
+        if terms:
+            size = len(terms)
+            overlap_sum = 0.0
+            pairs = 0
+            for other in state.doc_term_sets:
+                if other:
+                    shared = len(terms & other)
+                    overlap_sum += shared / (size + len(other) - shared)
+                    pairs += 1
+            state.overlap_sum += overlap_sum
+            state.overlap_pairs += pairs
+        state.doc_term_sets.append(terms)
+    
     def _calculate_saturation(self, state: CrawlState) -> float:
         """Diminishing returns indicator - are we still discovering new information?"""
         if not state.new_terms_history:
@@ -586,6 +733,12 @@ class StatisticalStrategy(CrawlStrategy):
                     state.document_frequencies[term] += 1
                     state.documents_with_terms[term].add(doc_id)
             
+            # Reuse this term set for consistency when the result is the next
+            # knowledge_base entry; otherwise _sync_term_sets catches up later
+            position = len(state.doc_term_sets)
+            if position < len(state.knowledge_base) and state.knowledge_base[position] is result:
+                self._add_term_set(state, term_set)
+            
             # Track new terms discovered
             new_term_count = len(state.term_frequencies)
             new_terms = new_term_count - old_term_count
@@ -625,10 +778,16 @@ class EmbeddingStrategy(CrawlStrategy):
         self._validation_passed = False  # Track if validation passed
         
         # Performance optimization caches
-        self._distance_matrix_cache = None  # Cache for query-KB distances
-        self._kb_embeddings_hash = None  # Track KB changes
         self._validation_embeddings_cache = None  # Cache validation query embeddings
         self._kb_similarity_threshold = 0.95  # Threshold for deduplication
+        
+        # Incremental structures: KB nearest-neighbour index and per-query best
+        # similarity, both extended with new KB rows only
+        self._embedding_store = None  # Opened lazily, see _get_embedding_store
+        self._kb_index = IncrementalNNIndex()
+        self._kb_index_anchor = None
+        self._query_coverage = QueryCoverage()
+        self._validation_coverage = QueryCoverage()
     
     def _get_embedding_llm_config_dict(self) -> Dict:
         """Get embedding LLM config as dict with fallback to default."""
@@ -643,60 +802,50 @@ class EmbeddingStrategy(CrawlStrategy):
             'api_token': os.getenv('OPENAI_API_KEY')
         }
         
+    def _get_embedding_store(self) -> Optional[EmbeddingStore]:
+        """Persistent embedding cache, if enabled with ``persist_embeddings``."""
+        config = getattr(self, 'config', None)
+        if config is None or not getattr(config, 'persist_embeddings', False):
+            return None
+        if self._embedding_store is None:
+            from .utils import get_home_folder
+            path = getattr(config, 'embedding_cache_dir', None) or os.path.join(get_home_folder(), "embeddings")
+            self._embedding_store = EmbeddingStore(path)
+        return self._embedding_store
+    
     async def _get_embeddings(self, texts: List[str]) -> Any:
-        """Get embeddings using configured method"""
+        """Get embeddings using configured method, served from the on-disk store when cached"""
         from .utils import get_text_embeddings
         embedding_llm_config = self._get_embedding_llm_config_dict()
-        return await get_text_embeddings(
-            texts, 
-            embedding_llm_config,
-            self.embedding_model
-        )
-    
-    def _compute_distance_matrix(self, query_embeddings: Any, kb_embeddings: Any) -> Any:
-        """Compute distance matrix using vectorized operations"""
-        
-        
-        if kb_embeddings is None or len(kb_embeddings) == 0:
-            return None
-            
-        # Ensure proper shapes
-        if len(query_embeddings.shape) == 1:
-            query_embeddings = query_embeddings.reshape(1, -1)
-        if len(kb_embeddings.shape) == 1:
-            kb_embeddings = kb_embeddings.reshape(1, -1)
-            
-        # Vectorized cosine distance: 1 - cosine_similarity
-        # Normalize vectors
-        query_norm = query_embeddings / np.linalg.norm(query_embeddings, axis=1, keepdims=True)
-        kb_norm = kb_embeddings / np.linalg.norm(kb_embeddings, axis=1, keepdims=True)
-        
-        # Compute cosine similarity matrix
-        similarity_matrix = np.dot(query_norm, kb_norm.T)
         
-        # Convert to distance
-        distance_matrix = 1 - similarity_matrix
+        async def embed(batch: List[str]) -> Any:
+            return await get_text_embeddings(batch, embedding_llm_config, self.embedding_model)
         
-        return distance_matrix
+        store = self._get_embedding_store()
+        if store is None:
+            return await embed(texts)
+        # The provider decides the vector space when an embedding LLM config is used
+        model_key = (embedding_llm_config or {}).get('provider') or self.embedding_model
+        return await store.embed(model_key, texts, embed)
     
-    def _get_cached_distance_matrix(self, query_embeddings: Any, kb_embeddings: Any) -> Any:
-        """Get distance matrix with caching"""
-        
-        
+    def _sync_kb_index(self, kb_embeddings: Any) -> bool:
+        """Extend the KB index with rows added since the last call. Returns False if kb is empty."""
         if kb_embeddings is None or len(kb_embeddings) == 0:
-            return None
-            
-        # Check if KB has changed
-        kb_hash = hash(kb_embeddings.tobytes()) if kb_embeddings is not None else None
-        
-        if (self._distance_matrix_cache is None or 
-            kb_hash != self._kb_embeddings_hash):
-            # Recompute matrix
-            self._distance_matrix_cache = self._compute_distance_matrix(query_embeddings, kb_embeddings)
-            self._kb_embeddings_hash = kb_hash
-            
-        return self._distance_matrix_cache
-        
+            self._kb_index.reset()
+            self._kb_index_anchor = None
+            return False
+        kb = np.asarray(kb_embeddings)
+        n = len(self._kb_index)
+        anchor = (hash(kb[0].tobytes()), hash(kb[n - 1].tobytes())) if 0 < n <= len(kb) else None
+        if n > len(kb) or anchor != self._kb_index_anchor:
+            # KB was replaced rather than extended
+            self._kb_index.reset()
+            n = 0
+        if len(kb) > n:
+            self._kb_index.add(kb[n:])
+            self._kb_index_anchor = (hash(kb[0].tobytes()), hash(kb[-1].tobytes()))
+        return True
+    
     async def map_query_semantic_space(self, query: str, n_synthetic: int = 10) -> Any:
         """Generate a point cloud representing the semantic neighborhood of the query"""
         from .utils import perform_completion_with_backoff
@@ -829,17 +978,8 @@ class EmbeddingStrategy(CrawlStrategy):
                 gaps.append((q_emb, 1.0))
             return gaps
         
-        # Use cached distance matrix
-        distance_matrix = self._get_cached_distance_matrix(query_embeddings, kb_embeddings)
-        
-        if distance_matrix is None:
-            # Fallback
-            for q_emb in query_embeddings:
-                gaps.append((q_emb, 1.0))
-            return gaps
-            
-        # Find minimum distance for each query (vectorized)
-        min_distances = np.min(distance_matrix, axis=1)
+        # Minimum distance for each query, updated with new KB rows only
+        min_distances = 1.0 - self._query_coverage.sync(query_embeddings, kb_embeddings)
         
         # Create gaps list
         for i, q_emb in enumerate(query_embeddings):
@@ -854,8 +994,6 @@ class EmbeddingStrategy(CrawlStrategy):
         kb_embeddings: Any
     ) -> List[Tuple[Link, float]]:
         """Select links that most efficiently fill the gaps"""
-        from .utils import cosine_distance, cosine_similarity, get_text_embeddings
-        
         import hashlib
         
         scored_links = []
@@ -887,10 +1025,9 @@ class EmbeddingStrategy(CrawlStrategy):
                 links_to_embed.append(link)
                 texts_to_embed.append(link_text)
         
-        # Batch embed only uncached links
+        # Batch embed only uncached links (the on-disk store skips texts embedded in earlier runs)
         if texts_to_embed:
-            embedding_llm_config = self._get_embedding_llm_config_dict()
-            new_embeddings = await get_text_embeddings(texts_to_embed, embedding_llm_config, self.embedding_model)
+            new_embeddings = await self._get_embeddings(texts_to_embed)
 
             # Cache the new embeddings
             for link, text, embedding in zip(links_to_embed, texts_to_embed, new_embeddings):
@@ -900,56 +1037,44 @@ class EmbeddingStrategy(CrawlStrategy):
         
         # Get coverage radius from config
         coverage_radius = self.config.embedding_coverage_radius if hasattr(self, 'config') else 0.2
+        overlap_threshold = self.config.embedding_overlap_threshold if hasattr(self, 'config') else 0.85
+        
+        scorable = [link for link in candidate_links if link.href in link_embeddings_map]
+        if not scorable:
+            return []
+        link_matrix = np.vstack([np.asarray(link_embeddings_map[link.href], dtype=np.float32) for link in scorable])
+        
+        # Gap improvements for all links at once: only gaps that actually need
+        # filling (outside coverage radius) count, and only where the link is closer
+        gap_reduction_scores = np.zeros(len(scorable))
+        open_gaps = [(point, distance) for point, distance in gaps if distance > coverage_radius]
+        if open_gaps:
+            gap_points = np.vstack([np.asarray(point, dtype=np.float32) for point, _ in open_gaps])
+            gap_distances = np.array([distance for _, distance in open_gaps], dtype=np.float32)
+            link_norm = link_matrix / (np.linalg.norm(link_matrix, axis=1, keepdims=True) + 1e-8)
+            gap_norm = gap_points / (np.linalg.norm(gap_points, axis=1, keepdims=True) + 1e-8)
+            new_distances = 1 - link_norm @ gap_norm.T
+            # Scale improvement - moving from 0.5 to 0.3 is valuable
+            improvements = np.clip(gap_distances[None, :] - new_distances, 0, None) * 2
+            # Average improvement per gap that needs help
+            gap_reduction_scores = improvements.sum(axis=1) / len(open_gaps)
+        
+        # Overlap with existing KB through the incremental index
+        if self._sync_kb_index(kb_embeddings):
+            max_similarities = self._kb_index.max_similarity(link_matrix)
+        else:
+            max_similarities = None
         
         # Score each link
-        for link in candidate_links:
-            if link.href not in link_embeddings_map:
-                continue  # Skip links without embeddings
-                
-            link_embedding = link_embeddings_map[link.href]
-            
+        for i, link in enumerate(scorable):
             if not gaps:
                 score = 0.0
             else:
-                # Calculate how many gaps this link helps with
-                gaps_helped = 0
-                total_improvement = 0
+                gap_reduction_score = float(gap_reduction_scores[i])
                 
-                for gap_point, gap_distance in gaps:
-                    # Only consider gaps that actually need filling (outside coverage radius)
-                    if gap_distance > coverage_radius:
-                        new_distance = cosine_distance(link_embedding, gap_point)
-                        if new_distance < gap_distance:
-                            # This link helps this gap
-                            improvement = gap_distance - new_distance
-                            # Scale improvement - moving from 0.5 to 0.3 is valuable
-                            scaled_improvement = improvement * 2  # Amplify the signal
-                            total_improvement += scaled_improvement
-                            gaps_helped += 1
-                
-                # Average improvement per gap that needs help
-                gaps_needing_help = sum(1 for _, d in gaps if d > coverage_radius)
-                if gaps_needing_help > 0:
-                    gap_reduction_score = total_improvement / gaps_needing_help
-                else:
-                    gap_reduction_score = 0
-                
-                # Check overlap with existing KB (vectorized)
-                if kb_embeddings is not None and len(kb_embeddings) > 0:
-                    # Normalize embeddings
-                    link_norm = link_embedding / np.linalg.norm(link_embedding)
-                    kb_norm = kb_embeddings / np.linalg.norm(kb_embeddings, axis=1, keepdims=True)
-                    
-                    # Compute all similarities at once
-                    similarities = np.dot(kb_norm, link_norm)
-                    max_similarity = np.max(similarities)
-                    
-                    # Only penalize if very similar (above threshold)
-                    overlap_threshold = self.config.embedding_overlap_threshold if hasattr(self, 'config') else 0.85
-                    if max_similarity > overlap_threshold:
-                        overlap_penalty = (max_similarity - overlap_threshold) * 2  # 0 to 0.3 range
-                    else:
-                        overlap_penalty = 0
+                # Only penalize if very similar (above threshold)
+                if max_similarities is not None and max_similarities[i] > overlap_threshold:
+                    overlap_penalty = float(max_similarities[i] - overlap_threshold) * 2  # 0 to 0.3 range
                 else:
                     overlap_penalty = 0
                 
@@ -972,14 +1097,8 @@ class EmbeddingStrategy(CrawlStrategy):
         if len(state.kb_embeddings) == 0 or len(state.query_embeddings) == 0:
             return 0.0
 
-        # Prepare L2-normalised arrays
-        Q = np.asarray(state.query_embeddings, dtype=np.float32)
-        D = np.asarray(state.kb_embeddings, dtype=np.float32)
-        Q /= np.linalg.norm(Q, axis=1, keepdims=True) + 1e-8
-        D /= np.linalg.norm(D, axis=1, keepdims=True) + 1e-8
-
-        # Best cosine per query
-        best = (Q @ D.T).max(axis=1)
+        # Best cosine per query, updated with new KB rows only
+        best = self._query_coverage.sync(state.query_embeddings, state.kb_embeddings)
 
         # Mean similarity or hit-rate above tau
         tau = getattr(self.config, 'coverage_tau', None)
@@ -1112,14 +1231,8 @@ class EmbeddingStrategy(CrawlStrategy):
         if state.kb_embeddings is None or len(state.kb_embeddings) == 0:
             return 0.0
             
-        # Compute distance matrix for validation queries
-        distance_matrix = self._compute_distance_matrix(val_embeddings, state.kb_embeddings)
-        
-        if distance_matrix is None:
-            return 0.0
-            
-        # Find minimum distance for each validation query (vectorized)
-        min_distances = np.min(distance_matrix, axis=1)
+        # Minimum distance for each validation query, updated with new KB rows only
+        min_distances = 1.0 - self._validation_coverage.sync(val_embeddings, state.kb_embeddings)
         scores = 1.0 - min_distances  # Convert distances to scores (0-1 range)
         
         # Compute scores using same exponential as training
@@ -1211,9 +1324,6 @@ class EmbeddingStrategy(CrawlStrategy):
     
     async def update_state(self, state: CrawlState, new_results: List[CrawlResult]) -> None:
         """Update embeddings and coverage metrics with deduplication"""
-        from .utils import get_text_embeddings
-        
-        
         # Extract text from results
         new_texts = []
         valid_results = []
@@ -1227,8 +1337,7 @@ class EmbeddingStrategy(CrawlStrategy):
             return
             
         # Get embeddings for new texts
-        embedding_llm_config = self._get_embedding_llm_config_dict()      
-        new_embeddings = await get_text_embeddings(new_texts, embedding_llm_config, self.embedding_model)
+        new_embeddings = await self._get_embeddings(new_texts)
 
         # Deduplicate embeddings before adding to KB
         if state.kb_embeddings is None:
@@ -1236,32 +1345,24 @@ class EmbeddingStrategy(CrawlStrategy):
             state.kb_embeddings = new_embeddings
             deduplicated_indices = list(range(len(new_embeddings)))
         else:
-            # Check for duplicates using vectorized similarity
-            deduplicated_embeddings = []
-            deduplicated_indices = []
-            
-            for i, new_emb in enumerate(new_embeddings):
-                # Compute similarities with existing KB
-                new_emb_normalized = new_emb / np.linalg.norm(new_emb)
-                kb_normalized = state.kb_embeddings / np.linalg.norm(state.kb_embeddings, axis=1, keepdims=True)
-                similarities = np.dot(kb_normalized, new_emb_normalized)
-                
-                # Only add if not too similar to existing content
-                if np.max(similarities) < self._kb_similarity_threshold:
-                    deduplicated_embeddings.append(new_emb)
-                    deduplicated_indices.append(i)
+            # Compare the whole batch against the KB index in one product;
+            # only add if not too similar to existing content
+            self._sync_kb_index(state.kb_embeddings)
+            max_similarities = self._kb_index.max_similarity(new_embeddings)
+            deduplicated_indices = [
+                i for i, similarity in enumerate(max_similarities)
+                if similarity < self._kb_similarity_threshold
+            ]
             
             # Add deduplicated embeddings
-            if deduplicated_embeddings:
-                state.kb_embeddings = np.vstack([state.kb_embeddings, np.array(deduplicated_embeddings)])
+            if deduplicated_indices:
+                state.kb_embeddings = np.vstack([state.kb_embeddings, np.asarray(new_embeddings)[deduplicated_indices]])
+        self._sync_kb_index(state.kb_embeddings)
         
         # Update crawl order only for non-duplicate results
         for idx in deduplicated_indices:
             state.crawl_order.append(valid_results[idx].url)
         
-        # Invalidate distance matrix cache since KB changed
-        self._kb_embeddings_hash = None
-        self._distance_matrix_cache = None
             
         # Update coverage shape if needed
         if hasattr(state, 'query_embeddings') and state.query_embeddings is not None:
@@ -1423,9 +1524,9 @@ class AdaptiveCrawler:
                 
                 depth += 1
                 
-                # Save state if configured
+                # Save state if configured, off the event loop
                 if self.config.save_state and self.config.state_path:
-                    self.state.save(self.config.state_path)
+                    await asyncio.to_thread(self.state.save, self.config.state_path)
             
             # Final confidence calculation
             learning_score = await self.strategy.calculate_confidence(self.state)
@@ -1442,7 +1543,7 @@ class AdaptiveCrawler:
             
             # Final save
             if self.config.save_state and self.config.state_path:
-                self.state.save(self.config.state_path)
+                await asyncio.to_thread(self.state.save, self.config.state_path)
             
             return self.state
             
@@ -1,7 +1,9 @@
 import os
+import re
+import fnmatch
 from typing import Union
+from urllib.parse import urlparse
 import warnings
-import requests
 from .config import (
     DEFAULT_PROVIDER,
     DEFAULT_PROVIDER_API_KEY,
@@ -413,6 +415,13 @@ class BrowserConfig:
                            Default: [].
         enable_stealth (bool): If True, applies playwright-stealth to bypass basic bot detection.
                               Cannot be used with use_undetected browser mode. Default: False.
+        page_pool_size (int): Number of idle pages kept open per browser context and reused by later
+                              crawls instead of opening a new page each time (non-managed browsers only).
+                              A reused page keeps the sessionStorage of origins other than the last one
+                              it visited, so enable this only for crawls that may share it. Default: 0
+                              (no reuse).
+        page_max_uses (int): Number of crawls after which a pooled page is closed and replaced by a
+                             fresh one. Default: 50.
     """
 
     def __init__(
@@ -454,6 +463,8 @@ class BrowserConfig:
         debugging_port: int = 9222,
         host: str = "localhost",
         enable_stealth: bool = False,
+        page_pool_size: int = 0,
+        page_max_uses: int = 50,
     ):
         
         self.browser_type = browser_type
@@ -509,6 +520,8 @@ class BrowserConfig:
         self.debugging_port = debugging_port
         self.host = host
         self.enable_stealth = enable_stealth
+        self.page_pool_size = page_pool_size
+        self.page_max_uses = page_max_uses
 
         fa_user_agenr_generator = ValidUAGenerator()
         if self.user_agent_mode == "random":
@@ -584,6 +597,8 @@ class BrowserConfig:
             debugging_port=kwargs.get("debugging_port", 9222),
             host=kwargs.get("host", "localhost"),
             enable_stealth=kwargs.get("enable_stealth", False),
+            page_pool_size=kwargs.get("page_pool_size", 0),
+            page_max_uses=kwargs.get("page_max_uses", 50),
         )
 
     def to_dict(self):
@@ -619,6 +634,8 @@ class BrowserConfig:
             "debugging_port": self.debugging_port,
             "host": self.host,
             "enable_stealth": self.enable_stealth,
+            "page_pool_size": self.page_pool_size,
+            "page_max_uses": self.page_max_uses,
         }
 
                 
@@ -703,6 +720,8 @@ class BrowserConfig:
 
         url = "https://api.nstproxy.com/api/v1/generate/apiproxies"
 
+        import requests
+
         try:
             response = requests.get(url, params=params, timeout=10)
             response.raise_for_status()
@@ -774,6 +793,179 @@ class VirtualScrollConfig:
         """Create instance from dictionary."""
         return cls(**data)
 
+# Common analytics, advertising and session-recording hosts, matched with their subdomains
+TRACKER_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googleadservices.com",
+    "googlesyndication.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "facebook.net",
+    "analytics.tiktok.com",
+    "bat.bing.com",
+    "clarity.ms",
+    "hotjar.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "criteo.com",
+    "criteo.net",
+    "taboola.com",
+    "outbrain.com",
+    "adnxs.com",
+    "amazon-adsystem.com",
+    "mixpanel.com",
+    "cdn.segment.com",
+    "nr-data.net",
+    "mc.yandex.ru",
+    "snap.licdn.com",
+    "static.ads-twitter.com",
+    "ct.pinterest.com",
+    "appier.net",
+    "onead.com.tw",
+)
+
+# Named blocking presets for ResourceBlockingConfig.from_profile()
+RESOURCE_BLOCKING_PROFILES: Dict[str, Dict[str, Any]] = {
+    # Heavy binary content the scraper never reads
+    "media": {"resource_types": ["image", "media", "font"]},
+    # Analytics and ad hosts only
+    "trackers": {"domains": list(TRACKER_DOMAINS)},
+    # Media plus trackers: page layout and first-party scripts still run
+    "lean": {
+        "resource_types": ["image", "media", "font"],
+        "domains": list(TRACKER_DOMAINS),
+    },
+    # Only what is needed to render the DOM's text
+    "text": {
+        "resource_types": ["image", "media", "font", "stylesheet", "texttrack", "manifest", "eventsource", "websocket"],
+        "domains": list(TRACKER_DOMAINS),
+        "block_third_party_scripts": True,
+    },
+}
+
+
+class ResourceBlockingConfig:
+    """Declarative request blocking for browser crawls.
+
+    Requests of the page are intercepted and aborted when they match a
+    Playwright resource type, a blocked domain (subdomains included), a
+    glob URL pattern, or, with ``block_third_party_scripts``, a script
+    served from another site than the page. The main document is never
+    blocked, and ``allow_domains`` always wins.
+
+    Named presets ("media", "trackers", "lean", "text") are available via
+    ``ResourceBlockingConfig.from_profile(name)``; ``CrawlerRunConfig``
+    also accepts the profile name directly.
+    """
+
+    def __init__(
+        self,
+        resource_types: Optional[List[str]] = None,
+        domains: Optional[List[str]] = None,
+        url_patterns: Optional[List[str]] = None,
+        block_third_party_scripts: bool = False,
+        allow_domains: Optional[List[str]] = None,
+    ):
+        """
+        Initialize request blocking configuration.
+
+        Args:
+            resource_types: Playwright resource types to block, e.g. "image", "font", "media", "stylesheet"
+            domains: Hosts to block, each matching itself and its subdomains
+            url_patterns: Glob patterns matched against the full request URL, e.g. "*/ads/*", "*.gif"
+            block_third_party_scripts: Block scripts not served from the page's site or its subdomains
+            allow_domains: Hosts that are never blocked (e.g. a CDN the page needs)
+        """
+        self.resource_types = list(resource_types or [])
+        self.domains = list(domains or [])
+        self.url_patterns = list(url_patterns or [])
+        self.block_third_party_scripts = block_third_party_scripts
+        self.allow_domains = list(allow_domains or [])
+        self._resource_types = frozenset(self.resource_types)
+        self._domains = frozenset(d.lower().lstrip(".") for d in self.domains)
+        self._allow_domains = frozenset(d.lower().lstrip(".") for d in self.allow_domains)
+        self._url_pattern = (
+            re.compile("|".join(fnmatch.translate(p) for p in self.url_patterns))
+            if self.url_patterns
+            else None
+        )
+
+    @staticmethod
+    def _host_matches(host: str, domains: frozenset) -> bool:
+        # Walk the host's suffixes: a.b.example.com, b.example.com, example.com, com
+        while host:
+            if host in domains:
+                return True
+            _, _, host = host.partition(".")
+        return False
+
+    @staticmethod
+    def site_of(url: str) -> str:
+        """Host of ``url`` without a leading ``www.``, used to tell first- from third-party requests."""
+        host = (urlparse(url).hostname or "").lower()
+        return host[4:] if host.startswith("www.") else host
+
+    def match(self, url: str, resource_type: str, site: str = "") -> Optional[str]:
+        """
+        Return the rule that blocks the request ("resource_type", "domain",
+        "url_pattern" or "third_party_script"), or None to let it through.
+
+        Args:
+            url: Request URL
+            resource_type: Playwright resource type of the request
+            site: Site of the page being crawled, as returned by ``site_of``
+        """
+        host = (urlparse(url).hostname or "").lower()
+        if self._allow_domains and self._host_matches(host, self._allow_domains):
+            return None
+        if resource_type in self._resource_types:
+            return "resource_type"
+        if self._domains and self._host_matches(host, self._domains):
+            return "domain"
+        if self._url_pattern is not None and self._url_pattern.match(url):
+            return "url_pattern"
+        if (
+            self.block_third_party_scripts
+            and resource_type == "script"
+            and site
+            and host != site
+            and not host.endswith("." + site)
+        ):
+            return "third_party_script"
+        return None
+
+    @classmethod
+    def from_profile(cls, name: str) -> "ResourceBlockingConfig":
+        """Create a config from one of RESOURCE_BLOCKING_PROFILES."""
+        if name not in RESOURCE_BLOCKING_PROFILES:
+            raise ValueError(
+                f"Unknown resource blocking profile {name!r}; "
+                f"choose one of {sorted(RESOURCE_BLOCKING_PROFILES)}"
+            )
+        return cls(**RESOURCE_BLOCKING_PROFILES[name])
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for serialization."""
+        return {
+            "resource_types": self.resource_types,
+            "domains": self.domains,
+            "url_patterns": self.url_patterns,
+            "block_third_party_scripts": self.block_third_party_scripts,
+            "allow_domains": self.allow_domains,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ResourceBlockingConfig":
+        """Create instance from dictionary."""
+        return cls(**data)
+
+    def clone(self, **kwargs) -> "ResourceBlockingConfig":
+        config_dict = self.to_dict()
+        config_dict.update(kwargs)
+        return ResourceBlockingConfig.from_dict(config_dict)
+
+
 class LinkPreviewConfig:
     """Configuration for link head extraction and scoring."""
     
@@ -878,6 +1070,8 @@ class HTTPCrawlerConfig:
     json: Optional[Dict[str, Any]] = None
     follow_redirects: bool = True
     verify_ssl: bool = True
+    # Responses larger than this many bytes are rejected; None disables the cap
+    max_body_size: Optional[int] = 32 * 1024 * 1024
 
     def __init__(
         self,
@@ -887,6 +1081,7 @@ class HTTPCrawlerConfig:
         json: Optional[Dict[str, Any]] = None,
         follow_redirects: bool = True,
         verify_ssl: bool = True,
+        max_body_size: Optional[int] = 32 * 1024 * 1024,
     ):
         self.method = method
         self.headers = headers
@@ -894,6 +1089,7 @@ class HTTPCrawlerConfig:
         self.json = json
         self.follow_redirects = follow_redirects
         self.verify_ssl = verify_ssl
+        self.max_body_size = max_body_size
 
     @staticmethod
     def from_kwargs(kwargs: dict) -> "HTTPCrawlerConfig":
@@ -904,6 +1100,7 @@ class HTTPCrawlerConfig:
             json=kwargs.get("json"),
             follow_redirects=kwargs.get("follow_redirects", True),
             verify_ssl=kwargs.get("verify_ssl", True),
+            max_body_size=kwargs.get("max_body_size", 32 * 1024 * 1024),
         )
 
     def to_dict(self):
@@ -914,6 +1111,7 @@ class HTTPCrawlerConfig:
             "json": self.json,
             "follow_redirects": self.follow_redirects,
             "verify_ssl": self.verify_ssl,
+            "max_body_size": self.max_body_size,
         }
 
     def clone(self, **kwargs):
@@ -1034,8 +1232,19 @@ class CrawlerRunConfig():
                                        Default: None.
         wait_for_images (bool): If True, wait for images to load before extracting content.
                                 Default: False.
-        delay_before_return_html (float): Delay in seconds before retrieving final HTML.
+        delay_before_return_html (float): Delay in seconds before retrieving final HTML. With
+                                          readiness_mode="adaptive" this is the upper bound of the wait.
                                           Default: 0.1.
+        readiness_mode (str): "fixed" sleeps for delay_before_return_html (and screenshot_wait_for).
+                              "adaptive" returns as soon as the network is idle, the DOM has stopped
+                              changing and readiness_selector (if any) is present, using those delays
+                              only as upper bounds. Timings end up in CrawlResult.page_timings.
+                              Default: "fixed".
+        readiness_quiet_period (float): Seconds without requests in flight and without DOM changes
+                                        before an adaptive wait considers the page ready.
+                                        Default: 0.5.
+        readiness_selector (str or None): CSS selector that must be present before an adaptive wait ends.
+                                          Default: None.
         mean_delay (float): Mean base delay between requests when calling arun_many.
                             Default: 0.1.
         max_range (float): Max random additional delay range for requests in arun_many.
@@ -1095,6 +1304,14 @@ class CrawlerRunConfig():
                                                                      scrolling (e.g., Twitter, Instagram feeds).
                                                                      Default: None.
 
+        # Network Blocking Parameters
+        resource_blocking (ResourceBlockingConfig or str or dict or None): Requests to abort during browser crawls,
+                                                                     by resource type, domain, URL pattern or
+                                                                     third-party scripts. A string selects a preset
+                                                                     ("media", "trackers", "lean", "text"). Counters
+                                                                     end up in CrawlResult.resource_blocking_stats.
+                                                                     Default: None.
+
         # Link and Domain Handling Parameters
         exclude_social_media_domains (list of str): List of domains to exclude for social media links.
                                                     Default: SOCIAL_MEDIA_DOMAINS (from config).
@@ -1153,6 +1370,26 @@ class CrawlerRunConfig():
         'no_cache_write' : 'Instead, use cache_mode=CacheMode.READ_ONLY',
     }
 
+    # Fields that do not affect browser context setup, left out of
+    # BrowserManager's context signature
+    CONTEXT_IRRELEVANT_FIELDS = frozenset({
+        "session_id",
+        "js_code",
+        "scraping_strategy",
+        "extraction_strategy",
+        "chunking_strategy",
+        "cache_mode",
+        "content_filter",
+        "semaphore_count",
+        "url",
+        # Applied per page through request interception
+        "resource_blocking",
+        # Only change how long a page is waited on
+        "readiness_mode",
+        "readiness_quiet_period",
+        "readiness_selector",
+    })
+
     def __init__(
         self,
         # Content Processing Parameters
@@ -1194,6 +1431,9 @@ class CrawlerRunConfig():
         wait_for_timeout: int = None,
         wait_for_images: bool = False,
         delay_before_return_html: float = 0.1,
+        readiness_mode: str = "fixed",
+        readiness_quiet_period: float = 0.5,
+        readiness_selector: str = None,
         mean_delay: float = 0.1,
         max_range: float = 0.3,
         semaphore_count: int = 5,
@@ -1251,6 +1491,8 @@ class CrawlerRunConfig():
         link_preview_config: Union[LinkPreviewConfig, Dict[str, Any]] = None,
         # Virtual Scroll Parameters
         virtual_scroll_config: Union[VirtualScrollConfig, Dict[str, Any]] = None,
+        # Network Blocking Parameters
+        resource_blocking: Union[ResourceBlockingConfig, str, Dict[str, Any]] = None,
         # URL Matching Parameters
         url_matcher: Optional[UrlMatcher] = None,
         match_mode: MatchMode = MatchMode.OR,
@@ -1308,6 +1550,11 @@ class CrawlerRunConfig():
         self.wait_for_timeout = wait_for_timeout
         self.wait_for_images = wait_for_images
         self.delay_before_return_html = delay_before_return_html
+        if readiness_mode not in ("fixed", "adaptive"):
+            raise ValueError("readiness_mode must be 'fixed' or 'adaptive'")
+        self.readiness_mode = readiness_mode
+        self.readiness_quiet_period = readiness_quiet_period
+        self.readiness_selector = readiness_selector
         self.mean_delay = mean_delay
         self.max_range = max_range
         self.semaphore_count = semaphore_count
@@ -1418,6 +1665,16 @@ class CrawlerRunConfig():
             self.virtual_scroll_config = VirtualScrollConfig.from_dict(virtual_scroll_config)
         else:
             raise ValueError("virtual_scroll_config must be VirtualScrollConfig object or dict")
+
+        # Network Blocking Parameters
+        if resource_blocking is None or isinstance(resource_blocking, ResourceBlockingConfig):
+            self.resource_blocking = resource_blocking
+        elif isinstance(resource_blocking, str):
+            self.resource_blocking = ResourceBlockingConfig.from_profile(resource_blocking)
+        elif isinstance(resource_blocking, dict):
+            self.resource_blocking = ResourceBlockingConfig.from_dict(resource_blocking)
+        else:
+            raise ValueError("resource_blocking must be ResourceBlockingConfig object, profile name or dict")
         
         # URL Matching Parameters
         self.url_matcher = url_matcher
@@ -1534,14 +1791,17 @@ class CrawlerRunConfig():
     def __setattr__(self, name, value):
         """Handle attribute setting."""
         # TODO: Planning to set properties dynamically based on the __init__ signature
-        sig = inspect.signature(self.__init__)
-        all_params = sig.parameters  # Dictionary of parameter names and their details
+        if name in self._UNWANTED_PROPS:
+            all_params = inspect.signature(self.__init__).parameters
+            if value is not all_params[name].default:
+                raise AttributeError(f"Setting '{name}' is deprecated. {self._UNWANTED_PROPS[name]}")
 
-        if name in self._UNWANTED_PROPS and value is not all_params[name].default:
-            raise AttributeError(f"Setting '{name}' is deprecated. {self._UNWANTED_PROPS[name]}")
-        
         super().__setattr__(name, value)
 
+        # Any field that shapes the browser context invalidates the memoized signature
+        if name not in self.CONTEXT_IRRELEVANT_FIELDS and name != "_context_signature":
+            self.__dict__.pop("_context_signature", None)
+
     @staticmethod
     def from_kwargs(kwargs: dict) -> "CrawlerRunConfig":
         return CrawlerRunConfig(
@@ -1584,6 +1844,9 @@ class CrawlerRunConfig():
             wait_for_timeout=kwargs.get("wait_for_timeout"),
             wait_for_images=kwargs.get("wait_for_images", False),
             delay_before_return_html=kwargs.get("delay_before_return_html", 0.1),
+            readiness_mode=kwargs.get("readiness_mode", "fixed"),
+            readiness_quiet_period=kwargs.get("readiness_quiet_period", 0.5),
+            readiness_selector=kwargs.get("readiness_selector"),
             mean_delay=kwargs.get("mean_delay", 0.1),
             max_range=kwargs.get("max_range", 0.3),
             semaphore_count=kwargs.get("semaphore_count", 5),
@@ -1646,6 +1909,8 @@ class CrawlerRunConfig():
             deep_crawl_strategy=kwargs.get("deep_crawl_strategy"),
             # Link Extraction Parameters
             link_preview_config=kwargs.get("link_preview_config"),
+            # Network Blocking Parameters
+            resource_blocking=kwargs.get("resource_blocking"),
             url=kwargs.get("url"),
             # URL Matching Parameters
             url_matcher=kwargs.get("url_matcher"),
@@ -1703,6 +1968,9 @@ class CrawlerRunConfig():
             "wait_for_timeout": self.wait_for_timeout,
             "wait_for_images": self.wait_for_images,
             "delay_before_return_html": self.delay_before_return_html,
+            "readiness_mode": self.readiness_mode,
+            "readiness_quiet_period": self.readiness_quiet_period,
+            "readiness_selector": self.readiness_selector,
             "mean_delay": self.mean_delay,
             "max_range": self.max_range,
             "semaphore_count": self.semaphore_count,
@@ -1748,6 +2016,7 @@ class CrawlerRunConfig():
             "user_agent_generator_config": self.user_agent_generator_config,
             "deep_crawl_strategy": self.deep_crawl_strategy,
             "link_preview_config": self.link_preview_config.to_dict() if self.link_preview_config else None,
+            "resource_blocking": self.resource_blocking.to_dict() if self.resource_blocking else None,
             "url": self.url,
             "url_matcher": self.url_matcher,
             "match_mode": self.match_mode,
@@ -1885,6 +2154,8 @@ class SeedingConfig:
         score_threshold: Optional[float] = None,
         scoring_method: str = "bm25",
         filter_nonsense_urls: bool = True,
+        stream_sitemaps: bool = True,
+        cache_backend: str = "files",
     ):
         """
         Initialize URL seeding configuration.
@@ -1902,8 +2173,8 @@ class SeedingConfig:
                      Default: -1
             concurrency: Maximum concurrent requests for live checks/head extraction. 
                         Default: 1000
-            hits_per_sec: Rate limit in requests per second to avoid overwhelming servers. 
-                         Default: 5
+            hits_per_sec: Rate limit in requests per second, per host, to avoid overwhelming
+                         servers (token bucket). Default: 5
             force: If True, bypasses the AsyncUrlSeeder's internal .jsonl cache and 
                   re-fetches URLs. Default: False
             base_directory: Base directory for UrlSeeder's cache files (.jsonl). 
@@ -1920,6 +2191,14 @@ class SeedingConfig:
                           Future: "semantic". Default: "bm25"
             filter_nonsense_urls: Filter out utility URLs like robots.txt, sitemap.xml, 
                                  ads.txt, favicon.ico, etc. Default: True
+            stream_sitemaps: Parse sitemaps incrementally while they download (gzip is
+                            decompressed on the fly) instead of buffering each file and
+                            building a full DOM. Keeps memory flat on large sitemaps and
+                            lets URLs flow to workers immediately. Default: True
+            cache_backend: Where the seeder caches head/live-check results and discovered
+                          URL lists. "files" writes one JSON file per URL; "sqlite" keeps
+                          everything in a single WAL-mode SQLite file with batched writes,
+                          bulk lookups and TTL eviction. Default: "files"
         """
         self.source = source
         self.pattern = pattern
@@ -1936,6 +2215,8 @@ class SeedingConfig:
         self.score_threshold = score_threshold
         self.scoring_method = scoring_method
         self.filter_nonsense_urls = filter_nonsense_urls
+        self.stream_sitemaps = stream_sitemaps
+        self.cache_backend = cache_backend
 
     # Add to_dict, from_kwargs, and clone methods for consistency
     def to_dict(self) -> Dict[str, Any]:
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import codecs
+import mmap
+import re
+import stat
 import time
 from abc import ABC, abstractmethod
 from typing import Callable, Dict, Any, List, Union
@@ -23,15 +27,88 @@ from .user_agent_generator import ValidUAGenerator
 from .browser_manager import BrowserManager
 from .browser_adapter import BrowserAdapter, PlaywrightAdapter, UndetectedAdapter
 
-import aiofiles
-import aiohttp
 import chardet
-from aiohttp.client import ClientTimeout
 from urllib.parse import urlparse
 from types import MappingProxyType
 import contextlib
 from functools import partial
 
+# Rough median transfer sizes per resource type, used to estimate the bytes
+# saved by blocked requests until the crawler has seen real responses
+TYPICAL_RESOURCE_BYTES: Final = MappingProxyType({
+    "image": 15_000,
+    "media": 250_000,
+    "font": 25_000,
+    "script": 20_000,
+    "stylesheet": 10_000,
+    "xhr": 2_000,
+    "fetch": 2_000,
+})
+
+# Installs a MutationObserver that remembers when the DOM content last changed.
+# Attribute changes are ignored so carousels and CSS animations do not keep
+# the page from ever looking settled.
+READINESS_OBSERVER_JS: Final = """() => {
+    if (!window.__c4aReadiness) {
+        const state = { lastMutation: performance.now() };
+        new MutationObserver(() => { state.lastMutation = performance.now(); })
+            .observe(document, { childList: true, subtree: true, characterData: true });
+        window.__c4aReadiness = state;
+    }
+    return true;
+}"""
+
+READINESS_PROBE_JS: Final = """(selector) => ({
+    observing: !!window.__c4aReadiness,
+    domQuietMs: window.__c4aReadiness
+        ? performance.now() - window.__c4aReadiness.lastMutation
+        : 0,
+    selectorFound: !selector || document.querySelector(selector) !== null,
+})"""
+
+
+class NetworkActivityTracker:
+    """
+    Counts the requests a page has in flight and when the last one started or finished.
+
+    Long-lived streams (EventSource, WebSocket) are ignored since they never
+    finish while the page is open.
+    """
+
+    LONG_LIVED_TYPES = frozenset({"eventsource", "websocket"})
+
+    def __init__(self):
+        self.in_flight = set()
+        self.last_activity = time.monotonic()
+
+    def _on_request(self, request):
+        if request.resource_type in self.LONG_LIVED_TYPES:
+            return
+        self.in_flight.add(request)
+        self.last_activity = time.monotonic()
+
+    def _on_request_done(self, request):
+        if request in self.in_flight:
+            self.in_flight.discard(request)
+            self.last_activity = time.monotonic()
+
+    def attach(self, page: Page) -> None:
+        page.on("request", self._on_request)
+        page.on("requestfinished", self._on_request_done)
+        page.on("requestfailed", self._on_request_done)
+
+    def detach(self, page: Page) -> None:
+        page.remove_listener("request", self._on_request)
+        page.remove_listener("requestfinished", self._on_request_done)
+        page.remove_listener("requestfailed", self._on_request_done)
+
+    def quiet_for(self) -> float:
+        """Seconds the network has been idle, 0 while requests are in flight."""
+        if self.in_flight:
+            return 0.0
+        return time.monotonic() - self.last_activity
+
+
 class AsyncCrawlerStrategy(ABC):
     """
     Abstract base class for crawler strategies.
@@ -95,6 +172,9 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # Initialize session management
         self._downloaded_files = []
 
+        # Running (total bytes, responses) per resource type, to estimate blocked bytes
+        self._resource_sizes: Dict[str, List[int]] = {}
+
         # Initialize hooks system
         self.hooks = {
             "on_browser_created": None,
@@ -292,6 +372,58 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                                 "or explicitly prefixed with 'js:' or 'css:'."
                             )
 
+    async def wait_until_ready(
+        self,
+        page: Page,
+        max_wait: float,
+        quiet_period: float = 0.5,
+        selector: Optional[str] = None,
+        network: Optional[NetworkActivityTracker] = None,
+    ) -> Dict[str, Any]:
+        """
+        Wait until the page has settled, for at most ``max_wait`` seconds.
+
+        The page counts as ready once no requests have been in flight and the
+        DOM content has not changed for ``quiet_period`` seconds, and
+        ``selector`` (if given) is present. Without a ``network`` tracker only
+        the DOM and the selector are checked.
+
+        Args:
+            page: Playwright page object
+            max_wait (float): Upper bound of the wait in seconds
+            quiet_period (float): Seconds of network and DOM silence required
+            selector (Optional[str]): CSS selector that must be present
+            network (Optional[NetworkActivityTracker]): Tracker attached to the page before navigation
+
+        Returns:
+            Dict[str, Any]: ``waited`` seconds and the ``reason`` the wait ended,
+            either "ready" or "max_wait".
+        """
+        start = time.monotonic()
+        deadline = start + max_wait
+
+        while True:
+            try:
+                probe = await self.adapter.evaluate(page, READINESS_PROBE_JS, selector or "")
+                if not probe["observing"]:
+                    # First probe, or a navigation replaced the document
+                    await self.adapter.evaluate(page, READINESS_OBSERVER_JS)
+                dom_quiet = probe["domQuietMs"] / 1000 if probe["selectorFound"] else 0.0
+            except Error:
+                # Execution context destroyed by a navigation in progress
+                dom_quiet = 0.0
+            network_quiet = network.quiet_for() if network else quiet_period
+            settled = min(dom_quiet, network_quiet)
+            if settled >= quiet_period:
+                return {"waited": time.monotonic() - start, "reason": "ready"}
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return {"waited": time.monotonic() - start, "reason": "max_wait"}
+            # The page cannot be ready before the quiet period has run out,
+            # and a selector showing up restarts it through its DOM mutation
+            await asyncio.sleep(min(remaining, max(quiet_period - settled, 0.05)))
+
     async def csp_compliant_wait(
         self, page: Page, user_wait_function: str, timeout: float = 30000
     ):
@@ -635,6 +767,67 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             page.on("response", handle_response_capture)
             page.on("requestfailed", handle_request_failed_capture)
 
+        # Request blocking
+        blocking_stats = None
+        handle_blocked_route = None
+        handle_blocking_response = None
+        if config.resource_blocking:
+            blocking = config.resource_blocking
+            site = blocking.site_of(url)
+            main_frame = page.main_frame
+            blocking_stats = {
+                "blocked_requests": 0,
+                "blocked_bytes": 0,
+                "allowed_requests": 0,
+                "allowed_bytes": 0,
+                "blocked_by_type": {},
+                "blocked_by_rule": {},
+            }
+
+            async def handle_blocked_route(route):
+                request = route.request
+                rule = None
+                try:
+                    is_main_document = request.is_navigation_request() and request.frame == main_frame
+                except Error:
+                    # Service worker requests have no frame
+                    is_main_document = False
+                if not is_main_document:
+                    rule = blocking.match(request.url, request.resource_type, site)
+                try:
+                    if rule is None:
+                        await route.fallback()
+                        return
+                    resource_type = request.resource_type
+                    blocking_stats["blocked_requests"] += 1
+                    blocking_stats["blocked_bytes"] += self._estimate_resource_bytes(resource_type)
+                    by_type = blocking_stats["blocked_by_type"]
+                    by_type[resource_type] = by_type.get(resource_type, 0) + 1
+                    by_rule = blocking_stats["blocked_by_rule"]
+                    by_rule[rule] = by_rule.get(rule, 0) + 1
+                    await route.abort("blockedbyclient")
+                except Error:
+                    # The page went away while the request was pending
+                    pass
+
+            def handle_blocking_response(response):
+                size = response.headers.get("content-length")
+                blocking_stats["allowed_requests"] += 1
+                if size and size.isdigit():
+                    blocking_stats["allowed_bytes"] += int(size)
+                    self._record_resource_bytes(response.request.resource_type, int(size))
+
+            await page.route("**/*", handle_blocked_route)
+            page.on("response", handle_blocking_response)
+
+        # Adaptive readiness needs to see requests started by the navigation
+        network_activity = None
+        if config.readiness_mode == "adaptive":
+            network_activity = NetworkActivityTracker()
+            network_activity.attach(page)
+        page_timings = {}
+        crawl_start = time.perf_counter()
+
         # Console Message Capturing
         handle_console = None
         handle_error = None
@@ -647,6 +840,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # Note: For undetected browsers, console logging won't work directly
         # but captured messages can still be logged after retrieval
 
+        handle_download = None
+
         try:
             # Get SSL certificate information if requested and URL is HTTPS
             ssl_cert = None
@@ -655,12 +850,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Set up download handling
             if self.browser_config.accept_downloads:
-                page.on(
-                    "download",
-                    lambda download: asyncio.create_task(
-                        self._handle_download(download)
-                    ),
-                )
+                def handle_download(download):
+                    asyncio.create_task(self._handle_download(download))
+
+                page.on("download", handle_download)
 
             # Handle page navigation and content loading
             if not config.js_only:
@@ -678,9 +871,11 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                             }
                         )
 
+                    goto_start = time.perf_counter()
                     response = await page.goto(
                         url, wait_until=config.wait_until, timeout=config.page_timeout
                     )
+                    page_timings["navigation"] = time.perf_counter() - goto_start
                     redirected_url = page.url
                 except Error as e:
                     # Allow navigation to be aborted when downloading files
@@ -917,9 +1112,11 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 try:
                     # Use wait_for_timeout if specified, otherwise fall back to page_timeout
                     timeout = config.wait_for_timeout if config.wait_for_timeout is not None else config.page_timeout
+                    wait_for_start = time.perf_counter()
                     await self.smart_wait(
                         page, config.wait_for, timeout=timeout
                     )
+                    page_timings["wait_for"] = time.perf_counter() - wait_for_start
                 except Exception as e:
                     raise RuntimeError(f"Wait condition failed: {str(e)}")
 
@@ -946,7 +1143,19 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
             # Pre-content retrieval hooks and delay
             await self.execute_hook("before_retrieve_html", page, context=context, config=config)
             if config.delay_before_return_html:
-                await asyncio.sleep(config.delay_before_return_html)
+                delay_start = time.perf_counter()
+                if network_activity is not None:
+                    readiness = await self.wait_until_ready(
+                        page,
+                        config.delay_before_return_html,
+                        quiet_period=config.readiness_quiet_period,
+                        selector=config.readiness_selector,
+                        network=network_activity,
+                    )
+                    page_timings["readiness_reason"] = readiness["reason"]
+                else:
+                    await asyncio.sleep(config.delay_before_return_html)
+                page_timings["readiness"] = time.perf_counter() - delay_start
 
             # Handle overlay removal
             if config.remove_overlay_elements:
@@ -996,7 +1205,18 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             if config.screenshot:
                 if config.screenshot_wait_for:
-                    await asyncio.sleep(config.screenshot_wait_for)
+                    delay_start = time.perf_counter()
+                    if network_activity is not None:
+                        readiness = await self.wait_until_ready(
+                            page,
+                            config.screenshot_wait_for,
+                            quiet_period=config.readiness_quiet_period,
+                            network=network_activity,
+                        )
+                        page_timings["screenshot_readiness_reason"] = readiness["reason"]
+                    else:
+                        await asyncio.sleep(config.screenshot_wait_for)
+                    page_timings["screenshot_readiness"] = time.perf_counter() - delay_start
                 screenshot_data = await self.take_screenshot(
                     page, screenshot_height_threshold=config.screenshot_height_threshold
                 )
@@ -1023,6 +1243,8 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 final_messages = await self.adapter.retrieve_console_messages(page)
                 captured_console.extend(final_messages)
 
+            page_timings["total"] = time.perf_counter() - crawl_start
+
             # Return complete response
             return AsyncCrawlResponse(
                 html=html,
@@ -1041,12 +1263,22 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 # Include captured data if enabled
                 network_requests=captured_requests if config.capture_network_requests else None,
                 console_messages=captured_console if config.capture_console_messages else None,
+                resource_blocking_stats=blocking_stats,
+                page_timings=page_timings,
             )
 
         except Exception as e:
             raise e
 
         finally:
+            # Interception is per crawl, also for session and pooled pages
+            if handle_blocked_route is not None:
+                page.remove_listener("response", handle_blocking_response)
+                with contextlib.suppress(Error):
+                    await page.unroute("**/*", handle_blocked_route)
+            if network_activity is not None:
+                network_activity.detach(page)
+
             # If no session_id is given we should close the page
             all_contexts = page.context.browser.contexts
             total_pages = sum(len(context.pages) for context in all_contexts)                
@@ -1068,9 +1300,27 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                     
                     # Clean up console capture
                     await self.adapter.cleanup_console_capture(page, handle_console, handle_error)
-                
-                # Close the page
-                await page.close()
+                if handle_download is not None:
+                    page.remove_listener("download", handle_download)
+
+                # Hooks may have left listeners, routes or scripts on the page,
+                # so only hook-free crawls hand their page back for reuse
+                if any(hook for name, hook in self.hooks.items() if name != "on_browser_created"):
+                    await page.close()
+                else:
+                    await self.browser_manager.release_page(page)
+
+    def _record_resource_bytes(self, resource_type: str, size: int) -> None:
+        totals = self._resource_sizes.setdefault(resource_type, [0, 0])
+        totals[0] += size
+        totals[1] += 1
+
+    def _estimate_resource_bytes(self, resource_type: str) -> int:
+        """Mean size of loaded responses of this type, or a typical size if none were seen yet."""
+        totals = self._resource_sizes.get(resource_type)
+        if totals and totals[1]:
+            return totals[0] // totals[1]
+        return TYPICAL_RESOURCE_BYTES.get(resource_type, 0)
 
     # async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1):
     async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1, max_scroll_steps: Optional[int] = None):
@@ -2151,18 +2401,48 @@ class HTTPStatusError(HTTPCrawlerError):
         super().__init__(f"HTTP {status_code}: {message}")
 
 
+class BodyTooLargeError(HTTPCrawlerError):
+    """Raised when a response body exceeds HTTPCrawlerConfig.max_body_size"""
+    def __init__(self, limit: int, message: str):
+        self.limit = limit
+        super().__init__(f"Body larger than {limit} bytes: {message}")
+
+
 class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
     """
     Fast, lightweight HTTP-only crawler strategy optimized for memory efficiency.
+
+    Requests go through aiohttp over HTTP/1.1 by default. With ``http2=True``
+    an httpx client is used instead, which multiplexes concurrent requests to
+    the same host over a single connection. ``connection_stats()`` reports how
+    many requests reused an existing connection.
     """
     
-    __slots__ = ('logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config')
+    __slots__ = (
+        'logger', 'max_connections', 'dns_cache_ttl', 'chunk_size', '_session', 'hooks', 'browser_config',
+        'http2', 'limit_per_host', 'keepalive_timeout', '_client', '_host_slots', '_connection_stats',
+    )
 
     DEFAULT_TIMEOUT: Final[int] = 30
     DEFAULT_CHUNK_SIZE: Final[int] = 64 * 1024  
     DEFAULT_MAX_CONNECTIONS: Final[int] = min(32, (os.cpu_count() or 1) * 4)
     DEFAULT_DNS_CACHE_TTL: Final[int] = 300
+    DEFAULT_LIMIT_PER_HOST: Final[int] = 0  # 0 means no per-host limit
+    DEFAULT_KEEPALIVE_TIMEOUT: Final[float] = 15.0
     VALID_SCHEMES: Final = frozenset({'http', 'https', 'file', 'raw'})
+    # Encoding detection only looks at the start of a body: <meta charset>
+    # must appear in the first 1024 bytes, chardet gets a larger sample
+    META_SNIFF_SIZE: Final[int] = 1024
+    DETECT_SAMPLE_SIZE: Final[int] = 64 * 1024
+
+    _BOMS: Final = (
+        (codecs.BOM_UTF8, 'utf-8-sig'),
+        (codecs.BOM_UTF16_LE, 'utf-16'),
+        (codecs.BOM_UTF16_BE, 'utf-16'),
+    )
+    _META_CHARSET_RE: Final = re.compile(
+        rb"""<meta[^>]+charset\s*=\s*["']?\s*([a-zA-Z0-9_:.\-]+)""", re.IGNORECASE
+    )
 
     _BASE_HEADERS: Final = MappingProxyType({
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -2179,15 +2459,33 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         logger: Optional[AsyncLogger] = None,
         max_connections: int = DEFAULT_MAX_CONNECTIONS,
         dns_cache_ttl: int = DEFAULT_DNS_CACHE_TTL,
-        chunk_size: int = DEFAULT_CHUNK_SIZE
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        http2: bool = False,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
     ):
-        """Initialize the HTTP crawler with config"""
+        """
+        Initialize the HTTP crawler with config.
+
+        Args:
+            http2: Use an httpx client with HTTP/2 instead of aiohttp
+            limit_per_host: Max simultaneous connections per host, 0 for no limit.
+                            Over HTTP/2 this bounds concurrent requests per host instead,
+                            since they share one connection.
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+        """
         self.browser_config = browser_config or HTTPCrawlerConfig()
         self.logger = logger
         self.max_connections = max_connections
         self.dns_cache_ttl = dns_cache_ttl
         self.chunk_size = chunk_size
+        self.http2 = http2
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
         self._session: Optional[aiohttp.ClientSession] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._connection_stats = {"requests": 0, "new_connections": 0, "http_versions": {}}
         
         self.hooks = {
             k: partial(self._execute_hook, k) 
@@ -2234,20 +2532,64 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         return hook_func(*args, **kwargs)
 
     async def start(self) -> None:
+        if self.http2:
+            if not self._client:
+                import httpx
+
+                self._client = httpx.AsyncClient(
+                    http2=True,
+                    headers=dict(self._BASE_HEADERS),
+                    verify=self.browser_config.verify_ssl,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                        keepalive_expiry=self.keepalive_timeout,
+                    ),
+                    timeout=httpx.Timeout(self.DEFAULT_TIMEOUT, connect=10),
+                )
+            return
+
         if not self._session:
+            # aiohttp is only needed by this strategy; imported here to keep package import light
+            import aiohttp
+            from aiohttp.client import ClientTimeout
+
             connector = aiohttp.TCPConnector(
                 limit=self.max_connections,
+                limit_per_host=self.limit_per_host,
                 ttl_dns_cache=self.dns_cache_ttl,
                 use_dns_cache=True,
-                force_close=False
+                force_close=False,
+                keepalive_timeout=self.keepalive_timeout,
             )
+
+            trace_config = aiohttp.TraceConfig()
+
+            async def on_connection_create_end(session, context, params):
+                self._connection_stats["new_connections"] += 1
+
+            trace_config.on_connection_create_end.append(on_connection_create_end)
+
             self._session = aiohttp.ClientSession(
                 headers=dict(self._BASE_HEADERS),
                 connector=connector,
-                timeout=ClientTimeout(total=self.DEFAULT_TIMEOUT)
+                timeout=ClientTimeout(total=self.DEFAULT_TIMEOUT),
+                trace_configs=[trace_config],
             )
 
     async def close(self) -> None:
+        if self._client:
+            try:
+                await asyncio.wait_for(self._client.aclose(), timeout=5.0)
+            except asyncio.TimeoutError:
+                if self.logger:
+                    self.logger.warning(
+                        message="Client cleanup timed out",
+                        tag="CLEANUP"
+                    )
+            finally:
+                self._client = None
+
         if self._session and not self._session.closed:
             try:
                 await asyncio.wait_for(self._session.close(), timeout=5.0)
@@ -2260,21 +2602,92 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
             finally:
                 self._session = None
 
-    async def _stream_file(self, path: str) -> AsyncGenerator[memoryview, None]:
-        async with aiofiles.open(path, mode='rb') as f:
-            while chunk := await f.read(self.chunk_size):
-                yield memoryview(chunk)
+    def connection_stats(self) -> Dict[str, Any]:
+        """
+        Requests completed, connections opened for them and how many requests
+        reused an already open connection, plus a count per HTTP version.
+        """
+        stats = self._connection_stats
+        requests = stats["requests"]
+        reused = max(requests - stats["new_connections"], 0)
+        return {
+            "requests": requests,
+            "new_connections": stats["new_connections"],
+            "reused_connections": reused,
+            "reuse_ratio": reused / requests if requests else 0.0,
+            "http_versions": dict(stats["http_versions"]),
+        }
+
+    def _record_response(self, http_version: str) -> None:
+        stats = self._connection_stats
+        stats["requests"] += 1
+        versions = stats["http_versions"]
+        versions[http_version] = versions.get(http_version, 0) + 1
+
+    @staticmethod
+    def _normalize_encoding(name: str) -> Optional[str]:
+        try:
+            name = codecs.lookup(name).name
+        except LookupError:
+            return None
+        # A sample that happens to be ASCII says nothing about the rest of
+        # the body; UTF-8 decodes ASCII identically and more besides
+        return 'utf-8' if name == 'ascii' else name
+
+    def _detect_encoding(
+        self,
+        body: Union[bytearray, mmap.mmap],
+        declared: Optional[str] = None,
+        guess: bool = True,
+    ) -> str:
+        """
+        Pick the encoding of ``body`` from its BOM, the declared charset, a
+        ``<meta charset>`` near the start, or a chardet guess over a bounded
+        sample, in that order. Falls back to UTF-8.
+        """
+        sample = bytes(body[:self.DETECT_SAMPLE_SIZE])
+        for bom, encoding in self._BOMS:
+            if sample.startswith(bom):
+                return encoding
+
+        encoding = declared and self._normalize_encoding(declared)
+        if encoding:
+            return encoding
+
+        match = self._META_CHARSET_RE.search(sample, 0, self.META_SNIFF_SIZE)
+        if match:
+            encoding = self._normalize_encoding(match.group(1).decode('ascii'))
+            if encoding:
+                return encoding
+
+        if guess:
+            detected = chardet.detect(sample)['encoding']
+            encoding = detected and self._normalize_encoding(detected)
+        return encoding or 'utf-8'
+
+    def _read_file(self, path: str) -> str:
+        with open(path, 'rb') as f:
+            info = os.fstat(f.fileno())
+            if not stat.S_ISREG(info.st_mode):
+                # Pipes and devices cannot be mapped
+                data = bytearray(f.read())
+                return str(data, self._detect_encoding(data, guess=False), 'replace')
+            if not info.st_size:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                encoding = self._detect_encoding(mapped, guess=False)
+                with memoryview(mapped) as view:
+                    return str(view, encoding, 'replace')
 
     async def _handle_file(self, path: str) -> AsyncCrawlResponse:
         if not os.path.exists(path):
             raise FileNotFoundError(f"Local file not found: {path}")
-            
-        chunks = []
-        async for chunk in self._stream_file(path):
-            chunks.append(chunk.tobytes().decode('utf-8', errors='replace'))
-            
+
+        # Decoding the whole mapping at once keeps multibyte characters intact
+        html = await asyncio.to_thread(self._read_file, path)
+
         return AsyncCrawlResponse(
-            html=''.join(chunks),
+            html=html,
             response_headers={},
             status_code=200
         )
@@ -2287,11 +2700,36 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
         )
 
 
+    async def _read_body(
+        self,
+        chunks: AsyncGenerator[bytes, None],
+        content_length: Optional[int],
+        url: str,
+    ) -> bytearray:
+        """Stream the response body into one buffer, enforcing max_body_size."""
+        limit = self.browser_config.max_body_size
+        if limit is not None and (content_length or 0) > limit:
+            raise BodyTooLargeError(limit, f"{url} announced {content_length} bytes")
+
+        body = bytearray()
+        async for chunk in chunks:
+            body += chunk
+            # Content-Length counts compressed bytes, so check while decoding
+            if limit is not None and len(body) > limit:
+                raise BodyTooLargeError(limit, f"{url} exceeded the limit")
+        return body
+
     async def _handle_http(
         self, 
         url: str, 
         config: CrawlerRunConfig
     ) -> AsyncCrawlResponse:
+        if self.http2:
+            return await self._handle_httpx(url, config)
+
+        import aiohttp
+        from aiohttp.client import ClientTimeout
+
         async with self._session_context() as session:
             timeout = ClientTimeout(
                 total=config.page_timeout or self.DEFAULT_TIMEOUT,
@@ -2320,20 +2758,20 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
 
             try:
                 async with session.request(self.browser_config.method, url, **request_kwargs) as response:
-                    content = memoryview(await response.read())
-                    
                     if not (200 <= response.status < 300):
                         raise HTTPStatusError(
                             response.status,
                             f"Unexpected status code for {url}"
                         )
-                    
-                    encoding = response.charset
-                    if not encoding:
-                        encoding = chardet.detect(content.tobytes())['encoding'] or 'utf-8'                    
-                    
+
+                    body = await self._read_body(
+                        response.content.iter_chunked(self.chunk_size), response.content_length, url
+                    )
+                    encoding = self._detect_encoding(body, declared=response.charset)
+                    self._record_response(f"HTTP/{response.version.major}.{response.version.minor}")
+
                     result = AsyncCrawlResponse(
-                        html=content.tobytes().decode(encoding, errors='replace'),
+                        html=str(body, encoding, 'replace'),
                         response_headers=dict(response.headers),
                         status_code=response.status,
                         redirected_url=str(response.url)
@@ -2342,6 +2780,10 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                     await self.hooks['after_request'](result)
                     return result
 
+            except HTTPCrawlerError as e:
+                await self.hooks['on_error'](e)
+                raise
+
             except aiohttp.ServerTimeoutError as e:
                 await self.hooks['on_error'](e)
                 raise ConnectionTimeoutError(f"Request timed out: {str(e)}")
@@ -2362,6 +2804,100 @@ class AsyncHTTPCrawlerStrategy(AsyncCrawlerStrategy):
                 await self.hooks['on_error'](e)
                 raise HTTPCrawlerError(f"HTTP request failed: {str(e)}")
 
+    def _host_slot(self, url: str):
+        if not self.limit_per_host:
+            return contextlib.nullcontext()
+        host = urlparse(url).netloc
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self.limit_per_host)
+        return slot
+
+    async def _trace_connection(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self._connection_stats["new_connections"] += 1
+
+    async def _handle_httpx(
+        self,
+        url: str,
+        config: CrawlerRunConfig
+    ) -> AsyncCrawlResponse:
+        import httpx
+
+        if not self._client:
+            await self.start()
+
+        headers = dict(self._BASE_HEADERS)
+        if self.browser_config.headers:
+            headers.update(self.browser_config.headers)
+
+        request_kwargs = {
+            'timeout': httpx.Timeout(
+                config.page_timeout / 1000 if config.page_timeout else self.DEFAULT_TIMEOUT,
+                connect=10,
+                read=30,
+            ),
+            'follow_redirects': self.browser_config.follow_redirects,
+            'headers': headers,
+            'extensions': {'trace': self._trace_connection},
+        }
+
+        if self.browser_config.method == "POST":
+            if self.browser_config.data:
+                request_kwargs['data'] = self.browser_config.data
+            if self.browser_config.json:
+                request_kwargs['json'] = self.browser_config.json
+
+        await self.hooks['before_request'](url, request_kwargs)
+
+        try:
+            async with self._host_slot(url):
+                async with self._client.stream(self.browser_config.method, url, **request_kwargs) as response:
+                    if not (200 <= response.status_code < 300):
+                        raise HTTPStatusError(
+                            response.status_code,
+                            f"Unexpected status code for {url}"
+                        )
+
+                    content_length = response.headers.get('content-length')
+                    body = await self._read_body(
+                        response.aiter_bytes(self.chunk_size),
+                        int(content_length) if content_length and content_length.isdigit() else None,
+                        url,
+                    )
+                    encoding = self._detect_encoding(body, declared=response.charset_encoding)
+                    self._record_response(response.http_version)
+
+                    result = AsyncCrawlResponse(
+                        html=str(body, encoding, 'replace'),
+                        response_headers=dict(response.headers),
+                        status_code=response.status_code,
+                        redirected_url=str(response.url)
+                    )
+
+                    await self.hooks['after_request'](result)
+                    return result
+
+        except HTTPCrawlerError as e:
+            await self.hooks['on_error'](e)
+            raise
+
+        except httpx.TimeoutException as e:
+            await self.hooks['on_error'](e)
+            raise ConnectionTimeoutError(f"Request timed out: {str(e)}")
+
+        except httpx.ConnectError as e:
+            await self.hooks['on_error'](e)
+            raise ConnectionError(f"Connection failed: {str(e)}")
+
+        except httpx.HTTPError as e:
+            await self.hooks['on_error'](e)
+            raise HTTPCrawlerError(f"HTTP client error: {str(e)}")
+
+        except Exception as e:
+            await self.hooks['on_error'](e)
+            raise HTTPCrawlerError(f"HTTP request failed: {str(e)}")
+
     async def crawl(
         self, 
         url: str, 
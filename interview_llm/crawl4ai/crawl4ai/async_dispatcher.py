@@ -14,6 +14,8 @@ from .types import AsyncWebCrawler
 from collections.abc import AsyncGenerator
 
 import time
+import heapq
+import itertools
 import psutil
 import asyncio
 import uuid
@@ -42,29 +44,53 @@ class RateLimiter:
     def get_domain(self, url: str) -> str:
         return urlparse(url).netloc
 
-    async def wait_if_needed(self, url: str) -> None:
-        domain = self.get_domain(url)
+    def _get_state(self, domain: str) -> DomainState:
         state = self.domains.get(domain)
-
         if not state:
-            self.domains[domain] = DomainState()
-            state = self.domains[domain]
+            state = self.domains[domain] = DomainState()
+        return state
+
+    def ready_time(self, domain: str) -> float:
+        """Earliest ``time.time()`` at which ``domain`` may be requested again."""
+        state = self.domains.get(domain)
+        if not state or not state.last_request_time:
+            return 0.0
+        return state.last_request_time + state.current_delay
 
+    def reserve(self, url: str) -> float:
+        """
+        Claim the next request slot of the URL's domain and return how many
+        seconds to wait until it starts. Concurrent callers for one domain get
+        consecutive slots instead of all waking up at the same moment.
+        """
+        domain = self.get_domain(url)
+        state = self._get_state(domain)
         now = time.time()
-        if state.last_request_time:
-            wait_time = max(0, state.current_delay - (now - state.last_request_time))
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+        start = max(now, self.ready_time(domain))
 
         # Random delay within base range if no current delay
         if state.current_delay == 0:
             state.current_delay = random.uniform(*self.base_delay)
 
-        state.last_request_time = time.time()
+        state.last_request_time = start
+        return start - now
+
+    def release(self, url: str) -> None:
+        """
+        Give back the slot the last ``reserve`` for the URL's domain claimed,
+        for a request that was never sent.
+        """
+        state = self.domains.get(self.get_domain(url))
+        if state and state.last_request_time:
+            state.last_request_time -= state.current_delay
+
+    async def wait_if_needed(self, url: str) -> None:
+        wait_time = self.reserve(url)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
     def update_delay(self, url: str, status_code: int) -> bool:
-        domain = self.get_domain(url)
-        state = self.domains[domain]
+        state = self._get_state(self.get_domain(url))
 
         if status_code in self.rate_limit_codes:
             state.fail_count += 1
@@ -145,6 +171,233 @@ class BaseDispatcher(ABC):
         pass
 
 
+class _DomainQueue:
+    """Tasks of one domain, indexed by ``(retry_count, seq)`` and ``(enqueue_time, seq)``."""
+
+    __slots__ = ("entries", "by_retry", "by_age", "ready", "scheduled_at")
+
+    def __init__(self):
+        self.entries: Dict[int, Tuple[str, str, int, float]] = {}
+        self.by_retry: List[Tuple[int, int]] = []
+        self.by_age: List[Tuple[float, int]] = []
+        self.ready = False
+        self.scheduled_at: Optional[float] = None
+
+    def push(self, seq: int, item: Tuple[str, str, int, float]) -> None:
+        self.entries[seq] = item
+        heapq.heappush(self.by_retry, (item[2], seq))
+        heapq.heappush(self.by_age, (item[3], seq))
+
+    def _top(self, heap: list) -> tuple:
+        # Discard entries already popped through the other heap
+        while heap[0][1] not in self.entries:
+            heapq.heappop(heap)
+        return heap[0]
+
+    def oldest(self) -> Tuple[float, int]:
+        return self._top(self.by_age)
+
+    def least_retried(self) -> Tuple[int, int]:
+        return self._top(self.by_retry)
+
+    def pop(self, seq: int) -> Tuple[str, str, int, float]:
+        item = self.entries.pop(seq)
+        if not self.entries:
+            self.by_retry.clear()
+            self.by_age.clear()
+        elif len(self.by_age) + len(self.by_retry) > 4 * len(self.entries) + 64:
+            # Stale entries buried below the top are only dropped when they
+            # surface; rebuild once they outnumber the live ones
+            self.by_retry = [e for e in self.by_retry if e[1] in self.entries]
+            self.by_age = [e for e in self.by_age if e[1] in self.entries]
+            heapq.heapify(self.by_retry)
+            heapq.heapify(self.by_age)
+        return item
+
+
+class AgingTaskQueue:
+    """
+    Pending-task queue of the MemoryAdaptiveDispatcher with O(log n) aging
+    and per-domain readiness.
+
+    Tasks that have waited longer than ``fairness_timeout`` are served first,
+    longest wait first; all others by retry count, then arrival order.
+    Rather than re-scoring every queued task on each scheduler tick, tasks
+    are indexed by ``(retry_count, seq)`` and ``(enqueue_time, seq)`` heaps
+    and the aging rule is applied when popping, by looking at the oldest
+    candidate.
+
+    With a ``rate_limiter``, tasks are kept in one sub-queue per domain and
+    only domains the limiter allows to be hit now are candidates. Domains
+    still backing off wait in a heap keyed by their ready time, so the
+    dispatcher never starts a task that would sit on a session slot
+    sleeping, and :meth:`next_ready_time` tells it when to wake up. Heap
+    entries that went stale are dropped lazily, keeping ``put_nowait`` and
+    ``get_nowait`` O(log n) amortized in the number of queued tasks and
+    domains.
+
+    Items are ``(url, task_id, retry_count, enqueue_time)`` tuples.
+    """
+
+    def __init__(self, fairness_timeout: float = 600.0, rate_limiter: Optional[RateLimiter] = None):
+        self.fairness_timeout = fairness_timeout
+        self.rate_limiter = rate_limiter
+        self._domains: Dict[str, _DomainQueue] = {}
+        self._seq = itertools.count()
+        self._size = 0
+        # Heads of ready domains and wake-up times of backing-off domains
+        self._ready_by_age: List[Tuple[float, int, str]] = []
+        self._ready_by_retry: List[Tuple[int, int, str]] = []
+        self._waiting: List[Tuple[float, str]] = []
+        # All queued tasks, for wait statistics
+        self._by_age: List[Tuple[float, int]] = []
+        self._queued: Dict[int, float] = {}
+        self._enqueue_time_sum = 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def qsize(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return not self._size
+
+    def _domain_of(self, url: str) -> str:
+        return self.rate_limiter.get_domain(url) if self.rate_limiter else ""
+
+    def _ready_time(self, domain: str) -> float:
+        return self.rate_limiter.ready_time(domain) if self.rate_limiter else 0.0
+
+    def _mark_ready(self, domain: str, dq: _DomainQueue) -> None:
+        dq.ready = True
+        dq.scheduled_at = None
+        heapq.heappush(self._ready_by_age, (*dq.oldest(), domain))
+        heapq.heappush(self._ready_by_retry, (*dq.least_retried(), domain))
+
+    def _schedule(self, domain: str, dq: _DomainQueue, at: float) -> None:
+        dq.ready = False
+        dq.scheduled_at = at
+        heapq.heappush(self._waiting, (at, domain))
+
+    def _promote(self, now: float) -> None:
+        """Move domains whose backoff has expired into the ready heaps."""
+        waiting = self._waiting
+        while waiting and waiting[0][0] <= now:
+            at, domain = heapq.heappop(waiting)
+            dq = self._domains.get(domain)
+            if dq is None or dq.scheduled_at != at:
+                continue
+            # The limiter may have pushed the domain back since it was scheduled
+            ready_at = self._ready_time(domain)
+            if ready_at > now:
+                self._schedule(domain, dq, ready_at)
+            else:
+                self._mark_ready(domain, dq)
+
+    def _ready_top(self, heap: list, head) -> Optional[tuple]:
+        while heap:
+            key, seq, domain = heap[0]
+            dq = self._domains.get(domain)
+            if dq is not None and dq.ready and head(dq) == (key, seq):
+                return heap[0]
+            heapq.heappop(heap)
+        return None
+
+    def put_nowait(
+        self, url: str, task_id: str, retry_count: int = 0, enqueue_time: Optional[float] = None
+    ) -> None:
+        enqueue_time = time.time() if enqueue_time is None else enqueue_time
+        seq = next(self._seq)
+        domain = self._domain_of(url)
+        dq = self._domains.get(domain)
+        if dq is None:
+            dq = self._domains[domain] = _DomainQueue()
+        was_empty = not dq.entries
+        dq.push(seq, (url, task_id, retry_count, enqueue_time))
+        self._size += 1
+        self._queued[seq] = enqueue_time
+        heapq.heappush(self._by_age, (enqueue_time, seq))
+        self._enqueue_time_sum += enqueue_time
+
+        if was_empty:
+            ready_at = self._ready_time(domain)
+            if ready_at > time.time():
+                self._schedule(domain, dq, ready_at)
+            else:
+                self._mark_ready(domain, dq)
+        elif dq.ready:
+            # The new task may be the domain's new head
+            self._mark_ready(domain, dq)
+
+    def get_nowait(self) -> Tuple[str, str, int, float]:
+        """
+        Pop the best task whose domain may be hit now. Raises
+        ``asyncio.QueueEmpty`` when no queued task is ready, even if the
+        queue is not empty.
+        """
+        now = time.time()
+        self._promote(now)
+        oldest = self._ready_top(self._ready_by_age, _DomainQueue.oldest)
+        if oldest is None:
+            raise asyncio.QueueEmpty
+        if now - oldest[0] > self.fairness_timeout:
+            _, seq, domain = oldest
+        else:
+            _, seq, domain = self._ready_top(self._ready_by_retry, _DomainQueue.least_retried)
+
+        dq = self._domains[domain]
+        item = dq.pop(seq)
+        self._size -= 1
+        self._enqueue_time_sum -= self._queued.pop(seq)
+        if not dq.entries:
+            del self._domains[domain]
+        else:
+            # The caller is about to claim the domain's next slot; re-check it then
+            self._schedule(domain, dq, now)
+        if not self._size:
+            self._reset()
+        elif len(self._by_age) > 2 * self._size + 64:
+            self._by_age = [e for e in self._by_age if e[1] in self._queued]
+            heapq.heapify(self._by_age)
+        if len(self._ready_by_age) + len(self._ready_by_retry) + len(self._waiting) > 6 * len(self._domains) + 64:
+            self._rebuild_domain_heaps()
+        return item
+
+    def _reset(self) -> None:
+        self._ready_by_age.clear()
+        self._ready_by_retry.clear()
+        self._waiting.clear()
+        self._by_age.clear()
+        self._enqueue_time_sum = 0.0
+
+    def _rebuild_domain_heaps(self) -> None:
+        self._ready_by_age.clear()
+        self._ready_by_retry.clear()
+        self._waiting.clear()
+        for domain, dq in self._domains.items():
+            if dq.ready:
+                self._mark_ready(domain, dq)
+            else:
+                self._schedule(domain, dq, dq.scheduled_at)
+
+    def next_ready_time(self) -> Optional[float]:
+        """
+        When the next backing-off domain becomes ready, or ``None`` if no
+        queued task is waiting on its domain. May be early, never late.
+        """
+        return self._waiting[0][0] if self._waiting else None
+
+    def wait_statistics(self) -> Tuple[int, float, float]:
+        """``(queued, highest_wait_time, avg_wait_time)`` without scanning the queue."""
+        if not self._size:
+            return 0, 0.0, 0.0
+        while self._by_age[0][1] not in self._queued:
+            heapq.heappop(self._by_age)
+        now = time.time()
+        return self._size, now - self._by_age[0][0], now - self._enqueue_time_sum / self._size
+
+
 class MemoryAdaptiveDispatcher(BaseDispatcher):
     def __init__(
         self,
@@ -167,10 +420,12 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         self.fairness_timeout = fairness_timeout
         self.memory_wait_timeout = memory_wait_timeout
         self.result_queue = asyncio.Queue()
-        self.task_queue = asyncio.PriorityQueue()  # Priority queue for better management
+        self.task_queue = AgingTaskQueue(fairness_timeout, rate_limiter)
+        self._wakeup = asyncio.Event()  # Set when queued work may have become runnable
         self.memory_pressure_mode = False  # Flag to indicate when we're in memory pressure mode
         self.current_memory_percent = 0.0  # Track current memory usage
         self._high_memory_start_time: Optional[float] = None
+        self._stream_total = 0  # URLs run_urls_stream has to deliver, grown by add_urls
         
     async def _memory_monitor_task(self):
         """Background task to continuously monitor memory usage and update state"""
@@ -201,6 +456,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             elif self.memory_pressure_mode and self.current_memory_percent <= self.recovery_threshold_percent:
                 self.memory_pressure_mode = False
                 self._high_memory_start_time = None
+                self._wakeup.set()
                 if self.monitor:
                     self.monitor.update_memory_status("NORMAL")
             elif self.current_memory_percent < self.memory_threshold_percent:
@@ -214,17 +470,6 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 
             await asyncio.sleep(self.check_interval)
     
-    def _get_priority_score(self, wait_time: float, retry_count: int) -> float:
-        """Calculate priority score (lower is higher priority)
-        - URLs waiting longer than fairness_timeout get higher priority
-        - More retry attempts decreases priority
-        """
-        if wait_time > self.fairness_timeout:
-            # High priority for long-waiting URLs
-            return -wait_time
-        # Standard priority based on retries
-        return retry_count
-    
     async def crawl_url(
         self,
         url: str,
@@ -242,6 +487,8 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         # If no config matches, return failed result
         if selected_config is None:
             error_message = f"No matching configuration found for URL: {url}"
+            if self.rate_limiter:
+                self.rate_limiter.release(url)
             if self.monitor:
                 self.monitor.update_task(
                     task_id, 
@@ -281,16 +528,15 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 )
                 
             self.concurrent_sessions += 1
-            
-            if self.rate_limiter:
-                await self.rate_limiter.wait_if_needed(url)
-                
+
             # Check if we're in critical memory state
             if self.current_memory_percent >= self.critical_threshold_percent:
-                # Requeue this task with increased priority and retry count
-                enqueue_time = time.time()
-                priority = self._get_priority_score(enqueue_time - start_time, retry_count + 1)
-                await self.task_queue.put((priority, (url, task_id, retry_count + 1, enqueue_time)))
+                # Requeue this task with an increased retry count; the request
+                # slot claimed when it was dispatched goes back to its domain
+                if self.rate_limiter:
+                    self.rate_limiter.release(url)
+                self.task_queue.put_nowait(url, task_id, retry_count + 1)
+                self._wakeup.set()
                 
                 # Update monitoring
                 if self.monitor:
@@ -371,6 +617,89 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             retry_count=retry_count
         )
         
+    def _enqueue_urls(self, urls: List[str]) -> None:
+        now = time.time()
+        for url in urls:
+            task_id = str(uuid.uuid4())
+            if self.monitor:
+                self.monitor.add_task(task_id, url)
+            self.task_queue.put_nowait(url, task_id, 0, now)
+
+    def _dispatch_ready(
+        self,
+        active_tasks: set,
+        config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
+    ) -> None:
+        """
+        Start queued tasks while session slots are free, memory is not under
+        pressure and their domain is not backing off
+        """
+        if not self.memory_pressure_mode:
+            while len(active_tasks) < self.max_session_permit:
+                try:
+                    url, task_id, retry_count, enqueue_time = self.task_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if self.rate_limiter:
+                    # The queue only hands out URLs whose domain is ready, so
+                    # this claims the slot without having to sleep on it
+                    self.rate_limiter.reserve(url)
+                active_tasks.add(
+                    asyncio.create_task(self.crawl_url(url, config, task_id, retry_count))
+                )
+                if self.monitor:
+                    self.monitor.update_task(
+                        task_id,
+                        wait_time=time.time() - enqueue_time,
+                        status=CrawlStatus.IN_PROGRESS
+                    )
+
+        if self.monitor:
+            total_queued, highest_wait_time, avg_wait_time = self.task_queue.wait_statistics()
+            self.monitor.update_queue_statistics(
+                total_queued=total_queued,
+                highest_wait_time=highest_wait_time,
+                avg_wait_time=avg_wait_time
+            )
+
+    async def _wait_for_progress(self, active_tasks: set, memory_monitor: asyncio.Task) -> set:
+        """
+        Sleep until a crawl finishes, the memory monitor fails or queued work
+        becomes runnable (memory pressure cleared, task requeued, a domain's
+        backoff expired). Returns the finished tasks and removes them from
+        ``active_tasks``.
+        """
+        timeout = None
+        next_ready = self.task_queue.next_ready_time()
+        if (
+            next_ready is not None
+            and not self.memory_pressure_mode
+            and len(active_tasks) < self.max_session_permit
+        ):
+            timeout = max(0.0, next_ready - time.time())
+
+        self._wakeup.clear()
+        waiter = asyncio.create_task(self._wakeup.wait())
+        waitables = {waiter, *active_tasks}
+        if not memory_monitor.done():
+            waitables.add(memory_monitor)
+        try:
+            await asyncio.wait(waitables, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            waiter.cancel()
+        done = {task for task in active_tasks if task.done()}
+        active_tasks -= done
+        return done
+
+    @staticmethod
+    def _raise_if_monitor_failed(memory_monitor: asyncio.Task, active_tasks: set) -> None:
+        if memory_monitor.done():
+            exc = memory_monitor.exception()
+            if exc:
+                for t in active_tasks:
+                    t.cancel()
+                raise exc
+
     async def run_urls(
         self,
         urls: List[str],
@@ -388,73 +717,19 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         results = []
 
         try:
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
-
-            active_tasks = []
+            self._enqueue_urls(urls)
+            active_tasks = set()
 
             # Process until both queues are empty
             while not self.task_queue.empty() or active_tasks:
-                if memory_monitor.done():
-                    exc = memory_monitor.exception()
-                    if exc:
-                        for t in active_tasks:
-                            t.cancel()
-                        raise exc
+                self._raise_if_monitor_failed(memory_monitor, active_tasks)
 
                 # If memory pressure is low, greedily fill all available slots
-                if not self.memory_pressure_mode:
-                    slots = self.max_session_permit - len(active_tasks)
-                    while slots > 0:
-                        try:
-                            # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
-                            
-                            # Create and start the task
-                            task = asyncio.create_task(
-                                self.crawl_url(url, config, task_id, retry_count)
-                            )
-                            active_tasks.append(task)
-                            
-                            # Update waiting time in monitor
-                            if self.monitor:
-                                wait_time = time.time() - enqueue_time
-                                self.monitor.update_task(
-                                    task_id, 
-                                    wait_time=wait_time,
-                                    status=CrawlStatus.IN_PROGRESS
-                                )
-                            
-                            slots -= 1
-                            
-                        except asyncio.QueueEmpty:
-                            # No more tasks in queue, exit the loop
-                            break
-                        
-                # Wait for completion even if queue is starved
-                if active_tasks:
-                    done, pending = await asyncio.wait(
-                        active_tasks, timeout=0.1, return_when=asyncio.FIRST_COMPLETED
-                    )
-                    
-                    # Process completed tasks
-                    for completed_task in done:
-                        result = await completed_task
-                        results.append(result)
-                        
-                    # Update active tasks list
-                    active_tasks = list(pending)
-                else:
-                    # If no active tasks but still waiting, sleep briefly
-                    await asyncio.sleep(self.check_interval / 2)
-                    
-                # Update priorities for waiting tasks if needed
-                await self._update_queue_priorities()
+                self._dispatch_ready(active_tasks, config)
+
+                # Sleep until something changes instead of polling
+                for completed_task in await self._wait_for_progress(active_tasks, memory_monitor):
+                    results.append(await completed_task)
 
         except Exception as e:
             if self.monitor:
@@ -466,66 +741,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             if self.monitor:
                 self.monitor.stop()
             return results
-                
-    async def _update_queue_priorities(self):
-        """Periodically update priorities of items in the queue to prevent starvation"""
-        # Skip if queue is empty
-        if self.task_queue.empty():
-            return
-            
-        # Use a drain-and-refill approach to update all priorities
-        temp_items = []
-        
-        # Drain the queue (with a safety timeout to prevent blocking)
-        try:
-            drain_start = time.time()
-            while not self.task_queue.empty() and time.time() - drain_start < 5.0:  # 5 second safety timeout
-                try:
-                    # Get item from queue with timeout
-                    priority, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=0.1
-                    )
-                    
-                    # Calculate new priority based on current wait time
-                    current_time = time.time()
-                    wait_time = current_time - enqueue_time
-                    new_priority = self._get_priority_score(wait_time, retry_count)
-                    
-                    # Store with updated priority
-                    temp_items.append((new_priority, (url, task_id, retry_count, enqueue_time)))
-                    
-                    # Update monitoring stats for this task
-                    if self.monitor and task_id in self.monitor.stats:
-                        self.monitor.update_task(task_id, wait_time=wait_time)
-                        
-                except asyncio.TimeoutError:
-                    # Queue might be empty or very slow
-                    break
-        except Exception as e:
-            # If anything goes wrong, make sure we refill the queue with what we've got
-            self.monitor.update_memory_status(f"QUEUE_ERROR: {str(e)}")
-        
-        # Calculate queue statistics
-        if temp_items and self.monitor:
-            total_queued = len(temp_items)
-            wait_times = [item[1][3] for item in temp_items]
-            highest_wait_time = time.time() - min(wait_times) if wait_times else 0
-            avg_wait_time = sum(time.time() - t for t in wait_times) / len(wait_times) if wait_times else 0
-            
-            # Update queue statistics in monitor
-            self.monitor.update_queue_statistics(
-                total_queued=total_queued,
-                highest_wait_time=highest_wait_time,
-                avg_wait_time=avg_wait_time
-            )
-        
-        # Sort by priority (lowest number = highest priority)
-        temp_items.sort(key=lambda x: x[0])
-        
-        # Refill the queue with updated priorities
-        for item in temp_items:
-            await self.task_queue.put(item)
-                
+
     async def run_urls_stream(
         self,
         urls: List[str],
@@ -540,83 +756,45 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         if self.monitor:
             self.monitor.start()
             
+        active_tasks = set()
         try:
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
-                
-            active_tasks = []
+            self._enqueue_urls(urls)
             completed_count = 0
-            total_urls = len(urls)
-
-            while completed_count < total_urls:
-                if memory_monitor.done():
-                    exc = memory_monitor.exception()
-                    if exc:
-                        for t in active_tasks:
-                            t.cancel()
-                        raise exc
+            self._stream_total = len(urls)
+
+            while completed_count < self._stream_total and (active_tasks or not self.task_queue.empty()):
+                self._raise_if_monitor_failed(memory_monitor, active_tasks)
+
                 # If memory pressure is low, greedily fill all available slots
-                if not self.memory_pressure_mode:
-                    slots = self.max_session_permit - len(active_tasks)
-                    while slots > 0:
-                        try:
-                            # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
-                            
-                            # Create and start the task
-                            task = asyncio.create_task(
-                                self.crawl_url(url, config, task_id, retry_count)
-                            )
-                            active_tasks.append(task)
-                            
-                            # Update waiting time in monitor
-                            if self.monitor:
-                                wait_time = time.time() - enqueue_time
-                                self.monitor.update_task(
-                                    task_id, 
-                                    wait_time=wait_time,
-                                    status=CrawlStatus.IN_PROGRESS
-                                )
-                            
-                            slots -= 1
-                            
-                        except asyncio.QueueEmpty:
-                            # No more tasks in queue, exit the loop
-                            break
-                        
-                # Process completed tasks and yield results
-                if active_tasks:
-                    done, pending = await asyncio.wait(
-                        active_tasks, timeout=0.1, return_when=asyncio.FIRST_COMPLETED
-                    )
-                    
-                    for completed_task in done:
-                        result = await completed_task
-                        
-                        # Only count as completed if it wasn't requeued
-                        if "requeued" not in result.error_message:
-                            completed_count += 1
-                            yield result
-                        
-                    # Update active tasks list
-                    active_tasks = list(pending)
-                else:
-                    # If no active tasks but still waiting, sleep briefly
-                    await asyncio.sleep(self.check_interval / 2)
-                
-                # Update priorities for waiting tasks if needed
-                await self._update_queue_priorities()
+                self._dispatch_ready(active_tasks, config)
+
+                # Sleep until something changes, then yield finished results
+                for completed_task in await self._wait_for_progress(active_tasks, memory_monitor):
+                    result = await completed_task
+
+                    # Only count as completed if it wasn't requeued
+                    if "requeued" not in result.error_message.lower():
+                        completed_count += 1
+                        yield result
                 
         finally:
-            # Clean up
+            # Clean up, including crawls still running when the consumer stopped early
             memory_monitor.cancel()
+            for task in active_tasks:
+                task.cancel()
+            await asyncio.gather(*active_tasks, return_exceptions=True)
             if self.monitor:
                 self.monitor.stop()
+
+    def add_urls(self, urls: List[str]) -> None:
+        """
+        Queue more URLs on a running :meth:`run_urls_stream`, e.g. links found
+        by a pipelined deep crawl. Call it while the stream is suspended on a
+        yield; the stream then keeps going until these have been crawled too.
+        """
+        self._enqueue_urls(urls)
+        self._stream_total += len(urls)
+        self._wakeup.set()
                 
 
 class SemaphoreDispatcher(BaseDispatcher):
@@ -2,6 +2,12 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Optional, Dict, Any, List
 import os
+import sys
+import json
+import time
+import atexit
+import queue
+import threading
 from datetime import datetime
 from urllib.parse import unquote
 from rich.console import Console
@@ -46,6 +52,169 @@ class LogColor(str, Enum):
         return self.value
 
 
+class LogFileSink:
+    """
+    Appends log records to a file from a background thread.
+
+    Callers only put a tuple on a queue; stripping markup, formatting and
+    writing happen on the writer thread, which drains everything queued since
+    its last write into one buffered write. Records are written as plain text
+    lines or, with ``json_lines=True``, as one JSON object per line. With
+    ``max_bytes`` set the file is rotated to ``.1`` ... ``.<backup_count>``.
+
+    Use ``LogFileSink.for_path`` so loggers writing to the same file share
+    one writer.
+    """
+
+    _sinks: Dict[str, "LogFileSink"] = {}
+    _sinks_lock = threading.Lock()
+    _FLUSH = object()
+
+    def __init__(
+        self,
+        path: str,
+        json_lines: bool = False,
+        max_bytes: int = 0,
+        backup_count: int = 3,
+        max_batch: int = 1024,
+    ):
+        self.path = os.path.abspath(path)
+        self.json_lines = json_lines
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_batch = max_batch
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+
+    @classmethod
+    def for_path(cls, path: str, **kwargs) -> "LogFileSink":
+        """Shared sink for ``path``; options only apply when it is first created."""
+        key = os.path.abspath(path)
+        with cls._sinks_lock:
+            sink = cls._sinks.get(key)
+            if sink is None:
+                sink = cls._sinks[key] = cls(key, **kwargs)
+            return sink
+
+    @classmethod
+    def flush_all(cls, timeout: Optional[float] = 5.0) -> None:
+        for sink in list(cls._sinks.values()):
+            sink.flush(timeout)
+
+    def emit(
+        self,
+        level: str,
+        tag: str,
+        text: str,
+        markup: bool = False,
+        message: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Queue one record. ``text`` is the plain-text line body; ``message`` and
+        ``params`` go into the JSON record (``message`` defaults to ``text``).
+        """
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            self._start()
+        self._queue.put((time.time(), level, tag, text, markup, message, params))
+
+    def flush(self, timeout: Optional[float] = 5.0) -> None:
+        """Block until everything queued so far has been written."""
+        thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        done = threading.Event()
+        self._queue.put((self._FLUSH, done))
+        done.wait(timeout)
+
+    def _start(self) -> None:
+        with self._start_lock:
+            # Also restarts the writer in a forked child, where it is not running
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=f"log-sink:{os.path.basename(self.path)}", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        f = None
+        size = 0
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            waiters = []
+            lines = []
+            try:
+                for record in batch:
+                    if record[0] is self._FLUSH:
+                        waiters.append(record[1])
+                        continue
+                    try:
+                        lines.append(self._format(record))
+                    except Exception:
+                        # Keep the record rather than losing the whole batch
+                        lines.append(self._format(record, markup=False))
+
+                if f is None:
+                    f = open(self.path, "ab")
+                    size = f.tell()
+                for line in lines:
+                    if self.max_bytes and size and size + len(line) > self.max_bytes:
+                        f = self._rotate(f)
+                        size = 0
+                    f.write(line)
+                    size += len(line)
+                f.flush()
+            except Exception as e:
+                # Never let a full disk or a bad record kill the writer
+                sys.stderr.write(f"crawl4ai: failed to write {self.path}: {e}\n")
+            finally:
+                for done in waiters:
+                    done.set()
+
+    def _format(self, record, markup: Optional[bool] = None) -> bytes:
+        """Encode one record; ``markup=False`` writes the text unparsed."""
+        created, level, tag, text, record_markup, message, params = record
+        markup = record_markup if markup is None else markup
+        if self.json_lines:
+            message = text if message is None else message
+            entry = {
+                "time": datetime.fromtimestamp(created).isoformat(timespec="milliseconds"),
+                "level": level,
+                "tag": tag,
+                "message": Text.from_markup(message).plain if markup else message,
+            }
+            if params:
+                entry["params"] = params
+            line = json.dumps(entry, ensure_ascii=False, default=str)
+        else:
+            timestamp = datetime.fromtimestamp(created).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            line = f"[{timestamp}] {Text.from_markup(text).plain if markup else text}"
+        return (line + "\n").encode("utf-8", errors="replace")
+
+    def _rotate(self, f):
+        f.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                source = f"{self.path}.{i}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{i + 1}")
+            os.replace(self.path, f"{self.path}.1")
+            return open(self.path, "ab")
+        return open(self.path, "wb")
+
+
+atexit.register(LogFileSink.flush_all)
+
+
 class AsyncLoggerBase(ABC):
     @abstractmethod
     def debug(self, message: str, tag: str = "DEBUG", **kwargs):
@@ -118,6 +287,10 @@ class AsyncLogger(AsyncLoggerBase):
         icons: Optional[Dict[str, str]] = None,
         colors: Optional[Dict[LogLevel, LogColor]] = None,
         verbose: bool = True,
+        file_log_level: Optional[LogLevel] = None,
+        log_format: str = "text",
+        log_max_bytes: int = 0,
+        log_backup_count: int = 3,
     ):
         """
         Initialize the logger.
@@ -129,6 +302,10 @@ class AsyncLogger(AsyncLoggerBase):
             icons: Custom icons for different tags
             colors: Custom colors for different log levels
             verbose: Whether to output to console
+            file_log_level: Minimum log level written to log_file, defaults to log_level
+            log_format: "text" for plain lines or "json" for one JSON object per line
+            log_max_bytes: Rotate log_file once it would grow past this size, 0 to never rotate
+            log_backup_count: Number of rotated files to keep
         """
         self.log_file = log_file
         self.log_level = log_level
@@ -136,11 +313,18 @@ class AsyncLogger(AsyncLoggerBase):
         self.icons = icons or self.DEFAULT_ICONS
         self.colors = colors or self.DEFAULT_COLORS
         self.verbose = verbose
+        self.file_log_level = file_log_level or log_level
         self.console = Console()
 
-        # Create log file directory if needed
+        # File output goes through a background writer shared per file
+        self._sink = None
         if log_file:
-            os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+            self._sink = LogFileSink.for_path(
+                log_file,
+                json_lines=log_format == "json",
+                max_bytes=log_max_bytes,
+                backup_count=log_backup_count,
+            )
 
     def _format_tag(self, tag: str) -> str:
         """Format a tag with consistent width."""
@@ -158,14 +342,24 @@ class AsyncLogger(AsyncLoggerBase):
         shortened = text[:half] + placeholder + text[-half:]
         return shortened.ljust(length)  # Also pad shortened text to consistent length
 
-    def _write_to_file(self, message: str):
-        """Write a message to the log file if configured."""
-        if self.log_file:
-            text = Text.from_markup(message)
-            plain_text = text.plain
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(f"[{timestamp}] {plain_text}\n")
+    def _write_to_file(
+        self,
+        message: str,
+        level: LogLevel = LogLevel.INFO,
+        tag: str = "",
+        formatted_message: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ):
+        """Queue a message for the log file if configured."""
+        if self._sink:
+            self._sink.emit(
+                str(level), tag, message, markup=True, message=formatted_message, params=params
+            )
+
+    def flush(self):
+        """Wait until queued log file writes are on disk."""
+        if self._sink:
+            self._sink.flush()
 
     def _log(
         self,
@@ -190,7 +384,10 @@ class AsyncLogger(AsyncLoggerBase):
             boxes: Box overrides for specific parameters
             base_color: Base color for the entire message
         """
-        if level.value < self.log_level.value:
+        # Skip formatting entirely when the message goes nowhere
+        to_console = (self.verbose or kwargs.get("force_verbose", False)) and level.value >= self.log_level.value
+        to_file = self._sink is not None and level.value >= self.file_log_level.value
+        if not (to_console or to_file):
             return
 
         # avoid conflict with rich formatting
@@ -223,11 +420,12 @@ class AsyncLogger(AsyncLoggerBase):
         log_line = f"[{color}]{self._format_tag(tag)} {self._get_icon(tag)} {formatted_message} [/{color}]"
 
         # Output to console if verbose
-        if self.verbose or kwargs.get("force_verbose", False):
+        if to_console:
             self.console.print(log_line)
 
         # Write to file if configured
-        self._write_to_file(log_line)
+        if to_file:
+            self._write_to_file(log_line, level, tag, formatted_message, params)
 
     def debug(self, message: str, tag: str = "DEBUG", **kwargs):
         """Log a debug message."""
@@ -334,13 +532,15 @@ class AsyncFileLogger(AsyncLoggerBase):
             log_file: File path for logging
         """
         self.log_file = log_file
-        os.makedirs(os.path.dirname(os.path.abspath(log_file)), exist_ok=True)
+        self._sink = LogFileSink.for_path(log_file)
 
     def _write_to_file(self, level: str, message: str, tag: str):
-        """Write a message to the log file."""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-        with open(self.log_file, "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] [{level}] [{tag}] {message}\n")
+        """Queue a message for the log file."""
+        self._sink.emit(level, tag, f"[{level}] [{tag}] {message}", message=message)
+
+    def flush(self):
+        """Wait until queued log file writes are on disk."""
+        self._sink.flush()
 
     def debug(self, message: str, tag: str = "DEBUG", **kwargs):
         """Log a debug message to file."""
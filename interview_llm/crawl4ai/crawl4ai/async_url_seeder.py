@@ -7,9 +7,11 @@ Features
 * Common-Crawl streaming via httpx.AsyncClient (HTTP/2, keep-alive)
 * robots.txt → sitemap chain (.gz + nested indexes) via async httpx
 * Per-domain CDX result cache on disk (~/.crawl4ai/<index>_<domain>_<hash>.jsonl)
+* Optional single-file SQLite cache for head/live results and URL lists
 * Optional HEAD-only liveness check
 * Optional partial <head> download + meta parsing
-* Global hits-per-second rate-limit via asyncio.Semaphore
+* Per-host hits-per-second rate-limit via a token bucket
+* Async-iterator variants (stream_urls / stream_many_urls) with incremental BM25
 * Concurrency in the thousands — fine on a single event-loop
 """
 
@@ -20,14 +22,20 @@ import gzip
 import hashlib
 import io
 import json
+import math
 import os
 import pathlib
 import re
+import sqlite3
+import threading
 import time
+import zlib
+from dataclasses import dataclass
 from datetime import timedelta
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
-from urllib.parse import quote, urljoin
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from urllib.parse import quote, urljoin, urlparse
 
 import httpx
 import fnmatch
@@ -53,6 +61,7 @@ except ImportError:
 # You might need to adjust this import based on your exact file structure
 # Import AsyncLogger for default if needed
 from .async_logger import AsyncLoggerBase, AsyncLogger
+from .utils import HeadFetcher, HeadResult
 
 # Import SeedingConfig for type hints
 from typing import TYPE_CHECKING
@@ -66,6 +75,7 @@ COLLINFO_URL = "https://index.commoncrawl.org/collinfo.json"
 # CACHE_DIR.mkdir(exist_ok=True) # REMOVED: now managed by __init__
 # INDEX_CACHE = CACHE_DIR / "latest_cc_index.txt" # REMOVED: now managed by __init__
 TTL = timedelta(days=7)  # Keeping this constant as it's a seeder-specific TTL
+SEEDER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) +AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
 
 _meta_rx = re.compile(
     r'<meta\s+(?:[^>]*?(?:name|property|http-equiv)\s*=\s*["\']?([^"\' >]+)[^>]*?content\s*=\s*["\']?([^"\' >]+)[^>]*?)\/?>',
@@ -158,6 +168,294 @@ def _parse_head(src: str) -> Dict[str, Any]:
         info["lang"] = lang_match.group(1)
     return info
 
+class HostRateLimiter:
+    """
+    Token-bucket rate limiter with one bucket per host.
+
+    Unlike a semaphore, which only caps how many requests are in flight, this
+    spaces requests so each host sees at most ``rate`` requests per second on
+    average, with up to ``burst`` requests allowed back to back. Implemented as
+    GCRA (virtual scheduling): every host keeps the theoretical arrival time of
+    its next request, so ``acquire`` is O(1) and waiters are served in order.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1, int(burst if burst is not None else rate))
+        self._interval = 1.0 / rate
+        self._tolerance = (self.burst - 1) * self._interval
+        self._tat: Dict[str, float] = {}
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to ``url``'s host is allowed."""
+        host = urlparse(url).netloc.lower()
+        now = time.monotonic()
+        tat = max(self._tat.get(host, now), now)
+        start = max(now, tat - self._tolerance)
+        self._tat[host] = tat + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+
+class IncrementalBM25:
+    """
+    BM25 over a corpus that grows one document at a time.
+
+    Only the statistics the query needs are kept (document count, total length
+    and the document frequency of each query term), so ``add`` is O(len(doc)).
+    A document is scored against the corpus as it stands when it arrives.
+
+    Scores are divided by the largest score the query can reach,
+    ``sum(idf * (k1 + 1))``, giving a 0-1 value that stays comparable while
+    the corpus grows (batch scoring min-max normalizes over the final corpus
+    instead). IDF uses the non-negative ``log(1 + (N - df + 0.5) / (df + 0.5))``
+    form so common terms never push a score below zero.
+    """
+
+    def __init__(self, query: str, k1: float = 1.5, b: float = 0.75):
+        self.terms = query.lower().split()
+        self.k1 = k1
+        self.b = b
+        self.n_docs = 0
+        self.total_len = 0
+        self.df: Dict[str, int] = dict.fromkeys(self.terms, 0)
+
+    def add(self, document: str) -> float:
+        """Add ``document`` to the corpus and return its normalized score."""
+        tokens = document.lower().split()
+        tf: Dict[str, int] = {}
+        for token in tokens:
+            if token in self.df:
+                tf[token] = tf.get(token, 0) + 1
+        self.n_docs += 1
+        self.total_len += len(tokens)
+        for term in tf:
+            self.df[term] += 1
+
+        if not self.terms:
+            return 0.0
+        avgdl = self.total_len / self.n_docs or 1.0
+        norm = self.k1 * (1 - self.b + self.b * len(tokens) / avgdl)
+        score = bound = 0.0
+        for term in self.terms:
+            df = self.df[term]
+            idf = math.log(1 + (self.n_docs - df + 0.5) / (df + 0.5))
+            bound += idf * (self.k1 + 1)
+            f = tf.get(term, 0)
+            if f:
+                score += idf * f * (self.k1 + 1) / (f + norm)
+        return score / bound if bound else 0.0
+
+
+class SQLiteSeederCache:
+    """
+    Single-file cache backend for AsyncUrlSeeder (``SeedingConfig(cache_backend="sqlite")``).
+
+    Replaces the one-JSON-file-per-URL head/live cache and the per-domain
+    ``.jsonl`` URL lists with one SQLite database in WAL mode:
+
+      - ``entries``: validation results keyed by ``(kind, url)``. Writes are
+        buffered and committed in batches; :meth:`get_many` / :meth:`prefetch`
+        look up many URLs in one query.
+      - ``url_lists``: discovered CC / sitemap URL lists, written in batches and
+        only served from cache once a list was read to the end.
+
+    Entries older than ``ttl`` are ignored on read and evicted when the cache
+    is opened. Blocking SQLite calls run in a worker thread.
+    """
+
+    _CHUNK = 500  # SQLite host-parameter budget per IN (...) query
+
+    def __init__(self, path: Union[str, Path], ttl: timedelta = TTL, batch_size: int = 500):
+        self.path = str(path)
+        self.ttl = ttl
+        self.batch_size = batch_size
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                kind TEXT NOT NULL,
+                url TEXT NOT NULL,
+                data TEXT NOT NULL,
+                fetch_time REAL NOT NULL,
+                PRIMARY KEY (kind, url)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_entries_time ON entries (fetch_time);
+            CREATE TABLE IF NOT EXISTS url_lists (
+                name TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (name, seq)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS url_list_meta (
+                name TEXT PRIMARY KEY,
+                fetch_time REAL NOT NULL,
+                complete INTEGER NOT NULL DEFAULT 0
+            );
+            """
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._hot: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.evict_expired()
+
+    # ───────── entries ─────────
+    def _select(self, kind: str, urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        cutoff = time.time() - self.ttl.total_seconds()
+        found: Dict[str, Dict[str, Any]] = {}
+        with self._lock:
+            for i in range(0, len(urls), self._CHUNK):
+                chunk = urls[i:i + self._CHUNK]
+                rows = self._conn.execute(
+                    f"SELECT url, data FROM entries WHERE kind = ? AND fetch_time >= ? "
+                    f"AND url IN ({','.join('?' * len(chunk))})",
+                    (kind, cutoff, *chunk),
+                ).fetchall()
+                for url, data in rows:
+                    found[url] = json.loads(data)
+        return found
+
+    async def get(self, kind: str, url: str) -> Optional[Dict[str, Any]]:
+        key = (kind, url)
+        if key in self._hot:
+            return self._hot.pop(key)
+        if key in self._pending:
+            return json.loads(self._pending[key][0])
+        return (await asyncio.to_thread(self._select, kind, [url])).get(url)
+
+    async def get_many(self, kind: str, urls: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Bulk lookup. Returns ``{url: entry}`` for the URLs that are cached and fresh."""
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for url in urls:
+            pending = self._pending.get((kind, url))
+            if pending is not None:
+                found[url] = json.loads(pending[0])
+            else:
+                missing.append(url)
+        if missing:
+            found.update(await asyncio.to_thread(self._select, kind, missing))
+        return found
+
+    async def prefetch(self, kind: str, urls: Iterable[str]) -> None:
+        """Load cached entries for ``urls`` in one query so later ``get`` calls are served from memory."""
+        if len(self._hot) > 100_000:
+            self._hot.clear()
+        for url, entry in (await self.get_many(kind, urls)).items():
+            self._hot[(kind, url)] = entry
+
+    async def set(self, kind: str, url: str, data: Dict[str, Any]) -> None:
+        self._pending[(kind, url)] = (json.dumps(data, separators=(",", ":")), time.time())
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+
+    def _write(self, rows: List[Tuple[str, str, str, float]]) -> None:
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (kind, url, data, fetch_time) VALUES (?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    async def flush(self) -> None:
+        """Commit buffered writes."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        rows = [(kind, url, data, ts) for (kind, url), (data, ts) in pending.items()]
+        await asyncio.to_thread(self._write, rows)
+
+    def evict_expired(self) -> None:
+        """Drop entries and URL lists older than the TTL."""
+        cutoff = time.time() - self.ttl.total_seconds()
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE fetch_time < ?", (cutoff,))
+            stale = [row[0] for row in self._conn.execute(
+                "SELECT name FROM url_list_meta WHERE fetch_time < ?", (cutoff,))]
+            self._conn.executemany("DELETE FROM url_lists WHERE name = ?", ((n,) for n in stale))
+            self._conn.executemany("DELETE FROM url_list_meta WHERE name = ?", ((n,) for n in stale))
+            self._conn.commit()
+
+    # ───────── URL lists ─────────
+    def _has_list(self, name: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT complete FROM url_list_meta WHERE name = ?", (name,)
+            ).fetchone()
+        return bool(row and row[0])
+
+    async def has_list(self, name: str) -> bool:
+        return await asyncio.to_thread(self._has_list, name)
+
+    def _read_list(self, name: str, after: int, limit: int) -> List[Tuple[int, str]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT seq, url FROM url_lists WHERE name = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (name, after, limit),
+            ).fetchall()
+
+    async def iter_list(self, name: str, page_size: int = 5000) -> AsyncIterator[str]:
+        after = -1
+        while True:
+            rows = await asyncio.to_thread(self._read_list, name, after, page_size)
+            if not rows:
+                return
+            for _, url in rows:
+                yield url
+            after = rows[-1][0]
+
+    def _list_op(self, sql_and_params: List[Tuple[str, Any]]) -> None:
+        with self._lock:
+            for sql, params in sql_and_params:
+                if params and isinstance(params, list):
+                    self._conn.executemany(sql, params)
+                else:
+                    self._conn.execute(sql, params or ())
+            self._conn.commit()
+
+    async def start_list(self, name: str) -> None:
+        await asyncio.to_thread(self._list_op, [
+            ("DELETE FROM url_lists WHERE name = ?", (name,)),
+            ("INSERT OR REPLACE INTO url_list_meta (name, fetch_time, complete) VALUES (?, ?, 0)",
+             (name, time.time())),
+        ])
+
+    async def extend_list(self, name: str, start: int, urls: List[str]) -> None:
+        await asyncio.to_thread(self._list_op, [
+            ("INSERT OR REPLACE INTO url_lists (name, seq, url) VALUES (?, ?, ?)",
+             [(name, start + i, url) for i, url in enumerate(urls)]),
+        ])
+
+    async def finish_list(self, name: str) -> None:
+        await asyncio.to_thread(self._list_op, [
+            ("UPDATE url_list_meta SET complete = 1, fetch_time = ? WHERE name = ?", (time.time(), name)),
+        ])
+
+    async def close(self) -> None:
+        await self.flush()
+        with self._lock:
+            self._conn.close()
+
+
+SEEDER_CACHE_BACKENDS = ("files", "sqlite")
+
+
+@dataclass(frozen=True)
+class _SeedingCall:
+    """Options of one seeding call, resolved from its ``SeedingConfig``.
+
+    The seeder instance is shared by concurrent calls, so these are passed down
+    instead of being stored on it.
+    """
+    db_cache: Optional[SQLiteSeederCache] = None
+    stream_sitemaps: bool = True
+    force: bool = False
+
+
 # ────────────────────────────────────────────────────────────────────────── class
 
 
@@ -172,6 +470,10 @@ class AsyncUrlSeeder:
         returns List[Dict[str,Any]]  (url, status, head_data)
     await seed.many_urls(...)
         returns Dict[str, List[Dict[str,Any]]]
+    async for entry in seed.stream_urls(...)
+        yields each validated Dict[str,Any] as soon as it is found
+    async for domain, entry in seed.stream_many_urls(...)
+        same, across many domains
     await seed.close()
         closes the HTTP client if owned by seeder
     
@@ -203,13 +505,22 @@ class AsyncUrlSeeder:
         # NEW: Add base_directory
         base_directory: Optional[Union[str, pathlib.Path]] = None,
         cache_root: Optional[Union[str, Path]] = None,
+        head_fetcher: Optional[HeadFetcher] = None,
     ):
         self.ttl = ttl
         self._owns_client = client is None  # Track if we created the client
         self.client = client or httpx.AsyncClient(http2=True, timeout=20, headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) +AppleWebKit/537.36 (KHTML, like Gecko) Chrome/123.0.0.0 Safari/537.36"
+            "User-Agent": SEEDER_USER_AGENT
         })
         self.logger = logger  # Store the logger instance
+        # <head> fetches go through a HeadFetcher so seeders with the same
+        # User-Agent and TTL share one pool and one head cache. A caller-supplied
+        # client gets its own fetcher so its settings are honoured.
+        self._owns_head_fetcher = head_fetcher is None and client is not None
+        self.head_fetcher = head_fetcher or (
+            HeadFetcher(client=client, ttl=ttl, logger=logger) if client is not None
+            else HeadFetcher.shared(user_agent=SEEDER_USER_AGENT, ttl=ttl)
+        )
         self.base_directory = pathlib.Path(base_directory or os.getenv(
             "CRAWL4_AI_BASE_DIRECTORY", Path.home()))  # Resolve base_directory
         self.cache_dir = self.base_directory / ".crawl4ai" / \
@@ -220,13 +531,15 @@ class AsyncUrlSeeder:
 
         # defer – grabbing the index inside an active loop blows up
         self.index_id: Optional[str] = None
-        self._rate_sem: Optional[asyncio.Semaphore] = None
+        self._rate_limiter: Optional[HostRateLimiter] = None
 
         # ───────── cache dirs ─────────
         self.cache_root = Path(os.path.expanduser(
             cache_root or "~/.cache/url_seeder"))
         (self.cache_root / "live").mkdir(parents=True, exist_ok=True)
         (self.cache_root / "head").mkdir(exist_ok=True)
+        # Opened on the first call with SeedingConfig.cache_backend="sqlite"
+        self._sqlite_cache: Optional[SQLiteSeederCache] = None
 
     def _log(self, level: str, message: str, tag: str = "URL_SEED", **kwargs: Any):
         """Helper to log messages using the provided logger, if available."""
@@ -239,11 +552,36 @@ class AsyncUrlSeeder:
             #     print(f"[{tag}] {level.upper()}: {message.format(**kwargs)}")
 
     # ───────── cache helpers ─────────
+    async def _seeding_call(self, config: "SeedingConfig") -> _SeedingCall:
+        """Resolve the per-call options of ``config``; nothing is stored on the shared seeder."""
+        backend = getattr(config, "cache_backend", "files")
+        if backend not in SEEDER_CACHE_BACKENDS:
+            raise ValueError(
+                f"Invalid cache_backend '{backend}'. Valid backends are: {', '.join(SEEDER_CACHE_BACKENDS)}")
+        db_cache = None
+        if backend == "sqlite":
+            if self._sqlite_cache is None:
+                # Opening the database also evicts expired rows
+                cache = await asyncio.to_thread(
+                    SQLiteSeederCache, self.cache_root / "seeder_cache.db", ttl=self.ttl)
+                if self._sqlite_cache is None:
+                    self._sqlite_cache = cache
+                else:
+                    await cache.close()
+            db_cache = self._sqlite_cache
+        return _SeedingCall(
+            db_cache=db_cache,
+            stream_sitemaps=getattr(config, "stream_sitemaps", True),
+            force=bool(config.force),
+        )
+
     def _cache_path(self, kind: str, url: str) -> Path:
         h = hashlib.sha1(url.encode()).hexdigest()
         return self.cache_root / kind / f"{h}.json"
 
-    async def _cache_get(self, kind: str, url: str) -> Optional[Dict[str, Any]]:
+    async def _cache_get(self, kind: str, url: str, call: _SeedingCall) -> Optional[Dict[str, Any]]:
+        if call.db_cache is not None:
+            return await call.db_cache.get(kind, url)
         p = self._cache_path(kind, url)
         if not p.exists():
             return None
@@ -255,13 +593,61 @@ class AsyncUrlSeeder:
         except Exception:
             return None
 
-    async def _cache_set(self, kind: str, url: str, data: Dict[str, Any]) -> None:
+    async def _cache_set(self, kind: str, url: str, data: Dict[str, Any], call: _SeedingCall) -> None:
+        if call.db_cache is not None:
+            await call.db_cache.set(kind, url, data)
+            return
         try:
             async with aiofiles.open(self._cache_path(kind, url), "w") as f:
                 await f.write(json.dumps(data, separators=(",", ":")))
         except Exception:
             pass
 
+    async def _url_list_cached(self, path: Path, call: _SeedingCall) -> bool:
+        """Whether the discovered-URL list for ``path`` is in the cache."""
+        if call.db_cache is not None:
+            return await call.db_cache.has_list(path.name)
+        return path.exists()
+
+    async def _iter_url_list(self, path: Path, call: _SeedingCall) -> AsyncIterator[str]:
+        if call.db_cache is not None:
+            async for url in call.db_cache.iter_list(path.name):
+                yield url
+            return
+        async with aiofiles.open(path, "r") as fp:
+            async for line in fp:
+                yield line.strip()
+
+    @asynccontextmanager
+    async def _url_list_writer(self, path: Path, call: _SeedingCall):
+        """Yield an async ``write(url)`` that records a discovered-URL list for ``path``."""
+        cache = call.db_cache
+        if cache is None:
+            async with aiofiles.open(path, "w") as fp:
+                async def write(url: str):
+                    await fp.write(url + "\n")
+                yield write
+            return
+
+        name = path.name
+        buf: List[str] = []
+        count = 0
+
+        async def write(url: str):
+            nonlocal count
+            buf.append(url)
+            if len(buf) >= 1000:
+                await cache.extend_list(name, count, buf[:])
+                count += len(buf)
+                buf.clear()
+
+        await cache.start_list(name)
+        yield write
+        # Only reached when the list was read to the end
+        if buf:
+            await cache.extend_list(name, count, buf)
+        await cache.finish_list(name)
+
     # ─────────────────────────────── discovery entry
 
     async def urls(self,
@@ -278,6 +664,99 @@ class AsyncUrlSeeder:
         config : SeedingConfig
             Configuration object containing all seeding parameters
         """
+        extract_head = config.extract_head
+        max_urls = config.max_urls if config.max_urls is not None else -1
+        query = config.query
+        score_threshold = config.score_threshold
+        scoring_method = config.scoring_method
+
+        results: List[Dict[str, Any]] = [
+            entry async for entry in self._iter_validated(domain, config)
+        ]
+
+        self._log("info", "Finished URL seeding for {domain}. Total URLs: {count}",
+                  params={"domain": domain, "count": len(results)}, tag="URL_SEED")
+
+        # Apply BM25 scoring if query was provided
+        if query and extract_head and scoring_method == "bm25":
+            # Apply collective BM25 scoring across all documents
+            results = await self._apply_bm25_scoring(results, config)
+            
+            # Filter by score threshold if specified
+            if score_threshold is not None:
+                original_count = len(results)
+                results = [r for r in results if r.get("relevance_score", 0) >= score_threshold]
+                if original_count > len(results):
+                    self._log("info", "Filtered {filtered} URLs below score threshold {threshold}",
+                              params={"filtered": original_count - len(results), "threshold": score_threshold}, tag="URL_SEED")
+            
+            # Sort by relevance score
+            results.sort(key=lambda x: x.get("relevance_score", 0.0), reverse=True)
+            self._log("info", "Sorted {count} URLs by relevance score for query: '{query}'",
+                      params={"count": len(results), "query": query}, tag="URL_SEED")
+        elif query and not extract_head:
+            self._log(
+                "warning", "Query provided but extract_head is False. Enable extract_head for relevance scoring.", tag="URL_SEED")
+
+        return results[:max_urls] if max_urls > 0 else results
+
+    async def stream_urls(self,
+                          domain: str,
+                          config: "SeedingConfig",
+                          ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Async-iterator variant of ``urls()``.
+
+        Yields each entry as soon as it has been validated instead of waiting
+        for the whole domain, so a consumer such as ``arun_many`` can start
+        crawling right away. With a query and ``extract_head=True`` every
+        entry is scored on arrival by an ``IncrementalBM25`` over the running
+        corpus and dropped if it falls below ``score_threshold``. Results come
+        in discovery order, not sorted by score.
+
+        Usage
+        -----
+        async for entry in seeder.stream_urls("example.com", config):
+            print(entry["url"], entry.get("relevance_score"))
+        """
+        max_urls = config.max_urls if config.max_urls is not None else -1
+        query = config.query
+        score_threshold = config.score_threshold
+        scorer = None
+        if query and config.extract_head and config.scoring_method == "bm25":
+            scorer = IncrementalBM25(query)
+        elif query and not config.extract_head:
+            self._log(
+                "warning", "Query provided but extract_head is False. Enable extract_head for relevance scoring.", tag="URL_SEED")
+
+        count = 0
+        entries = self._iter_validated(domain, config)
+        try:
+            async for entry in entries:
+                if scorer is not None:
+                    if entry.get("status") == "valid":
+                        text_context = self._extract_text_context(entry["head_data"]) if entry.get("head_data") else ""
+                        if text_context:
+                            entry["relevance_score"] = scorer.add(text_context)
+                        else:
+                            # Use URL-based scoring as fallback
+                            entry["relevance_score"] = float(
+                                self._calculate_url_relevance_score(query, entry["url"]))
+                    if score_threshold is not None and entry.get("relevance_score", 0) < score_threshold:
+                        continue
+                yield entry
+                count += 1
+                if max_urls > 0 and count >= max_urls:
+                    break
+        finally:
+            # Stop discovery/validation right away rather than at garbage collection
+            await entries.aclose()
+
+    async def _iter_validated(self,
+                              domain: str,
+                              config: "SeedingConfig",
+                              ) -> AsyncIterator[Dict[str, Any]]:
+        """Discover URLs for ``domain`` and yield each one once it has been validated."""
         # Extract parameters from config
         pattern = config.pattern or "*"
         source = config.source
@@ -286,7 +765,7 @@ class AsyncUrlSeeder:
         concurrency = config.concurrency
         head_timeout = 5  # Default timeout for HEAD requests
         hits_per_sec = config.hits_per_sec
-        self.force = config.force  # Store force flag as instance attribute
+        call = await self._seeding_call(config)
         force = config.force
         verbose = config.verbose if config.verbose is not None else (
             self.logger.verbose if self.logger else False)
@@ -311,15 +790,7 @@ class AsyncUrlSeeder:
                 raise ValueError(
                     f"Invalid source '{s}'. Valid sources are: {', '.join(valid_sources)}")
 
-        if hits_per_sec:
-            if hits_per_sec <= 0:
-                self._log(
-                    "warning", "hits_per_sec must be positive. Disabling rate limiting.", tag="URL_SEED")
-                self._rate_sem = None
-            else:
-                self._rate_sem = asyncio.Semaphore(hits_per_sec)
-        else:
-            self._rate_sem = None  # Ensure it's None if no rate limiting
+        self._set_rate_limit(hits_per_sec)
 
         self._log("info", "Starting URL seeding for {domain} with source={source}",
                   params={"domain": domain, "source": source}, tag="URL_SEED")
@@ -328,23 +799,38 @@ class AsyncUrlSeeder:
         async def gen():
             if "sitemap" in sources:
                 self._log("debug", "Fetching from sitemaps...", tag="URL_SEED")
-                async for u in self._from_sitemaps(domain, pattern, force):
+                async for u in self._from_sitemaps(domain, pattern, call):
                     yield u
             if "cc" in sources:
                 self._log("debug", "Fetching from Common Crawl...",
                           tag="URL_SEED")
-                async for u in self._from_cc(domain, pattern, force):
+                async for u in self._from_cc(domain, pattern, call):
                     yield u
 
         # Use bounded queue to prevent RAM spikes with large domains
         queue_size = min(10000, max(1000, concurrency * 100))  # Dynamic size based on concurrency
         queue = asyncio.Queue(maxsize=queue_size)
+        # Validated entries on their way to the consumer; bounded so a slow
+        # consumer applies backpressure to the workers
+        out = asyncio.Queue(maxsize=queue_size)
         producer_done = asyncio.Event()
         stop_event = asyncio.Event()
         seen: set[str] = set()
         filter_nonsense = config.filter_nonsense_urls  # Extract this for passing to workers
+        found = 0
+        # With the SQLite cache, look URLs up in bulk before workers ask for them one by one
+        db_cache = call.db_cache
+        prefetch = db_cache is not None and not force and (live_check or extract_head)
+        cache_kind = "head" if extract_head else "live"
+
+        async def enqueue(batch: List[str]):
+            if prefetch:
+                await db_cache.prefetch(cache_kind, batch)
+            for u in batch:
+                await queue.put(u)  # Will block if queue is full, providing backpressure
 
         async def producer():
+            batch: List[str] = []
             try:
                 async for u in gen():
                     if u in seen:
@@ -356,7 +842,12 @@ class AsyncUrlSeeder:
                             "info", "Producer stopping due to max_urls limit.", tag="URL_SEED")
                         break
                     seen.add(u)
-                    await queue.put(u)  # Will block if queue is full, providing backpressure
+                    batch.append(u)
+                    if not prefetch or len(batch) >= 256:
+                        await enqueue(batch)
+                        batch = []
+                if batch and not stop_event.is_set():
+                    await enqueue(batch)
             except Exception as e:
                 self._log("error", "Producer encountered an error: {error}", params={
                           "error": str(e)}, tag="URL_SEED")
@@ -364,7 +855,8 @@ class AsyncUrlSeeder:
                 producer_done.set()
                 self._log("debug", "Producer finished.", tag="URL_SEED")
 
-        async def worker(res_list: List[Dict[str, Any]]):
+        async def worker():
+            nonlocal found
             while True:
                 if queue.empty() and producer_done.is_set():
                     # self._log("debug", "Worker exiting: queue empty and producer done.", tag="URL_SEED")
@@ -379,7 +871,7 @@ class AsyncUrlSeeder:
                               "error": str(e)}, tag="URL_SEED")
                     continue
 
-                if max_urls > 0 and len(res_list) >= max_urls:
+                if max_urls > 0 and found >= max_urls:
                     self._log(
                         "info",
                         "Worker stopping due to max_urls limit.",
@@ -400,52 +892,58 @@ class AsyncUrlSeeder:
                             break
                     break
 
-                if self._rate_sem:  # global QPS control
-                    async with self._rate_sem:
-                        await self._validate(url, res_list, live_check, extract_head,
-                                             head_timeout, verbose, query, score_threshold, scoring_method,
-                                             filter_nonsense)
-                else:
-                    await self._validate(url, res_list, live_check, extract_head,
-                                         head_timeout, verbose, query, score_threshold, scoring_method,
-                                         filter_nonsense)
+                entries: List[Dict[str, Any]] = []
+                await self._validate(url, entries, live_check, extract_head,
+                                     head_timeout, verbose, query, score_threshold, scoring_method,
+                                     filter_nonsense, call)
+                for entry in entries:
+                    found += 1
+                    await out.put(entry)
                 queue.task_done()  # Mark task as done for queue.join() if ever used
 
+        async def run():
+            try:
+                # Wait for all workers to finish
+                await asyncio.gather(prod_task, *workers)
+                await queue.join()  # Ensure all queued items are processed
+            finally:
+                await out.put(None)
+
         # launch
-        results: List[Dict[str, Any]] = []
         prod_task = asyncio.create_task(producer())
-        workers = [asyncio.create_task(worker(results))
+        workers = [asyncio.create_task(worker())
                    for _ in range(concurrency)]
+        runner = asyncio.create_task(run())
 
-        # Wait for all workers to finish
-        await asyncio.gather(prod_task, *workers)
-        await queue.join()  # Ensure all queued items are processed
-
-        self._log("info", "Finished URL seeding for {domain}. Total URLs: {count}",
-                  params={"domain": domain, "count": len(results)}, tag="URL_SEED")
-
-        # Apply BM25 scoring if query was provided
-        if query and extract_head and scoring_method == "bm25":
-            # Apply collective BM25 scoring across all documents
-            results = await self._apply_bm25_scoring(results, config)
-            
-            # Filter by score threshold if specified
-            if score_threshold is not None:
-                original_count = len(results)
-                results = [r for r in results if r.get("relevance_score", 0) >= score_threshold]
-                if original_count > len(results):
-                    self._log("info", "Filtered {filtered} URLs below score threshold {threshold}",
-                              params={"filtered": original_count - len(results), "threshold": score_threshold}, tag="URL_SEED")
-            
-            # Sort by relevance score
-            results.sort(key=lambda x: x.get("relevance_score", 0.0), reverse=True)
-            self._log("info", "Sorted {count} URLs by relevance score for query: '{query}'",
-                      params={"count": len(results), "query": query}, tag="URL_SEED")
-        elif query and not extract_head:
-            self._log(
-                "warning", "Query provided but extract_head is False. Enable extract_head for relevance scoring.", tag="URL_SEED")
-
-        return results[:max_urls] if max_urls > 0 else results
+        try:
+            while True:
+                entry = await out.get()
+                if entry is None:
+                    break
+                yield entry
+            await runner
+        finally:
+            # Consumer stopped early: shut the pipeline down
+            if not runner.done():
+                stop_event.set()
+                tasks = [prod_task, *workers, runner]
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            if db_cache is not None:
+                await db_cache.flush()
+
+    def _set_rate_limit(self, hits_per_sec: Optional[float]) -> None:
+        """Install a per-host token bucket for ``hits_per_sec`` (kept across calls with the same rate)."""
+        if hits_per_sec:
+            if hits_per_sec <= 0:
+                self._log(
+                    "warning", "hits_per_sec must be positive. Disabling rate limiting.", tag="URL_SEED")
+                self._rate_limiter = None
+            elif self._rate_limiter is None or self._rate_limiter.rate != hits_per_sec:
+                self._rate_limiter = HostRateLimiter(hits_per_sec)
+        else:
+            self._rate_limiter = None  # Ensure it's None if no rate limiting
 
     async def many_urls(
         self,
@@ -482,6 +980,53 @@ class AsyncUrlSeeder:
             "info", "Finished URL seeding for multiple domains.", tag="URL_SEED")
         return final_results
 
+    async def stream_many_urls(
+        self,
+        domains: Sequence[str],
+        config: "SeedingConfig",
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Async-iterator variant of ``many_urls()``.
+
+        Seeds all domains in parallel and yields ``(domain, entry)`` pairs as
+        soon as any domain produces a validated URL. See ``stream_urls``.
+        """
+        self._log("info", "Starting URL seeding for {count} domains...",
+                  params={"count": len(domains)}, tag="URL_SEED")
+
+        # Ensure seeder's logger verbose matches the config's verbose if it's set
+        if self.logger and hasattr(self.logger, 'verbose') and config.verbose is not None:
+            self.logger.verbose = config.verbose
+
+        out: asyncio.Queue = asyncio.Queue(maxsize=10000)
+
+        async def pump(domain: str):
+            try:
+                async for entry in self.stream_urls(domain, config):
+                    await out.put((domain, entry))
+            except Exception as e:
+                self._log("error", "URL seeding failed for {domain}: {error}",
+                          params={"domain": domain, "error": str(e)}, tag="URL_SEED")
+            finally:
+                await out.put(None)
+
+        tasks = [asyncio.create_task(pump(domain)) for domain in domains]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await out.get()
+                if item is None:
+                    remaining -= 1
+                else:
+                    yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        self._log(
+            "info", "Finished URL seeding for multiple domains.", tag="URL_SEED")
+
     async def extract_head_for_urls(
         self,
         urls: List[str],
@@ -529,14 +1074,10 @@ class AsyncUrlSeeder:
                   params={"count": len(urls)}, tag="URL_SEED")
         
         # Setup rate limiting if specified in config
-        if config.hits_per_sec:
-            if config.hits_per_sec <= 0:
-                self._log("warning", "hits_per_sec must be positive. Disabling rate limiting.", tag="URL_SEED")
-                self._rate_sem = None
-            else:
-                self._rate_sem = asyncio.Semaphore(config.hits_per_sec)
-        else:
-            self._rate_sem = None
+        self._set_rate_limit(config.hits_per_sec)
+        call = await self._seeding_call(config)
+        if call.db_cache is not None and not call.force:
+            await call.db_cache.prefetch("head", list(dict.fromkeys(urls)))
         
         # Use bounded queue to prevent memory issues with large URL lists
         queue_size = min(10000, max(1000, concurrency * 100))
@@ -585,7 +1126,8 @@ class AsyncUrlSeeder:
                         query=config.query,
                         score_threshold=config.score_threshold,
                         scoring_method=config.scoring_method or "bm25",
-                        filter_nonsense=config.filter_nonsense_urls
+                        filter_nonsense=config.filter_nonsense_urls,
+                        call=call,
                     )
                 except Exception as e:
                     self._log("error", "Failed to process URL {url}: {error}",
@@ -622,6 +1164,9 @@ class AsyncUrlSeeder:
         # Wait for workers to finish canceling
         await asyncio.gather(*worker_tasks, return_exceptions=True)
         
+        if call.db_cache is not None:
+            await call.db_cache.flush()
+
         # Apply BM25 scoring if query is provided
         if config.query and config.scoring_method == "bm25":
             results = await self._apply_bm25_scoring(results, config)
@@ -706,7 +1251,7 @@ class AsyncUrlSeeder:
             return None
 
     # ─────────────────────────────── CC
-    async def _from_cc(self, domain: str, pattern: str, force: bool):
+    async def _from_cc(self, domain: str, pattern: str, call: _SeedingCall):
         import re
         digest = hashlib.md5(pattern.encode()).hexdigest()[:8]
 
@@ -718,14 +1263,12 @@ class AsyncUrlSeeder:
         safe = re.sub('[/?#]+', '_', raw)
         path = self.cache_dir / f"{self.index_id}_{safe}_{digest}.jsonl"
 
-        if path.exists() and not force:
+        if not call.force and await self._url_list_cached(path, call):
             self._log("info", "Loading CC URLs for {domain} from cache: {path}",
                       params={"domain": domain, "path": path}, tag="URL_SEED")
-            async with aiofiles.open(path, "r") as fp:
-                async for line in fp:
-                    url = line.strip()
-                    if _match(url, pattern):
-                        yield url
+            async for url in self._iter_url_list(path, call):
+                if _match(url, pattern):
+                    yield url
             return
 
         # build CC glob – if a path is present keep it, else add trailing /*
@@ -739,11 +1282,11 @@ class AsyncUrlSeeder:
             try:
                 async with self.client.stream("GET", url) as r:
                     r.raise_for_status()
-                    async with aiofiles.open(path, "w") as fp:
+                    async with self._url_list_writer(path, call) as write:
                         async for line in r.aiter_lines():
                             rec = json.loads(line)
                             u = rec["url"]
-                            await fp.write(u+"\n")
+                            await write(u)
                             if _match(u, pattern):
                                 yield u
                 return
@@ -762,7 +1305,7 @@ class AsyncUrlSeeder:
                 raise
 
     # ─────────────────────────────── Sitemaps
-    async def _from_sitemaps(self, domain: str, pattern: str, force: bool = False):
+    async def _from_sitemaps(self, domain: str, pattern: str, call: _SeedingCall):
         """
         1. Probe default sitemap locations.
         2. If none exist, parse robots.txt for alternative sitemap URLs.
@@ -775,14 +1318,12 @@ class AsyncUrlSeeder:
         digest = hashlib.md5(pattern.encode()).hexdigest()[:8]
         path = self.cache_dir / f"sitemap_{host}_{digest}.jsonl"
 
-        if path.exists() and not force:
+        if not call.force and await self._url_list_cached(path, call):
             self._log("info", "Loading sitemap URLs for {d} from cache: {p}",
                       params={"d": host, "p": str(path)}, tag="URL_SEED")
-            async with aiofiles.open(path, "r") as fp:
-                async for line in fp:
-                    url = line.strip()
-                    if _match(url, pattern):
-                        yield url
+            async for url in self._iter_url_list(path, call):
+                if _match(url, pattern):
+                    yield url
             return
 
         # 1️⃣ direct sitemap probe
@@ -797,9 +1338,9 @@ class AsyncUrlSeeder:
                 if sm:
                     self._log("info", "Found sitemap at {url}", params={
                               "url": sm}, tag="URL_SEED")
-                    async with aiofiles.open(path, "w") as fp:
-                        async for u in self._iter_sitemap(sm):
-                            await fp.write(u + "\n")
+                    async with self._url_list_writer(path, call) as write:
+                        async for u in self._iter_sitemap(sm, call.stream_sitemaps):
+                            await write(u)
                             if _match(u, pattern):
                                 yield u
                     return
@@ -820,14 +1361,19 @@ class AsyncUrlSeeder:
             return
 
         if sitemap_lines:
-            async with aiofiles.open(path, "w") as fp:
+            async with self._url_list_writer(path, call) as write:
                 for sm in sitemap_lines:
-                    async for u in self._iter_sitemap(sm):
-                        await fp.write(u + "\n")
+                    async for u in self._iter_sitemap(sm, call.stream_sitemaps):
+                        await write(u)
                         if _match(u, pattern):
                             yield u
 
-    async def _iter_sitemap(self, url: str):
+    async def _iter_sitemap(self, url: str, stream: bool = True):
+        if LXML and stream:
+            async for u in self._iter_sitemap_stream(url):
+                yield u
+            return
+
         try:
             r = await self.client.get(url, timeout=15, follow_redirects=True)
             r.raise_for_status()
@@ -958,54 +1504,150 @@ class AsyncUrlSeeder:
 
         # Process based on type
         if is_sitemap_index and sub_sitemaps:
-            self._log("info", "Processing sitemap index with {count} sub-sitemaps in parallel",
-                      params={"count": len(sub_sitemaps)}, tag="URL_SEED")
-
-            # Create a bounded queue for results to prevent RAM issues
-            # For sitemap indexes, use a larger queue as we expect many URLs
-            queue_size = min(50000, len(sub_sitemaps) * 1000)  # Estimate 1000 URLs per sitemap
-            result_queue = asyncio.Queue(maxsize=queue_size)
-            completed_count = 0
-            total_sitemaps = len(sub_sitemaps)
+            async for u in self._iter_sub_sitemaps(sub_sitemaps, stream):
+                yield u
+        else:
+            # Regular sitemap - yield URLs directly
+            for u in regular_urls:
+                yield u
 
-            async def process_subsitemap(sitemap_url: str):
+    async def _iter_sitemap_stream(self, url: str):
+        """
+        Incremental variant of ``_iter_sitemap``.
+
+        Streams the response, gunzips it on the fly and feeds it to an lxml
+        pull parser, yielding each ``<url><loc>`` as soon as its element closes
+        and clearing parsed elements, so memory stays flat for 50 MB sitemaps
+        and URLs reach the ``urls()`` workers after the first few KB.
+        Sub-sitemaps listed by a sitemap index are processed in parallel once
+        the index itself has been read.
+        """
+        sub_sitemaps: List[str] = []
+        url_count = 0
+        try:
+            async with self.client.stream("GET", url, timeout=15, follow_redirects=True) as r:
+                r.raise_for_status()
+                base_url = str(r.url)
+                parser = etree.XMLPullParser(events=("end",), recover=True, huge_tree=True)
+                inflator = None
+                first = True
+
+                async for chunk in r.aiter_bytes(65_536):
+                    if first:
+                        first = False
+                        # .gz sitemaps are usually served as application/gzip, so
+                        # httpx hands us the compressed bytes
+                        if chunk[:2] == b"\x1f\x8b":
+                            inflator = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                    if inflator is not None:
+                        chunk = inflator.decompress(chunk)
+                    parser.feed(chunk)
+
+                    for _, elem in parser.read_events():
+                        if not isinstance(elem.tag, str):
+                            continue
+                        name = etree.QName(elem).localname
+                        if name == "loc":
+                            parent = elem.getparent()
+                            kind = etree.QName(parent).localname if parent is not None else None
+                            raw = (elem.text or "").strip()
+                            loc = urljoin(base_url, raw) if raw else None
+                            if not loc:
+                                continue
+                            if kind == "sitemap":
+                                sub_sitemaps.append(loc)
+                            elif kind == "url":
+                                url_count += 1
+                                yield loc
+                        elif name in ("url", "sitemap"):
+                            # Drop the finished entry and any siblings before it
+                            elem.clear()
+                            while elem.getprevious() is not None:
+                                del elem.getparent()[0]
+
+                if inflator is not None:
+                    parser.feed(inflator.flush())
                 try:
-                    self._log(
-                        "debug", "Processing sub-sitemap: {url}", params={"url": sitemap_url}, tag="URL_SEED")
-                    # Recursively process sub-sitemap
-                    async for u in self._iter_sitemap(sitemap_url):
-                        await result_queue.put(u)  # Will block if queue is full
-                except Exception as e:
-                    self._log("error", "Error processing sub-sitemap {url}: {error}",
-                              params={"url": sitemap_url, "error": str(e)}, tag="URL_SEED")
-                finally:
-                    # Put sentinel to signal completion
-                    await result_queue.put(None)
+                    parser.close()
+                except etree.XMLSyntaxError:
+                    pass
+        except httpx.HTTPStatusError as e:
+            self._log("warning", "Failed to fetch sitemap {url}: HTTP {status_code}",
+                      params={"url": url, "status_code": e.response.status_code}, tag="URL_SEED")
+            return
+        except httpx.RequestError as e:
+            self._log("warning", "Network error fetching sitemap {url}: {error}",
+                      params={"url": url, "error": str(e)}, tag="URL_SEED")
+            return
+        except Exception as e:
+            self._log("error", "Streaming parse error for sitemap {url}: {error}",
+                      params={"url": url, "error": str(e)}, tag="URL_SEED")
+            return
 
-            # Start all tasks
-            tasks = [asyncio.create_task(process_subsitemap(sm))
-                     for sm in sub_sitemaps]
+        self._log(
+            "debug",
+            "Streamed sitemap {url}: {sitemap_count} sitemap entries, {url_count} url entries discovered",
+            params={"url": url, "sitemap_count": len(sub_sitemaps), "url_count": url_count},
+            tag="URL_SEED",
+        )
+
+        if sub_sitemaps:
+            async for u in self._iter_sub_sitemaps(sub_sitemaps):
+                yield u
+        elif not url_count:
+            self._log(
+                "warning",
+                "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
+                params={"url": url},
+                tag="URL_SEED",
+            )
 
-            # Yield results as they come in
-            while completed_count < total_sitemaps:
-                item = await result_queue.get()
-                if item is None:
-                    completed_count += 1
-                else:
-                    yield item
+    async def _iter_sub_sitemaps(self, sub_sitemaps: List[str], stream: bool = True):
+        """Process the sub-sitemaps of a sitemap index in parallel, yielding URLs as they arrive."""
+        self._log("info", "Processing sitemap index with {count} sub-sitemaps in parallel",
+                  params={"count": len(sub_sitemaps)}, tag="URL_SEED")
 
-            # Ensure all tasks are done
-            await asyncio.gather(*tasks, return_exceptions=True)
-        else:
-            # Regular sitemap - yield URLs directly
-            for u in regular_urls:
-                yield u
+        # Create a bounded queue for results to prevent RAM issues
+        # For sitemap indexes, use a larger queue as we expect many URLs
+        queue_size = min(50000, len(sub_sitemaps) * 1000)  # Estimate 1000 URLs per sitemap
+        result_queue = asyncio.Queue(maxsize=queue_size)
+        completed_count = 0
+        total_sitemaps = len(sub_sitemaps)
+
+        async def process_subsitemap(sitemap_url: str):
+            try:
+                self._log(
+                    "debug", "Processing sub-sitemap: {url}", params={"url": sitemap_url}, tag="URL_SEED")
+                # Recursively process sub-sitemap
+                async for u in self._iter_sitemap(sitemap_url, stream):
+                    await result_queue.put(u)  # Will block if queue is full
+            except Exception as e:
+                self._log("error", "Error processing sub-sitemap {url}: {error}",
+                          params={"url": sitemap_url, "error": str(e)}, tag="URL_SEED")
+            finally:
+                # Put sentinel to signal completion
+                await result_queue.put(None)
+
+        # Start all tasks
+        tasks = [asyncio.create_task(process_subsitemap(sm))
+                 for sm in sub_sitemaps]
+
+        # Yield results as they come in
+        while completed_count < total_sitemaps:
+            item = await result_queue.get()
+            if item is None:
+                completed_count += 1
+            else:
+                yield item
+
+        # Ensure all tasks are done
+        await asyncio.gather(*tasks, return_exceptions=True)
 
     # ─────────────────────────────── validate helpers
     async def _validate(self, url: str, res_list: List[Dict[str, Any]], live: bool,
                         extract: bool, timeout: int, verbose: bool, query: Optional[str] = None,
                         score_threshold: Optional[float] = None, scoring_method: str = "bm25",
-                        filter_nonsense: bool = True):
+                        filter_nonsense: bool = True, call: Optional[_SeedingCall] = None):
         # Local verbose parameter for this function is used to decide if intermediate logs should be printed
         # The main logger's verbose status should be controlled by the caller.
         
@@ -1015,15 +1657,20 @@ class AsyncUrlSeeder:
                       params={"url": url}, tag="URL_SEED")
             return
 
+        call = call or _SeedingCall()
         cache_kind = "head" if extract else "live"
 
         # ---------- try cache ----------
-        if not (hasattr(self, 'force') and self.force):
-            cached = await self._cache_get(cache_kind, url)
+        if not call.force:
+            cached = await self._cache_get(cache_kind, url, call)
             if cached:
                 res_list.append(cached)
                 return
 
+        # Per-host QPS control, applied only to requests that hit the network
+        if self._rate_limiter and (live or extract):
+            await self._rate_limiter.acquire(url)
+
         if extract:
             self._log("debug", "Fetching head for {url}", params={
                       "url": url}, tag="URL_SEED")
@@ -1053,7 +1700,7 @@ class AsyncUrlSeeder:
 
         # Add entry to results (scoring will be done later)
         if live or extract:
-            await self._cache_set(cache_kind, url, entry)
+            await self._cache_set(cache_kind, url, entry, call)
         res_list.append(entry)
 
     async def _head_ok(self, url: str, timeout: int) -> bool:
@@ -1082,108 +1729,16 @@ class AsyncUrlSeeder:
         max_redirects: int = 5,
         max_bytes: int = 65_536,  # stop after 64 kB even if </head> never comes
         chunk_size: int = 4096,       # how much we read per await
-    ):
-        for _ in range(max_redirects+1):
-            try:
-                # ask the first `max_bytes` and force plain text to avoid
-                # partial-gzip decode headaches
-                async with self.client.stream(
-                    "GET",
-                    url,
-                    timeout=timeout,
-                    headers={
-                        # "Range": f"bytes=0-{max_bytes-1}", # Dropped the Range header – no need now, and some servers ignore it. We still keep an upper‐bound max_bytes as a fail-safe.
-                        "Accept-Encoding": "identity",
-                    },
-                    follow_redirects=False,
-                ) as r:
-
-                    if r.status_code in (301, 302, 303, 307, 308):
-                        location = r.headers.get("Location")
-                        if location:
-                            url = urljoin(url, location)
-                            self._log("debug", "Redirecting from {original_url} to {new_url}",
-                                      params={"original_url": r.url, "new_url": url}, tag="URL_SEED")
-                            continue
-                        else:
-                            self._log("warning", "Redirect status {status_code} but no Location header for {url}",
-                                      params={"status_code": r.status_code, "url": r.url}, tag="URL_SEED")
-                            # Return original URL if no new location
-                            return False, "", str(r.url)
-
-                    # For 2xx or other non-redirect codes, proceed to read content
-                    # Only allow successful codes, or continue
-                    if not (200 <= r.status_code < 400):
-                        self._log("warning", "Non-success status {status_code} when fetching head for {url}",
-                                  params={"status_code": r.status_code, "url": r.url}, tag="URL_SEED")
-                        return False, "", str(r.url)
-
-                    buf = bytearray()
-                    async for chunk in r.aiter_bytes(chunk_size):
-                        buf.extend(chunk)
-                        low = buf.lower()
-                        if b"</head>" in low or len(buf) >= max_bytes:
-                            await r.aclose()
-                            break
-
-                    enc = r.headers.get("Content-Encoding", "").lower()
-                    try:
-                        if enc == "gzip" and buf[:2] == b"\x1f\x8b":
-                            buf = gzip.decompress(buf)
-                        elif enc == "br" and HAS_BROTLI and buf[:4] == b"\x8b\x6c\x0a\x1a":
-                            buf = brotli.decompress(buf)
-                        elif enc in {"gzip", "br"}:
-                            # Header says “gzip” or “br” but payload is plain – ignore
-                            self._log(
-                                "debug",
-                                "Skipping bogus {encoding} for {url}",
-                                params={"encoding": enc, "url": r.url},
-                                tag="URL_SEED",
-                            )
-                    except Exception as e:
-                        self._log(
-                            "warning",
-                            "Decompression error for {url} ({encoding}): {error}",
-                            params={"url": r.url,
-                                    "encoding": enc, "error": str(e)},
-                            tag="URL_SEED",
-                        )
-                        # fall through with raw buf
-
-                    # Find the </head> tag case-insensitively and decode
-                    idx = buf.lower().find(b"</head>")
-                    if idx == -1:
-                        self._log("debug", "No </head> tag found in initial bytes of {url}",
-                                  params={"url": r.url}, tag="URL_SEED")
-                        # If no </head> is found, take a reasonable chunk or all if small
-                        # Take max 10KB if no head tag
-                        html_bytes = buf if len(buf) < 10240 else buf[:10240]
-                    else:
-                        html_bytes = buf[:idx+7]  # Include </head> tag
-
-                    try:
-                        html = html_bytes.decode("utf-8", "replace")
-                    except Exception as e:
-                        self._log(
-                            "warning",
-                            "Failed to decode head content for {url}: {error}",
-                            params={"url": r.url, "error": str(e)},
-                            tag="URL_SEED",
-                        )
-                        html = html_bytes.decode("latin-1", "replace")
-
-                    # Return the actual URL after redirects
-                    return True, html, str(r.url)
-
-            except httpx.RequestError as e:
-                self._log("debug", "Fetch head network error for {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return False, "", url
-
-        # If loop finishes without returning (e.g. too many redirects)
-        self._log("warning", "Exceeded max redirects ({max_redirects}) for {url}",
-                  params={"max_redirects": max_redirects, "url": url}, tag="URL_SEED")
-        return False, "", url
+    ) -> HeadResult:
+        """Fetch the <head> of ``url`` via the shared HeadFetcher. Returns (ok, html, final_url)."""
+        return await self.head_fetcher.fetch(
+            url,
+            timeout=timeout,
+            max_redirects=max_redirects,
+            max_bytes=max_bytes,
+            chunk_size=chunk_size,
+            force=getattr(self, "force", False),
+        )
 
     # ─────────────────────────────── BM25 scoring helpers
     def _extract_text_context(self, head_data: Dict[str, Any]) -> str:
@@ -1475,6 +2030,11 @@ class AsyncUrlSeeder:
         if self._owns_client and self.client:
             await self.client.aclose()
             self._log("debug", "Closed HTTP client", tag="URL_SEED")
+        if self._owns_head_fetcher:
+            await self.head_fetcher.close()
+        if self._sqlite_cache is not None:
+            await self._sqlite_cache.close()
+            self._sqlite_cache = None
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -379,6 +379,8 @@ class AsyncWebCrawler:
                     # Add captured network and console data if available
                     crawl_result.network_requests = async_response.network_requests
                     crawl_result.console_messages = async_response.console_messages
+                    crawl_result.resource_blocking_stats = async_response.resource_blocking_stats
+                    crawl_result.page_timings = async_response.page_timings
 
                     crawl_result.success = bool(html)
                     crawl_result.session_id = getattr(
@@ -1,6 +1,6 @@
 import asyncio
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 import os
 import sys
 import shutil
@@ -11,6 +11,7 @@ import subprocess
 import shlex
 from playwright.async_api import BrowserContext
 import hashlib
+import weakref
 from .js_snippet import load_js_script
 from .config import DOWNLOAD_PAGE_TIMEOUT
 from .async_configs import BrowserConfig, CrawlerRunConfig
@@ -611,6 +612,12 @@ class BrowserManager:
         # Keep track of contexts by a "config signature," so each unique config reuses a single context
         self.contexts_by_config = {}
         self._contexts_lock = asyncio.Lock()
+
+        # Warm pages per context signature, reused by release_page/get_page.
+        # _page_leases tracks every poolable page handed out:
+        # page -> [signature, crawls served, viewport at creation]
+        self._page_pool: Dict[str, List] = {}
+        self._page_leases = weakref.WeakKeyDictionary()
         
         # Serialize context.new_page() across concurrent tasks to avoid races
         # when using a shared persistent context (context.pages may be empty
@@ -998,35 +1005,31 @@ class BrowserManager:
         Converts the crawlerRunConfig into a dict, excludes ephemeral fields,
         then returns a hash of the sorted JSON. This yields a stable signature
         that identifies configurations requiring a unique browser context.
+
+        The hash is memoized on the config object; CrawlerRunConfig drops it
+        whenever a field outside CONTEXT_IRRELEVANT_FIELDS is reassigned.
         """
         import json
 
-        config_dict = crawlerRunConfig.__dict__.copy()
+        signature_hash = crawlerRunConfig.__dict__.get("_context_signature")
+        if signature_hash is not None:
+            return signature_hash
+
         # Exclude items that do not affect browser-level setup.
         # Expand or adjust as needed, e.g. chunking_strategy is purely for data extraction, not for browser config.
-        ephemeral_keys = [
-            "session_id",
-            "js_code",
-            "scraping_strategy",
-            "extraction_strategy",
-            "chunking_strategy",
-            "cache_mode",
-            "content_filter",
-            "semaphore_count",
-            "url"
-        ]
-        
         # Do NOT exclude locale, timezone_id, or geolocation as these DO affect browser context
         # and should cause a new context to be created if they change
-        
-        for key in ephemeral_keys:
-            if key in config_dict:
-                del config_dict[key]
+        config_dict = {
+            key: value
+            for key, value in crawlerRunConfig.__dict__.items()
+            if key not in CrawlerRunConfig.CONTEXT_IRRELEVANT_FIELDS and key != "_context_signature"
+        }
         # Convert to canonical JSON string
         signature_json = json.dumps(config_dict, sort_keys=True, default=str)
 
         # Hash the JSON so we get a compact, unique string
         signature_hash = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
+        crawlerRunConfig._context_signature = signature_hash
         return signature_hash
 
     async def _apply_stealth_to_page(self, page):
@@ -1102,9 +1105,23 @@ class BrowserManager:
                     await self.setup_context(context, crawlerRunConfig)
                     self.contexts_by_config[config_signature] = context
 
-            # Create a new page from the chosen context
-            page = await context.new_page()
-            await self._apply_stealth_to_page(page)
+            # Reuse a warm page for this context when one is pooled
+            page = None
+            if not crawlerRunConfig.session_id:
+                pool = self._page_pool.get(config_signature)
+                while pool and page is None:
+                    candidate = pool.pop()
+                    if candidate.is_closed():
+                        self._page_leases.pop(candidate, None)
+                    else:
+                        page = candidate
+
+            if page is None:
+                # Create a new page from the chosen context
+                page = await context.new_page()
+                await self._apply_stealth_to_page(page)
+                if not crawlerRunConfig.session_id:
+                    self._page_leases[page] = [config_signature, 0, page.viewport_size]
 
         # If a session_id is specified, store this session so we can reuse later
         if crawlerRunConfig.session_id:
@@ -1112,6 +1129,60 @@ class BrowserManager:
 
         return page, context
 
+    async def release_page(self, page):
+        """
+        Hand back a page obtained from get_page once a crawl is done with it.
+
+        Pages of non-managed browsers are reset (sessionStorage of the current
+        origin cleared, navigated to about:blank, viewport and extra headers
+        restored) and kept warm for the next
+        crawl with the same context signature, up to
+        ``BrowserConfig.page_pool_size`` idle pages per context. A page is
+        closed instead once it has served ``BrowserConfig.page_max_uses``
+        crawls, when the pool is full, or when resetting it fails.
+
+        Args:
+            page (Page): The page to release.
+        """
+        lease = self._page_leases.get(page)
+        if lease is None or page.is_closed():
+            self._page_leases.pop(page, None)
+            if not page.is_closed():
+                await page.close()
+            return
+
+        signature, uses, viewport = lease
+        lease[1] = uses = uses + 1
+        pool = self._page_pool.setdefault(signature, [])
+        if (
+            uses >= self.config.page_max_uses
+            or len(pool) >= self.config.page_pool_size
+            or signature not in self.contexts_by_config
+        ):
+            self._page_leases.pop(page, None)
+            await page.close()
+            return
+
+        try:
+            # sessionStorage is per tab, so it would otherwise leak into the next crawl
+            await page.evaluate("() => { try { sessionStorage.clear(); } catch (e) {} }")
+            await page.goto("about:blank")
+            await page.set_extra_http_headers({})
+            if viewport and page.viewport_size != viewport:
+                await page.set_viewport_size(viewport)
+        except Exception as e:
+            self._page_leases.pop(page, None)
+            if self.logger:
+                self.logger.debug(
+                    message="Closing page that could not be reset for reuse: {error}",
+                    tag="BROWSER",
+                    params={"error": str(e)},
+                )
+            if not page.is_closed():
+                await page.close()
+            return
+        pool.append(page)
+
     async def kill_session(self, session_id: str):
         """
         Kill a browser session and clean up resources.
@@ -1149,6 +1220,10 @@ class BrowserManager:
         for session_id in session_ids:
             await self.kill_session(session_id)
 
+        # Pooled pages belong to the contexts below and are closed with them
+        self._page_pool.clear()
+        self._page_leases.clear()
+
         # Now close all contexts we created. This reclaims memory from ephemeral contexts.
         for ctx in self.contexts_by_config.values():
             try:
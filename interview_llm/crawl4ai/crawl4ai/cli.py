@@ -33,7 +33,6 @@ from crawl4ai import (
     BestFirstCrawlingStrategy,
 )
 from crawl4ai.config import USER_SETTINGS
-from litellm import completion
 from pathlib import Path
 
 
@@ -82,6 +81,9 @@ def setup_llm_config() -> tuple[str, str]:
     return provider, token
 
 async def stream_llm_response(url: str, markdown: str, query: str, provider: str, token: str):
+    # litellm takes seconds to import; only pay for it when the LLM is used
+    from litellm import completion
+
     response = completion(
         model=provider,
         api_key=token,
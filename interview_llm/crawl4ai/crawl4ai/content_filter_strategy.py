@@ -3,12 +3,11 @@ import re
 import time
 from bs4 import BeautifulSoup, Tag
 from typing import List, Tuple, Dict, Optional
-from rank_bm25 import BM25Okapi
-from collections import deque
+from collections import OrderedDict, deque
 from bs4 import NavigableString, Comment
 
 from .utils import (
-    clean_tokens,
+    is_clean_token,
     perform_completion_with_backoff,
     escape_json_string,
     sanitize_html,
@@ -27,6 +26,9 @@ import json
 import hashlib
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import threading
+import numpy as np
 from .async_logger import AsyncLogger, LogLevel, LogColor
 
 
@@ -378,6 +380,88 @@ class RelevantContentFilter(ABC):
             return str(tag)  # Fallback to original if anything fails
 
 
+class BM25CorpusStats:
+    """
+    BM25 corpus statistics: vocabulary, document frequencies, document count
+    and total length, accumulated over one or more pages.
+    """
+
+    def __init__(self):
+        self.vocab: Dict[str, int] = {}
+        self.df = np.zeros(0, dtype=np.int64)
+        self.n_docs = 0
+        self.total_len = 0
+
+    def token_ids(self, docs: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Flatten ``docs`` to parallel ``(doc index, token id)`` arrays, extending the vocabulary."""
+        vocab = self.vocab
+        doc_index = []
+        ids = []
+        for i, tokens in enumerate(docs):
+            doc_index.extend([i] * len(tokens))
+            ids.extend([vocab.setdefault(token, len(vocab)) for token in tokens])
+        if len(vocab) > len(self.df):
+            self.df = np.concatenate([self.df, np.zeros(len(vocab) - len(self.df), dtype=np.int64)])
+        return np.asarray(doc_index, dtype=np.int64), np.asarray(ids, dtype=np.int64)
+
+    def add(self, n_docs: int, doc_len: np.ndarray, unique_tokens: np.ndarray) -> None:
+        """Count a batch of documents; ``unique_tokens`` has each token id once per document containing it."""
+        self.n_docs += n_docs
+        self.total_len += int(doc_len.sum())
+        self.df += np.bincount(unique_tokens, minlength=len(self.df))
+
+
+def bm25_scores(
+    docs: List[List[str]],
+    query: List[str],
+    stats: Optional[BM25CorpusStats] = None,
+    k1: float = 1.5,
+    b: float = 0.75,
+    epsilon: float = 0.25,
+) -> np.ndarray:
+    """
+    BM25 (Okapi) score of each document in ``docs`` for ``query``.
+
+    Same formula as ``rank_bm25.BM25Okapi`` (including the ``epsilon *
+    average idf`` floor for negative idf values), computed on a sparse
+    ``(document, term) -> frequency`` matrix with NumPy instead of one Python
+    dict per document. If ``stats`` is given, ``docs`` are added to it first
+    and idf / average length come from the accumulated corpus, so statistics
+    carry over between calls (e.g. pages of the same site).
+    """
+    stats = stats if stats is not None else BM25CorpusStats()
+    n = len(docs)
+    if n == 0:
+        return np.zeros(0)
+    doc_index, token_ids = stats.token_ids(docs)
+    doc_len = np.bincount(doc_index, minlength=n)
+
+    # Sparse term-frequency matrix in COO form: one entry per (document, term)
+    width = max(len(stats.vocab), 1)
+    cells, tf = np.unique(doc_index * width + token_ids, return_counts=True)
+    cell_doc, cell_token = cells // width, cells % width
+    stats.add(n, doc_len, cell_token)
+
+    if not stats.vocab or stats.total_len == 0:
+        return np.zeros(n)
+    df = stats.df
+    idf = np.log(stats.n_docs - df + 0.5) - np.log(df + 0.5)
+    idf[idf < 0] = epsilon * idf.mean()
+    avgdl = stats.total_len / stats.n_docs
+
+    # Query terms weighted by multiplicity; terms outside the vocabulary score 0
+    query_weight = np.zeros(len(df))
+    for token in query:
+        token_id = stats.vocab.get(token)
+        if token_id is not None:
+            query_weight[token_id] += 1
+    mask = query_weight[cell_token] > 0
+    cell_doc, cell_token, tf = cell_doc[mask], cell_token[mask], tf[mask]
+    norm = k1 * (1 - b + b * doc_len[cell_doc] / avgdl)
+    contributions = query_weight[cell_token] * idf[cell_token] * tf * (k1 + 1) / (tf + norm)
+    return np.bincount(cell_doc, weights=contributions, minlength=n)
+
+
 class BM25ContentFilter(RelevantContentFilter):
     """
     Content filtering using BM25 algorithm with priority tag handling.
@@ -385,7 +469,7 @@ class BM25ContentFilter(RelevantContentFilter):
     How it works:
     1. Extracts page metadata with fallbacks.
     2. Extracts text chunks from the body element.
-    3. Tokenizes the corpus and query.
+    3. Tokenizes the corpus and query (stemming memoized per distinct word).
     4. Applies BM25 algorithm to calculate scores for each chunk.
     5. Filters out chunks below the threshold.
     6. Sorts chunks by score in descending order.
@@ -395,17 +479,24 @@ class BM25ContentFilter(RelevantContentFilter):
         user_query (str): User query for filtering (optional).
         bm25_threshold (float): BM25 threshold for filtering (default: 1.0).
         language (str): Language for stemming (default: 'english').
+        reuse_corpus_stats (bool): Accumulate BM25 corpus statistics across pages of the same site.
+        stem_cache_size (int): Maximum number of distinct words kept in the stemming memo.
 
         Methods:
-            filter_content(self, html: str, min_word_threshold: int = None)
+            filter_content(self, html: str, min_word_threshold: int = None, base_url: str = None)
     """
 
+    # Sites whose corpus statistics are kept when reuse_corpus_stats is on
+    MAX_CORPUS_SITES = 64
+
     def __init__(
         self,
         user_query: str = None,
         bm25_threshold: float = 1.0,
         language: str = "english",
         use_stemming: bool = True,
+        reuse_corpus_stats: bool = False,
+        stem_cache_size: int = 100_000,
     ):
         """
         Initializes the BM25ContentFilter class, if not provided, falls back to page metadata.
@@ -418,10 +509,16 @@ class BM25ContentFilter(RelevantContentFilter):
             bm25_threshold (float): BM25 threshold for filtering (default: 1.0).
             language (str): Language for stemming (default: 'english').
             use_stemming (bool): Whether to apply stemming (default: True).
+            reuse_corpus_stats (bool): Keep document frequencies and lengths per site and score
+                each page against everything seen so far on that site (default: False).
+            stem_cache_size (int): Bound on the word -> token memo (default: 100,000).
         """
         super().__init__(user_query=user_query)
         self.bm25_threshold = bm25_threshold
+        self.language = language
         self.use_stemming = use_stemming
+        self.reuse_corpus_stats = reuse_corpus_stats
+        self.stem_cache_size = stem_cache_size
         self.priority_tags = {
             "h1": 5.0,
             "h2": 4.0,
@@ -436,8 +533,41 @@ class BM25ContentFilter(RelevantContentFilter):
             "th": 1.5,  # Table headers
         }
         self.stemmer = stemmer(language) if use_stemming else None
+        # Lowercased word -> cleaned (stemmed) token, or None if the token is dropped
+        self._token_cache: Dict[str, Optional[str]] = {}
+        self._corpus_stats: "OrderedDict[Optional[str], BM25CorpusStats]" = OrderedDict()
+        self._stats_lock = threading.Lock()
+
+    def tokenize(self, text: str) -> List[str]:
+        """Lowercase, split, stem and clean ``text``; equivalent to ``clean_tokens`` over stemmed words."""
+        cache = self._token_cache
+        tokens = []
+        for word in text.lower().split():
+            try:
+                token = cache[word]
+            except KeyError:
+                if len(cache) >= self.stem_cache_size:
+                    cache.clear()
+                stemmed = self.stemmer.stemWord(word) if self.use_stemming else word
+                token = cache[word] = stemmed if is_clean_token(stemmed) else None
+            if token is not None:
+                tokens.append(token)
+        return tokens
+
+    def _site_stats(self, base_url: Optional[str]) -> Optional[BM25CorpusStats]:
+        if not self.reuse_corpus_stats:
+            return None
+        site = urlparse(base_url).netloc if base_url else None
+        stats = self._corpus_stats.get(site)
+        if stats is None:
+            stats = self._corpus_stats[site] = BM25CorpusStats()
+            while len(self._corpus_stats) > self.MAX_CORPUS_SITES:
+                self._corpus_stats.popitem(last=False)
+        else:
+            self._corpus_stats.move_to_end(site)
+        return stats
 
-    def filter_content(self, html: str, min_word_threshold: int = None) -> List[str]:
+    def filter_content(self, html: str, min_word_threshold: int = None, base_url: str = None) -> List[str]:
         """
         Implements content filtering using BM25 algorithm with priority tag handling.
 
@@ -448,6 +578,7 @@ class BM25ContentFilter(RelevantContentFilter):
         Args:
             html (str): HTML content to be filtered.
             min_word_threshold (int): Minimum word threshold for filtering (optional).
+            base_url (str): Page URL; selects the per-site corpus statistics when reuse_corpus_stats is on.
 
         Returns:
             List[str]: List of filtered text chunks.
@@ -474,38 +605,15 @@ class BM25ContentFilter(RelevantContentFilter):
         if not candidates:
             return []
 
-        # Tokenize corpus
-        # tokenized_corpus = [chunk.lower().split() for _, chunk, _, _ in candidates]
-        # tokenized_query = query.lower().split()
-
-        # tokenized_corpus = [[ps.stem(word) for word in chunk.lower().split()]
-        #                 for _, chunk, _, _ in candidates]
-        # tokenized_query = [ps.stem(word) for word in query.lower().split()]
+        # Tokenize corpus and query, cleaned from stop words and noise
+        tokenized_corpus = [self.tokenize(chunk) for _, chunk, _, _ in candidates]
+        tokenized_query = self.tokenize(query)
 
-        if self.use_stemming:
-            tokenized_corpus = [
-                [self.stemmer.stemWord(word) for word in chunk.lower().split()]
-                for _, chunk, _, _ in candidates
-            ]
-            tokenized_query = [
-                self.stemmer.stemWord(word) for word in query.lower().split()
-            ]
+        if self.reuse_corpus_stats:
+            with self._stats_lock:
+                scores = bm25_scores(tokenized_corpus, tokenized_query, self._site_stats(base_url))
         else:
-            tokenized_corpus = [
-                chunk.lower().split() for _, chunk, _, _ in candidates
-            ]
-            tokenized_query = query.lower().split()
-
-        # tokenized_corpus = [[self.stemmer.stemWord(word) for word in tokenize_text(chunk.lower())]
-        #            for _, chunk, _, _ in candidates]
-        # tokenized_query = [self.stemmer.stemWord(word) for word in tokenize_text(query.lower())]
-
-        # Clean from stop words and noise
-        tokenized_corpus = [clean_tokens(tokens) for tokens in tokenized_corpus]
-        tokenized_query = clean_tokens(tokenized_query)
-
-        bm25 = BM25Okapi(tokenized_corpus)
-        scores = bm25.get_scores(tokenized_query)
+            scores = bm25_scores(tokenized_corpus, tokenized_query)
 
         # Adjust scores with tag weights
         adjusted_candidates = []
@@ -674,64 +782,146 @@ class PruningContentFilter(RelevantContentFilter):
             for element in soup.find_all(tag):
                 element.decompose()
 
+    def _compute_node_metrics(self, root: Tag) -> Dict[int, Tuple[int, int, int, int]]:
+        """
+        Computes ``(text_len, tag_len, link_text_len, word_count)`` for every
+        tag under and including ``root`` in one post-order pass.
+
+        The values equal ``len(node.get_text(strip=True))``,
+        ``len(node.encode_contents().decode("utf-8"))``, the stripped text
+        length of the node's direct ``<a>`` children and the word count used
+        by ``min_word_threshold``, but each string and tag is formatted once
+        and its lengths are added to its parent, instead of re-walking and
+        re-serializing the subtree of every node.
+
+        Returns:
+            Dict[int, Tuple[int, int, int, int]]: Metrics keyed by ``id(node)``.
+        """
+        formatter = root.formatter_for_name("minimal")
+        format_tag = getattr(Tag, "_format_tag", None)
+        # Per tag: serialized length of its contents, and (stripped length,
+        # spaces) of the strings below it grouped by string class, since
+        # get_text() only counts the classes the tag is interested in
+        markup_len: Dict[int, int] = {}
+        link_len: Dict[int, int] = {}
+        strings: Dict[int, Dict[type, List[int]]] = {}
+        closing_len: Dict[tuple, int] = {}
+        metrics: Dict[int, Tuple[int, int, int, int]] = {}
+
+        # Reversed document order visits every node after all its descendants
+        nodes = [root, *root.descendants]
+        for node in reversed(nodes):
+            parent_id = id(node.parent) if node is not root else None
+            if isinstance(node, Tag):
+                key = id(node)
+                own_strings = strings.pop(key, {})
+                inner_len = markup_len.pop(key, 0)
+                if format_tag is None:
+                    # beautifulsoup4 < 4.12.1 has no per-tag formatter
+                    inner_len = len(node.encode_contents().decode("utf-8"))
+
+                types = node.interesting_string_types
+                if types is None:
+                    types = node.MAIN_CONTENT_STRING_TYPES
+                if isinstance(types, type):
+                    types = (types,)
+                counted = [own_strings[t] for t in types if t in own_strings]
+                text_len = sum(c[0] for c in counted)
+                word_count = sum(c[1] for c in counted) + 1
+                metrics[key] = (text_len, inner_len, link_len.pop(key, 0), word_count)
+
+                if parent_id is None:
+                    continue
+                if format_tag is not None:
+                    outer_len = inner_len + len(format_tag(node, "utf-8", formatter, True))
+                    if not node.is_empty_element:
+                        shape = (node.prefix, node.name, node.hidden)
+                        if shape not in closing_len:
+                            closing_len[shape] = len(format_tag(node, "utf-8", formatter, False))
+                        outer_len += closing_len[shape]
+                    markup_len[parent_id] = markup_len.get(parent_id, 0) + outer_len
+                if node.name == "a":
+                    link_text = node.string
+                    if link_text:
+                        link_len[parent_id] = link_len.get(parent_id, 0) + len(link_text.strip())
+                parent_strings = strings.setdefault(parent_id, {})
+                for t, (length, spaces) in own_strings.items():
+                    acc = parent_strings.get(t)
+                    if acc is None:
+                        parent_strings[t] = [length, spaces]
+                    else:
+                        acc[0] += length
+                        acc[1] += spaces
+            elif isinstance(node, NavigableString) and parent_id is not None:
+                if format_tag is not None:
+                    markup_len[parent_id] = markup_len.get(parent_id, 0) + len(node.output_ready(formatter))
+                stripped = node.strip()
+                if stripped:
+                    acc = strings.setdefault(parent_id, {}).setdefault(type(node), [0, 0])
+                    acc[0] += len(stripped)
+                    acc[1] += stripped.count(" ")
+        return metrics
+
     def _prune_tree(self, node):
         """
         Prunes the tree starting from the given node.
 
+        Every node is scored on its subtree as it was before pruning (a
+        node is decided before any of its descendants are touched), so the
+        metrics of all nodes are computed up front in a single pass and
+        the tree is then walked top-down, dropping low-scoring subtrees.
+
         Args:
             node (Tag): The node from which the pruning starts.
         """
         if not node or not hasattr(node, "name") or node.name is None:
             return
 
-        text_len = len(node.get_text(strip=True))
-        tag_len = len(node.encode_contents().decode("utf-8"))
-        link_text_len = sum(
-            len(s.strip())
-            for s in (a.string for a in node.find_all("a", recursive=False))
-            if s
-        )
-
-        metrics = {
-            "node": node,
-            "tag_name": node.name,
-            "text_len": text_len,
-            "tag_len": tag_len,
-            "link_text_len": link_text_len,
-        }
-
-        score = self._compute_composite_score(metrics, text_len, tag_len, link_text_len)
-
-        if self.threshold_type == "fixed":
-            should_remove = score < self.threshold
-        else:  # dynamic
-            tag_importance = self.tag_importance.get(node.name, 0.7)
-            text_ratio = text_len / tag_len if tag_len > 0 else 0
-            link_ratio = link_text_len / text_len if text_len > 0 else 1
-
-            threshold = self.threshold  # base threshold
-            if tag_importance > 1:
-                threshold *= 0.8
-            if text_ratio > 0.4:
-                threshold *= 0.9
-            if link_ratio > 0.6:
-                threshold *= 1.2
-
-            should_remove = score < threshold
-
-        if should_remove:
-            node.decompose()
-        else:
-            children = [child for child in node.children if hasattr(child, "name")]
-            for child in children:
-                self._prune_tree(child)
+        node_metrics = self._compute_node_metrics(node)
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            text_len, tag_len, link_text_len, word_count = node_metrics[id(node)]
+
+            metrics = {
+                "node": node,
+                "tag_name": node.name,
+                "text_len": text_len,
+                "tag_len": tag_len,
+                "link_text_len": link_text_len,
+                "word_count": word_count,
+            }
+
+            score = self._compute_composite_score(metrics, text_len, tag_len, link_text_len)
+
+            if self.threshold_type == "fixed":
+                should_remove = score < self.threshold
+            else:  # dynamic
+                tag_importance = self.tag_importance.get(node.name, 0.7)
+                text_ratio = text_len / tag_len if tag_len > 0 else 0
+                link_ratio = link_text_len / text_len if text_len > 0 else 1
+
+                threshold = self.threshold  # base threshold
+                if tag_importance > 1:
+                    threshold *= 0.8
+                if text_ratio > 0.4:
+                    threshold *= 0.9
+                if link_ratio > 0.6:
+                    threshold *= 1.2
+
+                should_remove = score < threshold
+
+            if should_remove:
+                node.decompose()
+            else:
+                stack.extend(child for child in node.children if isinstance(child, Tag))
 
     def _compute_composite_score(self, metrics, text_len, tag_len, link_text_len):
         """Computes the composite score"""
         if self.min_word_threshold:
-            # Get raw text from metrics node - avoid extra processing
-            text = metrics["node"].get_text(strip=True)
-            word_count = text.count(" ") + 1
+            word_count = metrics.get("word_count")
+            if word_count is None:
+                word_count = metrics["node"].get_text(strip=True).count(" ") + 1
             if word_count < self.min_word_threshold:
                 return -1.0  # Guaranteed removal
         score = 0.0
@@ -4,7 +4,6 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from bs4 import BeautifulSoup
 import asyncio
-import requests
 from .config import (
     MIN_WORD_THRESHOLD,
     IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD,
@@ -16,7 +15,6 @@ from .config import (
 from bs4 import NavigableString, Comment
 from bs4 import PageElement, Tag
 from urllib.parse import urljoin
-from requests.exceptions import InvalidSchema
 from .utils import (
     extract_metadata,
     normalize_url,
@@ -74,6 +72,9 @@ def parse_dimension(dimension):
 # Fetch image file metadata to extract size and extension
 def fetch_image_file_size(img, base_url):
     # If src is relative path construct full URL, if not it may be CDN URL
+    import requests
+    from requests.exceptions import InvalidSchema
+
     img_url = urljoin(base_url, img.get("src"))
     try:
         response = requests.head(img_url)
@@ -3,6 +3,8 @@ from .base_strategy import DeepCrawlDecorator, DeepCrawlStrategy
 from .bfs_strategy import BFSDeepCrawlStrategy
 from .bff_strategy import BestFirstCrawlingStrategy
 from .dfs_strategy import DFSDeepCrawlStrategy
+from .frontier import SQLiteFrontier
+from .visited import BloomFilter, ScalableBloomFilter
 from .filters import (
     FilterChain,
     ContentTypeFilter,
@@ -29,6 +31,9 @@ __all__ = [
     "BFSDeepCrawlStrategy",
     "BestFirstCrawlingStrategy",
     "DFSDeepCrawlStrategy",
+    "SQLiteFrontier",
+    "BloomFilter",
+    "ScalableBloomFilter",
     "FilterChain",
     "ContentTypeFilter",
     "DomainFilter",
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import AsyncGenerator, Optional, Set, List, Dict
 from functools import wraps
 from contextvars import ContextVar
-from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn
+from math import inf as infinity
+from urllib.parse import urlparse
+from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn, MemoryAdaptiveDispatcher
+from .frontier import FrontierBatch
+from .visited import create_visited_set
 
 
 class DeepCrawlDecorator:
@@ -104,6 +109,162 @@ class DeepCrawlStrategy(ABC):
         else:
             return await self._arun_batch(start_url, crawler, config)
 
+    def _new_visited_set(self, *urls: str) -> Set[str]:
+        """
+        Create the in-memory visited set for one crawl, honouring the strategy's
+        ``visited_backend`` (exact set or Bloom filter), seeded with ``urls``.
+        """
+        visited = create_visited_set(
+            getattr(self, "visited_backend", "set"),
+            error_rate=getattr(self, "visited_error_rate", 1e-4),
+            max_pages=getattr(self, "max_pages", infinity),
+        )
+        visited.update(urls)
+        return visited
+
+    def _pipeline_dispatcher(self) -> MemoryAdaptiveDispatcher:
+        """
+        Dispatcher that runs the pages of a pipelined crawl: the strategy's
+        ``dispatcher`` if one was given, otherwise the same rate-limited
+        MemoryAdaptiveDispatcher ``arun_many`` uses, capped at ``max_concurrent``.
+        """
+        dispatcher = getattr(self, "dispatcher", None)
+        if dispatcher is not None:
+            return dispatcher
+        from ..async_dispatcher import MemoryAdaptiveDispatcher, RateLimiter
+
+        return MemoryAdaptiveDispatcher(
+            max_session_permit=getattr(self, "max_concurrent", 20),
+            rate_limiter=RateLimiter(base_delay=(1.0, 3.0), max_delay=60.0, max_retries=3),
+        )
+
+    async def _arun_frontier(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+        order: str = "fifo",
+        batch_size: int = 10,
+        mark_on_pop: bool = False,
+        batch_writes: Optional[FrontierBatch] = None,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        Traverse using the persistent ``self.frontier`` instead of in-memory
+        ``visited``/``depths``/queue structures.
+
+        Progress is checkpointed after every batch, so calling this again with
+        the same frontier and start URL resumes an interrupted crawl. A batch's
+        writes are buffered and committed together in a worker thread.
+
+        Args:
+            order: Frontier pop order ("fifo", "lifo" or "priority").
+            batch_size: Number of URLs handed to ``arun_many`` at a time.
+            mark_on_pop: Dedupe URLs when they are popped rather than when
+                they are discovered. They are only marked visited once crawled
+                and their links queued, so pages in flight when a crawl is
+                killed are crawled again on resume.
+            batch_writes: Buffer for the crawl's frontier writes, for strategies
+                that keep extra URL sets in it; a new one by default.
+        """
+        frontier = self.frontier
+        batch_writes = batch_writes or FrontierBatch(frontier)
+        visited = batch_writes.visited
+        depths = batch_writes.depths
+        use_scores = order == "priority" and self.url_scorer is not None
+
+        def open_frontier() -> None:
+            stored_start = frontier.get_state("start_url")
+            if stored_start != start_url:
+                if stored_start is not None:
+                    self.logger.warning(
+                        f"Frontier at {frontier.path} belongs to {stored_start}, starting over for {start_url}"
+                    )
+                    frontier.reset()
+                frontier.push(start_url, None, 0, self.url_scorer.score(start_url) if use_scores else 0)
+                frontier.depths[start_url] = 0
+                if not mark_on_pop:
+                    frontier.visited.add(start_url)
+                frontier.set_state("start_url", start_url)
+                frontier.set_state("pages_crawled", 0)
+            else:
+                self.logger.info(f"Resuming crawl of {start_url} with {frontier.pending()} queued URLs")
+            self._pages_crawled = frontier.get_state("pages_crawled", 0)
+            frontier.checkpoint()
+
+        # SQLite writes and commits run in a worker thread, reads stay on the loop
+        await asyncio.to_thread(open_frontier)
+
+        stream_config = config.clone(deep_crawl_strategy=None, stream=True)
+        try:
+            while not self._cancel_event.is_set():
+                remaining = self.max_pages - self._pages_crawled
+                if remaining <= 0:
+                    self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping crawl")
+                    break
+
+                batch = await asyncio.to_thread(frontier.pop, min(batch_size, remaining), order)
+                if not batch:
+                    break
+
+                items = {}
+                for item in batch:
+                    url, depth = item[1], item[3]
+                    if depth > self.max_depth:
+                        continue
+                    if mark_on_pop and url in visited:
+                        continue
+                    items.setdefault(url, item)
+
+                if items:
+                    stream_gen = await crawler.arun_many(urls=list(items), config=stream_config)
+                    async for result in stream_gen:
+                        item = items.get(result.url)
+                        if item is None:
+                            continue
+                        _, url, parent_url, depth, score = item
+                        result.metadata = result.metadata or {}
+                        result.metadata["depth"] = depth
+                        result.metadata["parent_url"] = parent_url
+                        if use_scores:
+                            result.metadata["score"] = score
+
+                        if result.success:
+                            self._pages_crawled += 1
+                        yield result
+
+                        # Only discover links from successful crawls
+                        if result.success and self._pages_crawled < self.max_pages:
+                            next_links: List[tuple] = []
+                            await self.link_discovery(result, url, depth, visited, next_links, depths)
+                            if order == "lifo":
+                                # First discovered link should be popped first
+                                next_links.reverse()
+                            if use_scores and next_links:
+                                scores = self.url_scorer.score_batch([u for u, _ in next_links]).tolist()
+                            else:
+                                scores = [0] * len(next_links)
+                            batch_writes.push_many(
+                                (next_url, next_parent, depths.get(next_url, depth + 1), score)
+                                for (next_url, next_parent), score in zip(next_links, scores)
+                            )
+
+                        # Only now is the page done: a crawl stopped at the yield
+                        # above has not discovered its links yet
+                        if mark_on_pop:
+                            visited.add(url)
+
+                if mark_on_pop:
+                    # URLs the dispatcher returned no result for are done too
+                    visited.update(items)
+                await asyncio.to_thread(
+                    batch_writes.commit,
+                    completed=[item[0] for item in batch],
+                    pages_crawled=self._pages_crawled,
+                )
+        finally:
+            # Only pop's in-flight marks can be pending here; they are reset on reopen anyway
+            frontier.checkpoint()
+
     def __call__(self, start_url: str, crawler: AsyncWebCrawler, config: CrawlerRunConfig):
         return self.arun(start_url, crawler, config)
 
@@ -114,11 +275,26 @@ class DeepCrawlStrategy(ABC):
         """
         pass
 
-    @abstractmethod
+    def _is_valid_url(self, url: str) -> bool:
+        """Check that the URL is an absolute http(s) URL with a dotted host."""
+        try:
+            parsed = urlparse(url)
+            if not parsed.scheme or not parsed.netloc:
+                raise ValueError("Missing scheme or netloc")
+            if parsed.scheme not in ("http", "https"):
+                raise ValueError("Invalid scheme")
+            if "." not in parsed.netloc:
+                raise ValueError("Invalid domain")
+        except Exception as e:
+            self.logger.warning(f"Invalid URL: {url}, error: {e}")
+            return False
+        return True
+
     async def can_process_url(self, url: str, depth: int) -> bool:
         """
-        Validate the URL format and apply custom filtering logic.
-        
+        Validate the URL format and apply the strategy's ``filter_chain``, if any.
+        For the start URL (depth 0) filtering is bypassed.
+
         Args:
             url (str): The URL to validate.
             depth (int): The current depth in the crawl.
@@ -126,7 +302,36 @@ class DeepCrawlStrategy(ABC):
         Returns:
             bool: True if the URL should be processed, False otherwise.
         """
-        pass
+        if not self._is_valid_url(url):
+            return False
+
+        filter_chain = getattr(self, "filter_chain", None)
+        if depth != 0 and filter_chain is not None and not await filter_chain.apply(url):
+            return False
+
+        return True
+
+    async def can_process_urls(self, urls: List[str], depth: int) -> List[bool]:
+        """
+        Batch form of :meth:`can_process_url` used by link discovery.
+
+        URLs that pass the format check go through the filter chain together,
+        so sync filters run in one tight loop and only the async ones are
+        awaited. Strategies that customize ``can_process_url`` are checked
+        one URL at a time.
+        """
+        if type(self).can_process_url is not DeepCrawlStrategy.can_process_url:
+            return [await self.can_process_url(url, depth) for url in urls]
+
+        valid = [self._is_valid_url(url) for url in urls]
+        filter_chain = getattr(self, "filter_chain", None)
+        if depth == 0 or filter_chain is None:
+            return valid
+
+        decisions = iter(
+            await filter_chain.apply_batch([url for url, ok in zip(urls, valid) if ok])
+        )
+        return [ok and next(decisions) for ok in valid]
 
     @abstractmethod
     async def link_discovery(
@@ -1,16 +1,19 @@
 # best_first_crawling_strategy.py
 import asyncio
+import contextlib
+import heapq
 import logging
 from datetime import datetime
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
-from urllib.parse import urlparse
 
 from ..models import TraversalStats
 from .filters import FilterChain
+from .frontier import SQLiteFrontier
+from .visited import VISITED_BACKENDS
 from .scorers import URLScorer
 from . import DeepCrawlStrategy
 
-from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn
+from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, RunManyReturn, MemoryAdaptiveDispatcher
 from ..utils import normalize_url_for_deep_crawl
 
 from math import inf as infinity
@@ -32,6 +35,17 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
       - _arun_best_first: Core generator that uses a priority queue to yield CrawlResults.
       - can_process_url: Validates URLs and applies filtering (inherited behavior).
       - link_discovery: Extracts and validates links from a CrawlResult.
+
+    With ``pipelined=True`` the fixed-size batches are replaced by a rolling window
+    of ``max_concurrent`` in-flight pages, each freed slot being refilled with the
+    best URL currently in the queue. Pages still go through ``dispatcher``, as in
+    :class:`BFSDeepCrawlStrategy`.
+
+    Passing a :class:`SQLiteFrontier` as ``frontier`` replaces the in-memory
+    priority queue and visited set with a disk-backed, resumable one.
+
+    ``visited_backend``/``visited_error_rate`` select an exact set or a compact
+    Bloom filter for the in-memory visited set, as in :class:`BFSDeepCrawlStrategy`.
     """
     def __init__(
         self,
@@ -41,12 +55,26 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         include_external: bool = False,
         max_pages: int = infinity,
         logger: Optional[logging.Logger] = None,
+        pipelined: bool = False,
+        max_concurrent: int = 20,
+        dispatcher: Optional[MemoryAdaptiveDispatcher] = None,
+        frontier: Optional[SQLiteFrontier] = None,
+        visited_backend: str = "set",
+        visited_error_rate: float = 1e-4,
     ):
         self.max_depth = max_depth
         self.filter_chain = filter_chain
         self.url_scorer = url_scorer
         self.include_external = include_external
         self.max_pages = max_pages
+        self.pipelined = pipelined
+        self.max_concurrent = max_concurrent
+        self.dispatcher = dispatcher
+        self.frontier = frontier
+        if visited_backend not in VISITED_BACKENDS:
+            raise ValueError(f"visited_backend must be one of {VISITED_BACKENDS}, got {visited_backend!r}")
+        self.visited_backend = visited_backend
+        self.visited_error_rate = visited_error_rate
         # self.logger = logger or logging.getLogger(__name__)
         # Ensure logger is always a Logger instance, not a dict from serialization
         if isinstance(logger, logging.Logger):
@@ -58,28 +86,6 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         self._cancel_event = asyncio.Event()
         self._pages_crawled = 0
 
-    async def can_process_url(self, url: str, depth: int) -> bool:
-        """
-        Validate the URL format and apply filtering.
-        For the starting URL (depth 0), filtering is bypassed.
-        """
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                raise ValueError("Missing scheme or netloc")
-            if parsed.scheme not in ("http", "https"):
-                raise ValueError("Invalid scheme")
-            if "." not in parsed.netloc:
-                raise ValueError("Invalid domain")
-        except Exception as e:
-            self.logger.warning(f"Invalid URL: {url}, error: {e}")
-            return False
-
-        if depth != 0 and not await self.filter_chain.apply(url):
-            return False
-
-        return True
-
     async def link_discovery(
         self,
         result: CrawlResult,
@@ -110,13 +116,20 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
             links += result.links.get("external", [])
 
         # If we have more links than remaining capacity, limit how many we'll process
-        valid_links = []
+        pending: List[Tuple[str, str]] = []
         for link in links:
             url = link.get("href")
             base_url = normalize_url_for_deep_crawl(url, source_url)
             if base_url in visited:
                 continue
-            if not await self.can_process_url(url, new_depth):
+            pending.append((url, base_url))
+
+        # Filter the whole page's links in one pass
+        allowed = await self.can_process_urls([url for url, _ in pending], new_depth)
+
+        valid_links = []
+        for (url, base_url), ok in zip(pending, allowed):
+            if not ok:
                 self.stats.urls_skipped += 1
                 continue
                 
@@ -127,6 +140,12 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
             depths[url] = new_depth
             next_links.append((url, source_url))
 
+    def _score_links(self, links: List[Tuple[str, Optional[str]]]) -> List[float]:
+        """Score all links discovered on one page with a single score_batch call."""
+        if not self.url_scorer or not links:
+            return [0] * len(links)
+        return self.url_scorer.score_batch([url for url, _ in links]).tolist()
+
     async def _arun_best_first(
         self,
         start_url: str,
@@ -143,7 +162,7 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         # Push the initial URL with score 0 and depth 0.
         initial_score = self.url_scorer.score(start_url) if self.url_scorer else 0
         await queue.put((-initial_score, 0, start_url, None))
-        visited: Set[str] = set()
+        visited: Set[str] = self._new_visited_set()
         depths: Dict[str, int] = {start_url: 0}
 
         while not queue.empty() and not self._cancel_event.is_set():
@@ -177,12 +196,13 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
 
             # Process the current batch of URLs.
             urls = [item[2] for item in batch]
+            batch_by_url = {item[2]: item for item in batch}
             batch_config = config.clone(deep_crawl_strategy=None, stream=True)
             stream_gen = await crawler.arun_many(urls=urls, config=batch_config)
             async for result in stream_gen:
                 result_url = result.url
                 # Find the corresponding tuple from the batch.
-                corresponding = next((item for item in batch if item[2] == result_url), None)
+                corresponding = batch_by_url.get(result_url)
                 if not corresponding:
                     continue
                 score, depth, url, parent_url = corresponding
@@ -207,13 +227,98 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
                     new_links: List[Tuple[str, Optional[str]]] = []
                     await self.link_discovery(result, result_url, depth, visited, new_links, depths)
                     
-                    for new_url, new_parent in new_links:
+                    new_scores = self._score_links(new_links)
+                    for (new_url, new_parent), new_score in zip(new_links, new_scores):
                         new_depth = depths.get(new_url, depth + 1)
-                        new_score = self.url_scorer.score(new_url) if self.url_scorer else 0
                         await queue.put((-new_score, new_depth, new_url, new_parent))
 
         # End of crawl.
 
+    async def _arun_pipelined(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        Pipelined best-first crawl.
+
+        Keeps up to ``max_concurrent`` pages in flight. Whenever one finishes its
+        links are scored and queued right away, and the freed slot is refilled
+        with the highest-priority URL, so there is no per-batch barrier. Pages
+        are fed to a running dispatcher stream, so rate limiting and
+        memory-adaptive throttling still apply.
+        """
+        queue: List[Tuple[float, int, str, Optional[str]]] = []
+        initial_score = self.url_scorer.score(start_url) if self.url_scorer else 0
+        heapq.heappush(queue, (-initial_score, 0, start_url, None))
+        visited: Set[str] = self._new_visited_set()
+        depths: Dict[str, int] = {start_url: 0}
+        in_flight: Dict[str, Tuple[float, int, str, Optional[str]]] = {}
+
+        dispatcher = self._pipeline_dispatcher()
+        page_config = config.clone(deep_crawl_strategy=None, stream=False)
+
+        def next_urls() -> List[str]:
+            urls = []
+            while (
+                queue
+                and len(in_flight) < self.max_concurrent
+                and self._pages_crawled + len(in_flight) < self.max_pages
+            ):
+                item = heapq.heappop(queue)
+                url = item[2]
+                if url in visited:
+                    continue
+                visited.add(url)
+                in_flight[url] = item
+                urls.append(url)
+            return urls
+
+        async with contextlib.aclosing(
+            dispatcher.run_urls_stream(urls=next_urls(), crawler=crawler, config=page_config)
+        ) as task_results:
+            async for task_result in task_results:
+                score, depth, url, parent_url = in_flight.pop(task_result.url)
+                result = task_result.result
+
+                result.metadata = result.metadata or {}
+                result.metadata["depth"] = depth
+                result.metadata["parent_url"] = parent_url
+                result.metadata["score"] = -score
+
+                if result.success:
+                    self._pages_crawled += 1
+                yield result
+
+                if self._pages_crawled >= self.max_pages:
+                    self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping crawl")
+                    return
+                if self._cancel_event.is_set():
+                    return
+
+                if result.success:
+                    new_links: List[Tuple[str, Optional[str]]] = []
+                    await self.link_discovery(result, result.url, depth, visited, new_links, depths)
+                    new_scores = self._score_links(new_links)
+                    for (new_url, new_parent), new_score in zip(new_links, new_scores):
+                        new_depth = depths.get(new_url, depth + 1)
+                        heapq.heappush(queue, (-new_score, new_depth, new_url, new_parent))
+
+                urls = next_urls()
+                if urls:
+                    dispatcher.add_urls(urls)
+
+    def _select_traversal(self):
+        """Pick the traversal generator matching the configured mode."""
+        if self.frontier is not None:
+            return lambda start_url, crawler, config: self._arun_frontier(
+                start_url, crawler, config, order="priority", batch_size=BATCH_SIZE, mark_on_pop=True
+            )
+        if self.pipelined:
+            return self._arun_pipelined
+        return self._arun_best_first
+
     async def _arun_batch(
         self,
         start_url: str,
@@ -225,8 +330,9 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         
         Aggregates all CrawlResults into a list.
         """
+        crawl = self._select_traversal()
         results: List[CrawlResult] = []
-        async for result in self._arun_best_first(start_url, crawler, config):
+        async for result in crawl(start_url, crawler, config):
             results.append(result)
         return results
 
@@ -241,8 +347,11 @@ class BestFirstCrawlingStrategy(DeepCrawlStrategy):
         
         Yields CrawlResults as they become available.
         """
-        async for result in self._arun_best_first(start_url, crawler, config):
-            yield result
+        crawl = self._select_traversal()
+        # Close the traversal with this generator so its cleanup runs now
+        async with contextlib.aclosing(crawl(start_url, crawler, config)) as results:
+            async for result in results:
+                yield result
 
     async def arun(
         self,
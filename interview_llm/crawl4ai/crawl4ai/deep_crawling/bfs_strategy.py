@@ -1,15 +1,18 @@
 # bfs_deep_crawl_strategy.py
 import asyncio
+import contextlib
 import logging
+from collections import deque
 from datetime import datetime
-from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
-from urllib.parse import urlparse
+from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple, Deque
 
 from ..models import TraversalStats
 from .filters import FilterChain
+from .frontier import SQLiteFrontier
+from .visited import VISITED_BACKENDS
 from .scorers import URLScorer
 from . import DeepCrawlStrategy  
-from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult
+from ..types import AsyncWebCrawler, CrawlerRunConfig, CrawlResult, MemoryAdaptiveDispatcher
 from ..utils import normalize_url_for_deep_crawl, efficient_normalize_url_for_deep_crawl
 from math import inf as infinity
 
@@ -20,7 +23,21 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
     Core functions:
       - arun: Main entry point; splits execution into batch or stream modes.
       - link_discovery: Extracts, filters, and (if needed) scores the outgoing URLs.
-      - can_process_url: Validates URL format and applies the filter chain.
+      - can_process_url: Validates URL format and applies the filter chain (inherited).
+
+    With ``pipelined=True`` the level barrier is removed: up to ``max_concurrent``
+    pages are kept in flight and links are discovered as each result arrives, so
+    the crawl never idles waiting for the slowest page of a level. Pages still
+    go through ``dispatcher`` (by default the rate-limited MemoryAdaptiveDispatcher
+    ``arun_many`` uses).
+
+    Passing a :class:`SQLiteFrontier` as ``frontier`` keeps the visited set, depth
+    map and queue on disk instead; the crawl is checkpointed after every batch
+    and resumes from the same frontier file when restarted.
+
+    ``visited_backend`` selects how seen URLs are tracked in memory: ``"set"``
+    (exact, default), ``"bloom"`` (scalable Bloom filter with false-positive
+    bound ``visited_error_rate``) or ``"auto"`` (exact set for small crawls).
     """
     def __init__(
         self,
@@ -31,6 +48,12 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         score_threshold: float = -infinity,
         max_pages: int = infinity,
         logger: Optional[logging.Logger] = None,
+        pipelined: bool = False,
+        max_concurrent: int = 20,
+        dispatcher: Optional[MemoryAdaptiveDispatcher] = None,
+        frontier: Optional[SQLiteFrontier] = None,
+        visited_backend: str = "set",
+        visited_error_rate: float = 1e-4,
     ):
         self.max_depth = max_depth
         self.filter_chain = filter_chain
@@ -38,6 +61,14 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         self.include_external = include_external
         self.score_threshold = score_threshold
         self.max_pages = max_pages
+        self.pipelined = pipelined
+        self.max_concurrent = max_concurrent
+        self.dispatcher = dispatcher
+        self.frontier = frontier
+        if visited_backend not in VISITED_BACKENDS:
+            raise ValueError(f"visited_backend must be one of {VISITED_BACKENDS}, got {visited_backend!r}")
+        self.visited_backend = visited_backend
+        self.visited_error_rate = visited_error_rate
         # self.logger = logger or logging.getLogger(__name__)
         # Ensure logger is always a Logger instance, not a dict from serialization
         if isinstance(logger, logging.Logger):
@@ -49,28 +80,6 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         self._cancel_event = asyncio.Event()
         self._pages_crawled = 0
 
-    async def can_process_url(self, url: str, depth: int) -> bool:
-        """
-        Validates the URL and applies the filter chain.
-        For the start URL (depth 0) filtering is bypassed.
-        """
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                raise ValueError("Missing scheme or netloc")
-            if parsed.scheme not in ("http", "https"):
-                raise ValueError("Invalid scheme")
-            if "." not in parsed.netloc:
-                raise ValueError("Invalid domain")
-        except Exception as e:
-            self.logger.warning(f"Invalid URL: {url}, error: {e}")
-            return False
-
-        if depth != 0 and not await self.filter_chain.apply(url):
-            return False
-
-        return True
-
     async def link_discovery(
         self,
         result: CrawlResult,
@@ -101,9 +110,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         if self.include_external:
             links += result.links.get("external", [])
 
-        valid_links = []
-        
-        # First collect all valid links
+        pending: List[Tuple[str, str]] = []
         for link in links:
             url = link.get("href")
             # Strip URL fragments to avoid duplicate crawling
@@ -111,16 +118,35 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
             base_url = normalize_url_for_deep_crawl(url, source_url)
             if base_url in visited:
                 continue
-            if not await self.can_process_url(url, next_depth):
+            pending.append((url, base_url))
+
+        # Filter the whole page's links in one pass
+        allowed = await self.can_process_urls([url for url, _ in pending], next_depth)
+
+        candidates: List[str] = []
+        candidate_set: Set[str] = set()
+        
+        # First collect all valid links
+        for (url, base_url), ok in zip(pending, allowed):
+            if base_url in candidate_set:
+                continue
+            if not ok:
                 self.stats.urls_skipped += 1
                 continue
+            candidate_set.add(base_url)
+            candidates.append(base_url)
 
-            # Score the URL if a scorer is provided
-            score = self.url_scorer.score(base_url) if self.url_scorer else 0
-            
+        # Score the whole page's links in one call if a scorer is provided
+        if self.url_scorer and candidates:
+            scores = self.url_scorer.score_batch(candidates).tolist()
+        else:
+            scores = [0] * len(candidates)
+
+        valid_links = []
+        for base_url, score in zip(candidates, scores):
             # Skip URLs with scores below the threshold
             if score < self.score_threshold:
-                self.logger.debug(f"URL {url} skipped: score {score} below threshold {self.score_threshold}")
+                self.logger.debug(f"URL {base_url} skipped: score {score} below threshold {self.score_threshold}")
                 self.stats.urls_skipped += 1
                 continue
 
@@ -155,7 +181,16 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Batch (non-streaming) mode:
         Processes one BFS level at a time, then yields all the results.
         """
-        visited: Set[str] = set()
+        if self.frontier is not None:
+            return [
+                result async for result in self._arun_frontier(
+                    start_url, crawler, config, order="fifo", batch_size=self.max_concurrent
+                )
+            ]
+        if self.pipelined:
+            return [result async for result in self._arun_pipelined(start_url, crawler, config)]
+
+        visited: Set[str] = self._new_visited_set()
         # current_level holds tuples: (url, parent_url)
         current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
         depths: Dict[str, int] = {start_url: 0}
@@ -170,6 +205,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
             
             next_level: List[Tuple[str, Optional[str]]] = []
             urls = [url for url, _ in current_level]
+            parents: Dict[str, Optional[str]] = dict(current_level)
 
             # Clone the config to disable deep crawling recursion and enforce batch mode.
             batch_config = config.clone(deep_crawl_strategy=None, stream=False)
@@ -184,8 +220,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 depth = depths.get(url, 0)
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = parents.get(url)
                 results.append(result)
                 
                 # Only discover links from successful crawls
@@ -207,13 +242,29 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Streaming mode:
         Processes one BFS level at a time and yields results immediately as they arrive.
         """
-        visited: Set[str] = set()
+        if self.frontier is not None:
+            # Close the traversal with this generator so its checkpoint runs now
+            async with contextlib.aclosing(self._arun_frontier(
+                start_url, crawler, config, order="fifo", batch_size=self.max_concurrent
+            )) as results:
+                async for result in results:
+                    yield result
+            return
+        if self.pipelined:
+            # Close the traversal with this generator so in-flight pages are cancelled now
+            async with contextlib.aclosing(self._arun_pipelined(start_url, crawler, config)) as results:
+                async for result in results:
+                    yield result
+            return
+
+        visited: Set[str] = self._new_visited_set()
         current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
         depths: Dict[str, int] = {start_url: 0}
 
         while current_level and not self._cancel_event.is_set():
             next_level: List[Tuple[str, Optional[str]]] = []
             urls = [url for url, _ in current_level]
+            parents = dict(current_level)
             visited.update(urls)
 
             stream_config = config.clone(deep_crawl_strategy=None, stream=True)
@@ -226,8 +277,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 depth = depths.get(url, 0)
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = parents.get(url)
                 
                 # Count only successful crawls
                 if result.success:
@@ -252,6 +302,78 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 
             current_level = next_level
 
+    async def _arun_pipelined(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        Pipelined mode:
+        Keeps up to ``max_concurrent`` crawls in flight across depth boundaries.
+        Links are discovered as soon as each page finishes and fed to the running
+        dispatcher stream right away, so rate limiting and memory-adaptive
+        throttling still apply. Parent and depth come from dict lookups keyed by
+        the requested URL.
+        """
+        visited: Set[str] = self._new_visited_set(start_url)
+        depths: Dict[str, int] = {start_url: 0}
+        parents: Dict[str, Optional[str]] = {start_url: None}
+        frontier: Deque[str] = deque([start_url])
+        in_flight = 0
+
+        dispatcher = self._pipeline_dispatcher()
+        page_config = config.clone(deep_crawl_strategy=None, stream=False)
+
+        def next_urls() -> List[str]:
+            # Top up the pipeline, never scheduling more pages than max_pages can still absorb
+            urls = []
+            while (
+                frontier
+                and in_flight + len(urls) < self.max_concurrent
+                and self._pages_crawled + in_flight + len(urls) < self.max_pages
+            ):
+                urls.append(frontier.popleft())
+            return urls
+
+        first = next_urls()
+        in_flight = len(first)
+        async with contextlib.aclosing(
+            dispatcher.run_urls_stream(urls=first, crawler=crawler, config=page_config)
+        ) as task_results:
+            async for task_result in task_results:
+                in_flight -= 1
+                url = task_result.url
+                result = task_result.result
+
+                depth = depths.get(url, 0)
+                result.metadata = result.metadata or {}
+                result.metadata["depth"] = depth
+                result.metadata["parent_url"] = parents.get(url)
+
+                if result.success:
+                    self._pages_crawled += 1
+                yield result
+
+                if self._pages_crawled >= self.max_pages:
+                    self.logger.info(f"Max pages limit ({self.max_pages}) reached, stopping crawl")
+                    return
+                if self._cancel_event.is_set():
+                    return
+
+                # Only discover links from successful crawls
+                if result.success:
+                    next_level: List[Tuple[str, Optional[str]]] = []
+                    await self.link_discovery(result, result.url, depth, visited, next_level, depths)
+                    for next_url, parent_url in next_level:
+                        parents[next_url] = parent_url
+                        frontier.append(next_url)
+
+                urls = next_urls()
+                if urls:
+                    in_flight += len(urls)
+                    dispatcher.add_urls(urls)
+
     async def shutdown(self) -> None:
         """
         Clean up resources and signal cancellation of the crawl.
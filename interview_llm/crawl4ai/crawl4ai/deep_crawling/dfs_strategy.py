@@ -1,8 +1,10 @@
 # dfs_deep_crawl_strategy.py
+import contextlib
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
 
 from ..models import CrawlResult
 from .bfs_strategy import BFSDeepCrawlStrategy  # noqa
+from .frontier import FrontierBatch
 from ..types import AsyncWebCrawler, CrawlerRunConfig
 from ..utils import normalize_url_for_deep_crawl
 
@@ -14,15 +16,38 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
     but walk the graph with a stack so we fully explore one branch before hopping to the
     next. DFS also keeps its own ``_dfs_seen`` set so we can drop duplicate links at
     discovery time without accidentally marking them as “already crawled”.
+
+    With a ``frontier`` the stack, ``visited`` and ``_dfs_seen`` all live in the
+    :class:`SQLiteFrontier`, making long DFS crawls resumable.
     """
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._dfs_seen: Set[str] = set()
 
-    def _reset_seen(self, start_url: str) -> None:
+    def _reset_seen(self, start_url: str, batch_writes: Optional[FrontierBatch] = None) -> None:
         """Start each crawl with a clean dedupe set seeded with the root URL."""
-        self._dfs_seen = {start_url}
+        if batch_writes is not None:
+            # Persistent dedupe set: keep whatever a previous run already saw.
+            # It is written together with the links pushed in the same batch.
+            self._dfs_seen = batch_writes.url_set("dfs_seen")
+            self._dfs_seen.add(start_url)
+        else:
+            self._dfs_seen = self._new_visited_set(start_url)
+
+    def _arun_dfs_frontier(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """DFS traversal over the persistent frontier (stack order, one page at a time)."""
+        batch_writes = FrontierBatch(self.frontier)
+        self._reset_seen(start_url, batch_writes)
+        return self._arun_frontier(
+            start_url, crawler, config, order="lifo", batch_size=1, mark_on_pop=True,
+            batch_writes=batch_writes,
+        )
 
     async def _arun_batch(
         self,
@@ -38,7 +63,10 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
         in control of traversal. Every successful page bumps ``_pages_crawled`` and
         seeds new stack items discovered via :meth:`link_discovery`.
         """
-        visited: Set[str] = set()
+        if self.frontier is not None:
+            return [result async for result in self._arun_dfs_frontier(start_url, crawler, config)]
+
+        visited: Set[str] = self._new_visited_set()
         # Stack items: (url, parent_url, depth)
         stack: List[Tuple[str, Optional[str], int]] = [(start_url, None, 0)]
         depths: Dict[str, int] = {start_url: 0}
@@ -94,7 +122,14 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
         yielded before we even look at the next stack entry. Successful crawls
         still feed :meth:`link_discovery`, keeping DFS order intact.
         """
-        visited: Set[str] = set()
+        if self.frontier is not None:
+            # Close the traversal with this generator so its checkpoint runs now
+            async with contextlib.aclosing(self._arun_dfs_frontier(start_url, crawler, config)) as results:
+                async for result in results:
+                    yield result
+            return
+
+        visited: Set[str] = self._new_visited_set()
         stack: List[Tuple[str, Optional[str], int]] = [(start_url, None, 0)]
         depths: Dict[str, int] = {start_url: 0}
         self._reset_seen(start_url)
@@ -178,7 +213,7 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
             links += result.links.get("external", [])
 
         seen = self._dfs_seen
-        valid_links: List[Tuple[str, float]] = []
+        pending: List[Tuple[str, str]] = []
 
         for link in links:
             raw_url = link.get("href")
@@ -188,12 +223,31 @@ class DFSDeepCrawlStrategy(BFSDeepCrawlStrategy):
             normalized_url = normalize_url_for_deep_crawl(raw_url, source_url)
             if not normalized_url or normalized_url in seen:
                 continue
+            pending.append((raw_url, normalized_url))
+
+        # Validate and filter all of this page's links in one pass
+        allowed = await self.can_process_urls([raw for raw, _ in pending], next_depth)
 
-            if not await self.can_process_url(raw_url, next_depth):
+        candidates: List[str] = []
+        candidate_set: Set[str] = set()
+        for (raw_url, normalized_url), ok in zip(pending, allowed):
+            if normalized_url in candidate_set:
+                continue
+            if not ok:
                 self.stats.urls_skipped += 1
                 continue
 
-            score = self.url_scorer.score(normalized_url) if self.url_scorer else 0
+            candidate_set.add(normalized_url)
+            candidates.append(normalized_url)
+
+        # One scoring call per page instead of one per link
+        if self.url_scorer and candidates:
+            scores = self.url_scorer.score_batch(candidates).tolist()
+        else:
+            scores = [0] * len(candidates)
+
+        valid_links: List[Tuple[str, float]] = []
+        for normalized_url, score in zip(candidates, scores):
             if score < self.score_threshold:
                 self.logger.debug(
                     f"URL {normalized_url} skipped: score {score} below threshold {self.score_threshold}"
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Pattern, Set, Union
+from typing import List, Pattern, Sequence, Set, Union
 from urllib.parse import urlparse
 from array import array
 import re
@@ -67,14 +67,32 @@ class URLFilter(ABC):
 
 
 class FilterChain:
-    """Optimized filter chain"""
+    """Optimized filter chain
 
-    __slots__ = ("filters", "stats", "_logger_ref")
+    Filters are split once into synchronous and asynchronous ones. Synchronous
+    filters always run first, so the async ones (ContentRelevanceFilter,
+    SEOFilter, ...) which fetch the page head are only awaited for URLs that
+    survived every cheap check. Use apply_batch to filter a whole page of
+    links in one call; at most ``max_concurrency`` async filter calls run at
+    once.
+    """
 
-    def __init__(self, filters: List[URLFilter] = None):
+    __slots__ = ("filters", "stats", "max_concurrency", "_logger_ref", "_sync_filters", "_async_filters")
+
+    def __init__(self, filters: List[URLFilter] = None, max_concurrency: int = 20):
         self.filters = tuple(filters or [])  # Immutable tuple for speed
+        self.max_concurrency = max_concurrency
         self.stats = FilterStats()
         self._logger_ref = None
+        self._partition_filters()
+
+    def _partition_filters(self):
+        self._sync_filters = tuple(
+            f for f in self.filters if not inspect.iscoroutinefunction(f.apply)
+        )
+        self._async_filters = tuple(
+            f for f in self.filters if inspect.iscoroutinefunction(f.apply)
+        )
 
     @property
     def logger(self):
@@ -85,23 +103,28 @@ class FilterChain:
 
     def add_filter(self, filter_: URLFilter) -> "FilterChain":
         """Add a filter to the chain"""
-        self.filters.append(filter_)
+        self.filters = self.filters + (filter_,)
+        self._partition_filters()
         return self  # Enable method chaining
 
     async def apply(self, url: str) -> bool:
-        """Apply all filters concurrently when possible"""
+        """Apply sync filters first, then the async ones concurrently"""
         self.stats._counters[0] += 1  # Total processed URLs
 
         tasks = []
-        for f in self.filters:
+        for f in self._sync_filters:
             result = f.apply(url)
 
             if inspect.isawaitable(result):
-                tasks.append(result)  # Collect async tasks
+                tasks.append(result)  # Sync def returning an awaitable
             elif not result:  # Sync rejection
                 self.stats._counters[2] += 1  # Sync rejected
+                for task in tasks:
+                    if inspect.iscoroutine(task):
+                        task.close()
                 return False
 
+        tasks.extend(f.apply(url) for f in self._async_filters)
         if tasks:
             results = await asyncio.gather(*tasks)
 
@@ -115,6 +138,69 @@ class FilterChain:
         self.stats._counters[1] += 1  # Passed
         return True
 
+    async def apply_batch(self, urls: Sequence[str]) -> List[bool]:
+        """Filter many URLs in one call.
+
+        Duplicate URLs are filtered once. Each synchronous filter runs over the
+        surviving URLs in a tight loop, with no coroutine per URL. Only URLs
+        that pass all of them are handed to the async filters, which run
+        concurrently across the batch, ``max_concurrency`` calls at a time.
+
+        Returns:
+            List[bool]: Decision for each URL, in input order
+        """
+        unique = list(dict.fromkeys(urls))
+        counters = self.stats._counters
+        counters[0] += len(unique)
+        decisions = [True] * len(unique)
+        alive = list(range(len(unique)))
+        deferred = []  # (index, awaitable) from sync defs returning awaitables
+
+        for f in self._sync_filters:
+            apply = f.apply
+            survivors = []
+            for i in alive:
+                result = apply(unique[i])
+                if inspect.isawaitable(result):
+                    deferred.append((i, result))
+                    survivors.append(i)
+                elif result:
+                    survivors.append(i)
+                else:
+                    decisions[i] = False
+                    counters[2] += 1
+            alive = survivors
+            if not alive:
+                break
+
+        alive_set = set(alive)
+        pending = [(i, aw) for i, aw in deferred if i in alive_set]
+        for i, aw in deferred:
+            if i not in alive_set and inspect.iscoroutine(aw):
+                aw.close()
+        for f in self._async_filters:
+            # Coroutines only start once awaited, i.e. inside the semaphore
+            pending.extend((i, f.apply(unique[i])) for i in alive)
+
+        if pending:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def bounded(aw):
+                async with semaphore:
+                    return await aw
+
+            results = await asyncio.gather(*(bounded(aw) for _, aw in pending))
+            for (i, _), result in zip(pending, results):
+                if not result:
+                    decisions[i] = False
+                    counters[2] += 1
+
+        counters[1] += sum(decisions[i] for i in alive)
+        if len(unique) == len(urls):
+            return decisions
+        by_url = dict(zip(unique, decisions))
+        return [by_url[url] for url in urls]
+
 
 class URLPatternFilter(URLFilter):
     """Pattern filter balancing speed and completeness"""
@@ -128,6 +214,8 @@ class URLPatternFilter(URLFilter):
         "_domain_patterns",
         "_path_patterns",
         "_reverse",
+        "_compiled",
+        "_grouped",
     )
 
     PATTERN_TYPES = {
@@ -162,6 +250,63 @@ class URLPatternFilter(URLFilter):
             pattern_type = self._categorize_pattern(pattern)
             self._add_pattern(pattern, pattern_type)
 
+        self._compiled = self._compile_combined()
+
+    def _compile_combined(self):
+        """Merge every rule into one regex so apply() is a single search.
+
+        - suffixes: last dot-part of the last path segment (query excluded)
+        - prefixes: URL starts with prefix followed by a path boundary
+        - domains: anchored match, path patterns: unanchored search
+
+        Patterns with capturing groups are kept out of the merged regex, since
+        joining them would renumber their groups and break backreferences;
+        they are left in ``self._grouped`` and searched one by one.
+
+        Returns None when the rules cannot be merged (e.g. patterns compiled
+        with their own flags); apply() then falls back to checking each rule
+        family in turn.
+        """
+        alternatives = []
+        self._grouped = []
+
+        # Suffixes containing '.', '/' or '?' can never match the last dot-part
+        suffixes = [s for s in self._simple_suffixes if not set(s) & set("/.?")]
+        if suffixes:
+            alternatives.append(
+                r"^(?:[^?]*[/.])?(?:{})(?:\?|$)".format("|".join(map(re.escape, suffixes)))
+            )
+
+        prefixes = [p for p in self._simple_prefixes if "?" not in p]
+        if prefixes:
+            alternatives.append(
+                r"^(?:{})(?:[/?#]|$)".format("|".join(map(re.escape, prefixes)))
+            )
+
+        default_flags = re.compile("").flags
+        for pattern in self._domain_patterns:
+            if pattern.flags != default_flags:
+                return None
+            if pattern.groups:
+                self._grouped.append(re.compile(r"^(?:{})".format(pattern.pattern)))
+            else:
+                alternatives.append(r"^(?:{})".format(pattern.pattern))
+
+        for pattern in self._path_patterns:
+            if not isinstance(pattern.pattern, str) or pattern.flags != default_flags:
+                return None
+            if pattern.groups:
+                self._grouped.append(pattern)
+            else:
+                alternatives.append(r"(?:{})".format(pattern.pattern))
+
+        if not alternatives:
+            return None
+        try:
+            return re.compile("|".join(alternatives))
+        except re.error:
+            return None
+
     def _categorize_pattern(self, pattern: str) -> int:
         """Categorize pattern for specialized handling"""
         if not isinstance(pattern, str):
@@ -214,8 +359,16 @@ class URLPatternFilter(URLFilter):
                 pattern if isinstance(pattern, Pattern) else re.compile(pattern)
             )
 
-    @lru_cache(maxsize=10000)
     def apply(self, url: str) -> bool:
+        if self._compiled is not None:
+            result = self._compiled.search(url) is not None or any(
+                p.search(url) for p in self._grouped
+            )
+            self._update_stats(result)
+            return not result if self._reverse else result
+        return self._apply_uncompiled(url)
+
+    def _apply_uncompiled(self, url: str) -> bool:
         # Quick suffix check (*.html)
         if self._simple_suffixes:
             path = url.split("?")[0]
@@ -411,9 +564,8 @@ class ContentTypeFilter(URLFilter):
             if any(allowed in mime for allowed in self.allowed_types)
         )
 
-    @lru_cache(maxsize=1000)
     def _check_url_cached(self, url: str) -> bool:
-        """Cached URL checking"""
+        """Extension check (extraction itself is cached at class level)"""
         if not self._check_extension:
             return True
         ext = self._extract_extension(url)
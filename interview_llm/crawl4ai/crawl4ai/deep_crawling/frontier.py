@@ -0,0 +1,429 @@
+# frontier.py
+import json
+import os
+import sqlite3
+from collections.abc import MutableMapping, MutableSet
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Tuple, Union
+
+# Queue item as returned by SQLiteFrontier.pop: (seq, url, parent_url, depth, score)
+FrontierItem = Tuple[int, str, Optional[str], int, float]
+
+_QUEUED = 0
+_IN_FLIGHT = 1
+
+_POP_ORDER = {
+    "fifo": "depth ASC, seq ASC",
+    "lifo": "seq DESC",
+    "priority": "score DESC, seq ASC",
+}
+
+
+class SQLiteURLSet(MutableSet):
+    """
+    Set-like view over one named URL set stored in a SQLiteFrontier.
+
+    Drop-in replacement for the ``visited`` sets used by the deep crawl
+    strategies: membership checks are indexed lookups, so RAM stays flat no
+    matter how many URLs have been seen.
+    """
+
+    def __init__(self, frontier: "SQLiteFrontier", name: str):
+        self._frontier = frontier
+        self._name = name
+
+    def __contains__(self, url: object) -> bool:
+        row = self._frontier._conn.execute(
+            "SELECT 1 FROM url_sets WHERE name = ? AND url = ?", (self._name, url)
+        ).fetchone()
+        return row is not None
+
+    def __iter__(self) -> Iterator[str]:
+        cursor = self._frontier._conn.execute(
+            "SELECT url FROM url_sets WHERE name = ?", (self._name,)
+        )
+        for (url,) in cursor:
+            yield url
+
+    def __len__(self) -> int:
+        return self._frontier._conn.execute(
+            "SELECT COUNT(*) FROM url_sets WHERE name = ?", (self._name,)
+        ).fetchone()[0]
+
+    def add(self, url: str) -> None:
+        self._frontier._conn.execute(
+            "INSERT OR IGNORE INTO url_sets (name, url) VALUES (?, ?)", (self._name, url)
+        )
+        self._frontier._touch()
+
+    def update(self, urls: Iterable[str]) -> None:
+        self._frontier._conn.executemany(
+            "INSERT OR IGNORE INTO url_sets (name, url) VALUES (?, ?)",
+            ((self._name, url) for url in urls),
+        )
+        self._frontier._touch()
+
+    def discard(self, url: str) -> None:
+        self._frontier._conn.execute(
+            "DELETE FROM url_sets WHERE name = ? AND url = ?", (self._name, url)
+        )
+        self._frontier._touch()
+
+    def clear(self) -> None:
+        self._frontier._conn.execute("DELETE FROM url_sets WHERE name = ?", (self._name,))
+        self._frontier._touch()
+
+
+class SQLiteDepthMap(MutableMapping):
+    """Dict-like ``url -> depth`` view stored in a SQLiteFrontier."""
+
+    def __init__(self, frontier: "SQLiteFrontier"):
+        self._frontier = frontier
+
+    def __getitem__(self, url: str) -> int:
+        row = self._frontier._conn.execute(
+            "SELECT depth FROM depths WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(url)
+        return row[0]
+
+    def __setitem__(self, url: str, depth: int) -> None:
+        self._frontier._conn.execute(
+            "INSERT OR REPLACE INTO depths (url, depth) VALUES (?, ?)", (url, depth)
+        )
+        self._frontier._touch()
+
+    def __delitem__(self, url: str) -> None:
+        cursor = self._frontier._conn.execute("DELETE FROM depths WHERE url = ?", (url,))
+        if cursor.rowcount == 0:
+            raise KeyError(url)
+        self._frontier._touch()
+
+    def __iter__(self) -> Iterator[str]:
+        for (url,) in self._frontier._conn.execute("SELECT url FROM depths"):
+            yield url
+
+    def __len__(self) -> int:
+        return self._frontier._conn.execute("SELECT COUNT(*) FROM depths").fetchone()[0]
+
+
+class SQLiteFrontier:
+    """
+    Disk-backed crawl frontier, visited sets and depth map for deep crawling.
+
+    Everything a deep crawl would otherwise keep in memory (the ``visited`` set,
+    the ``depths`` dict and the pending queue) lives in a single SQLite file, so
+    a crawl can be paused, killed or restarted and picked up where it stopped,
+    with memory bounded by SQLite's page cache instead of the number of URLs.
+
+    Queue items are popped in one of three orders:
+      - ``"fifo"``: shallowest depth first, then insertion order (BFS).
+      - ``"lifo"``: most recently pushed first (DFS).
+      - ``"priority"``: highest score first (best-first).
+
+    Popped items stay in the database as *in flight* until :meth:`complete` is
+    called; reopening the frontier puts unfinished items back in the queue, so
+    pages interrupted by a crash are crawled again rather than lost.
+
+    Args:
+        path: SQLite file to use. Parent directories are created as needed.
+        checkpoint_interval: Number of writes between automatic commits.
+        cache_size_kb: Size of SQLite's page cache, i.e. the RAM budget.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        checkpoint_interval: int = 500,
+        cache_size_kb: int = 16 * 1024,
+    ):
+        self.path = str(path)
+        self.checkpoint_interval = checkpoint_interval
+        self.cache_size_kb = cache_size_kb
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+
+        # Deep crawls run commits in a worker thread (see FrontierBatch); every
+        # access is still serialized because the crawl awaits each of them
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA cache_size=-{int(cache_size_kb)}")
+        self._init_db()
+        self._pending_writes = 0
+
+        # Anything left in flight by a previous run goes back in the queue
+        self._conn.execute("UPDATE queue SET state = ? WHERE state = ?", (_QUEUED, _IN_FLIGHT))
+        self._conn.commit()
+
+    def _init_db(self) -> None:
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS url_sets (
+                name TEXT NOT NULL,
+                url TEXT NOT NULL,
+                PRIMARY KEY (name, url)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS depths (
+                url TEXT PRIMARY KEY,
+                depth INTEGER NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS queue (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                url TEXT NOT NULL,
+                parent_url TEXT,
+                depth INTEGER NOT NULL,
+                score REAL NOT NULL DEFAULT 0,
+                state INTEGER NOT NULL DEFAULT 0,
+                payload TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_queue_fifo ON queue (state, depth, seq);
+            CREATE INDEX IF NOT EXISTS idx_queue_priority ON queue (state, score);
+            CREATE TABLE IF NOT EXISTS state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS logs (
+                name TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (name, seq)
+            ) WITHOUT ROWID;
+            """
+        )
+
+    def _touch(self, writes: int = 1) -> None:
+        self._pending_writes += writes
+        if self._pending_writes >= self.checkpoint_interval:
+            self.checkpoint()
+
+    # Views -----------------------------------------------------------------
+
+    def url_set(self, name: str = "visited") -> SQLiteURLSet:
+        """Return a persistent set-like view named ``name``."""
+        return SQLiteURLSet(self, name)
+
+    @property
+    def visited(self) -> SQLiteURLSet:
+        return self.url_set("visited")
+
+    @property
+    def depths(self) -> SQLiteDepthMap:
+        return SQLiteDepthMap(self)
+
+    # Queue -----------------------------------------------------------------
+
+    def push(
+        self,
+        url: str,
+        parent_url: Optional[str],
+        depth: int,
+        score: float = 0.0,
+        payload: Any = None,
+    ) -> None:
+        """Add a URL to the queue, with an optional JSON-serializable payload."""
+        self.push_many([(url, parent_url, depth, score, payload)])
+
+    def push_many(self, items: Iterable[tuple]) -> None:
+        """Add ``(url, parent_url, depth, score[, payload])`` tuples to the queue."""
+        rows = [
+            (url, parent_url, depth, score, json.dumps(payload) if payload is not None else None)
+            for url, parent_url, depth, score, payload in ((*item, None)[:5] for item in items)
+        ]
+        self._conn.executemany(
+            "INSERT INTO queue (url, parent_url, depth, score, payload) VALUES (?, ?, ?, ?, ?)",
+            rows,
+        )
+        self._touch(len(rows))
+
+    def pop(self, n: int = 1, order: str = "fifo") -> List[FrontierItem]:
+        """
+        Take up to ``n`` items off the queue and mark them in flight.
+
+        Returns:
+            List[FrontierItem]: ``(seq, url, parent_url, depth, score)`` tuples.
+        """
+        if order not in _POP_ORDER:
+            raise ValueError(f"Unknown frontier order: {order}")
+        rows = self._conn.execute(
+            f"SELECT seq, url, parent_url, depth, score FROM queue "
+            f"WHERE state = ? ORDER BY {_POP_ORDER[order]} LIMIT ?",
+            (_QUEUED, n),
+        ).fetchall()
+        if rows:
+            self._conn.executemany(
+                "UPDATE queue SET state = ? WHERE seq = ?", ((_IN_FLIGHT, row[0]) for row in rows)
+            )
+            self._touch(len(rows))
+        return [tuple(row) for row in rows]
+
+    def complete(self, seqs: Iterable[int]) -> None:
+        """Drop finished items from the queue."""
+        seqs = list(seqs)
+        self._conn.executemany("DELETE FROM queue WHERE seq = ?", ((seq,) for seq in seqs))
+        self._touch(len(seqs))
+
+    def pending(self) -> int:
+        """Number of queued (not in flight) items."""
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM queue WHERE state = ?", (_QUEUED,)
+        ).fetchone()[0]
+
+    def iter_queue(self) -> Iterator[Tuple[str, Optional[str], int, float, Any]]:
+        """Iterate over queued ``(url, parent_url, depth, score, payload)`` items without popping them."""
+        cursor = self._conn.execute(
+            "SELECT url, parent_url, depth, score, payload FROM queue WHERE state = ? ORDER BY seq",
+            (_QUEUED,),
+        )
+        for url, parent_url, depth, score, payload in cursor:
+            yield url, parent_url, depth, score, json.loads(payload) if payload is not None else None
+
+    def clear_queue(self) -> None:
+        self._conn.execute("DELETE FROM queue")
+        self._touch()
+
+    # Key/value state ---------------------------------------------------------
+
+    def get_state(self, key: str, default: Any = None) -> Any:
+        row = self._conn.execute("SELECT value FROM state WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_state(self, key: str, value: Any) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO state (key, value) VALUES (?, ?)", (key, json.dumps(value))
+        )
+        self._touch()
+
+    # Append-only logs --------------------------------------------------------
+
+    def log_length(self, name: str) -> int:
+        """Number of entries in the log ``name``."""
+        row = self._conn.execute("SELECT MAX(seq) FROM logs WHERE name = ?", (name,)).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def extend_log(self, name: str, values: Iterable[Any]) -> None:
+        """Append JSON-serializable ``values`` to the log ``name``."""
+        start = self.log_length(name)
+        rows = [(name, start + i, json.dumps(value)) for i, value in enumerate(values)]
+        self._conn.executemany("INSERT INTO logs (name, seq, value) VALUES (?, ?, ?)", rows)
+        self._touch(len(rows))
+
+    def iter_log(self, name: str) -> Iterator[Any]:
+        """Iterate over the entries of the log ``name`` in the order they were appended."""
+        cursor = self._conn.execute("SELECT value FROM logs WHERE name = ? ORDER BY seq", (name,))
+        for (value,) in cursor:
+            yield json.loads(value)
+
+    def clear_log(self, name: str) -> None:
+        self._conn.execute("DELETE FROM logs WHERE name = ?", (name,))
+        self._touch()
+
+    # Lifecycle -------------------------------------------------------------
+
+    def checkpoint(self) -> None:
+        """Flush all pending writes to disk."""
+        self._conn.commit()
+        self._pending_writes = 0
+
+    def reset(self) -> None:
+        """Forget everything: queue, URL sets, depths, state and logs."""
+        self._conn.executescript(
+            "DELETE FROM queue; DELETE FROM url_sets; DELETE FROM depths; DELETE FROM state; "
+            "DELETE FROM logs;"
+        )
+        self.checkpoint()
+
+    def close(self) -> None:
+        self.checkpoint()
+        self._conn.close()
+
+    def __enter__(self) -> "SQLiteFrontier":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class FrontierBatch:
+    """
+    Buffers the writes of one deep-crawl batch in memory.
+
+    ``visited`` and ``depths`` read through to the frontier and keep new
+    entries in memory; pushed links are held back too. :meth:`commit` writes
+    everything in one transaction and is meant to run in a worker thread
+    (``asyncio.to_thread``), so the event loop never waits on SQLite writes.
+    Nothing buffered reaches the database if the crawl stops before the
+    commit; the batch's in-flight items are then crawled again on resume.
+    """
+
+    def __init__(self, frontier: SQLiteFrontier):
+        self.frontier = frontier
+        self._url_sets = {}
+        self.visited = self.url_set("visited")
+        self.depths = _BufferedDepthMap(frontier.depths)
+        self._pushed: List[tuple] = []
+
+    def url_set(self, name: str) -> "_BufferedURLSet":
+        """Buffered view of the frontier's URL set ``name``."""
+        if name not in self._url_sets:
+            self._url_sets[name] = _BufferedURLSet(self.frontier.url_set(name))
+        return self._url_sets[name]
+
+    def push_many(self, items: Iterable[tuple]) -> None:
+        self._pushed.extend(items)
+
+    def commit(self, completed: Iterable[int] = (), **state: Any) -> None:
+        """Write the buffered entries, drop ``completed`` queue items, store ``state`` and commit."""
+        frontier = self.frontier
+        for url_set in self._url_sets.values():
+            url_set.base.update(url_set.added)
+        frontier._conn.executemany(
+            "INSERT OR REPLACE INTO depths (url, depth) VALUES (?, ?)", self.depths.added.items()
+        )
+        frontier.push_many(self._pushed)
+        frontier.complete(completed)
+        for key, value in state.items():
+            frontier.set_state(key, value)
+        frontier.checkpoint()
+        for url_set in self._url_sets.values():
+            url_set.added.clear()
+        self.depths.added.clear()
+        self._pushed.clear()
+
+
+class _BufferedURLSet:
+    def __init__(self, base: SQLiteURLSet):
+        self.base = base
+        self.added = set()
+
+    def __contains__(self, url: object) -> bool:
+        return url in self.added or url in self.base
+
+    def add(self, url: str) -> None:
+        self.added.add(url)
+
+    def update(self, urls: Iterable[str]) -> None:
+        self.added.update(urls)
+
+
+class _BufferedDepthMap:
+    def __init__(self, base: SQLiteDepthMap):
+        self.base = base
+        self.added = {}
+
+    def __contains__(self, url: object) -> bool:
+        return url in self.added or url in self.base
+
+    def __getitem__(self, url: str) -> int:
+        if url in self.added:
+            return self.added[url]
+        return self.base[url]
+
+    def __setitem__(self, url: str, depth: int) -> None:
+        self.added[url] = depth
+
+    def get(self, url: str, default: Any = None) -> Any:
+        try:
+            return self[url]
+        except KeyError:
+            return default
@@ -1,13 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Union
 from dataclasses import dataclass
 from urllib.parse import urlparse, unquote
 import re
 import logging
-from functools import lru_cache
+from functools import lru_cache, cached_property
 from array import array
 import ctypes
 import platform
+import numpy as np
 PLATFORM = platform.system()
 
 # Pre-computed scores for common year differences
@@ -23,6 +24,24 @@ _FRESHNESS_SCORES = [
    0.5,    # 5 years ago
 ]
 
+# Date pattern shared by FreshnessScorer and URLBatch
+_DATE_PATTERN = re.compile(
+    r'(?:/'  # Path separator
+    r'|[-_])'  # or date separators
+    r'((?:19|20)\d{2})'  # Year group (1900-2099)
+    r'(?:'  # Optional month/day group
+    r'(?:/|[-_])'  # Date separator  
+    r'(?:\d{2})'  # Month
+    r'(?:'  # Optional day
+    r'(?:/|[-_])'  # Date separator
+    r'(?:\d{2})'  # Day
+    r')?'  # Day is optional
+    r')?'  # Month/day group is optional
+)
+
+# Last '.' of a line followed by its alphanumeric run, as in ContentTypeScorer._quick_extension
+_EXTENSION_PATTERN = re.compile(r'\.([^\W_]*)[^.\n]*$', re.MULTILINE)
+
 class ScoringStats:
     __slots__ = ('_urls_scored', '_total_score', '_min_score', '_max_score')
     
@@ -60,6 +79,87 @@ class ScoringStats:
         if self._max_score is None:
             self._max_score = self._total_score / self._urls_scored if self._urls_scored else 0.0
         return self._max_score
+
+    def update_batch(self, scores: np.ndarray) -> None:
+        """Fold a whole array of scores into the running stats"""
+        if not len(scores):
+            return
+        self._urls_scored += len(scores)
+        self._total_score += float(scores.sum())
+        if self._min_score is not None:
+            self._min_score = min(self._min_score, float(scores.min()))
+        if self._max_score is not None:
+            self._max_score = max(self._max_score, float(scores.max()))
+
+class URLBatch:
+    """URLs parsed once and shared by every scorer in a score_batch call.
+
+    Each component (lowercased text, path depth, extension, domain, year
+    candidates) is computed lazily on first use, so a scorer only pays for
+    what it reads and a CompositeScorer never parses the same URL twice.
+    """
+    def __init__(self, urls: Sequence[str]):
+        self.urls = list(urls)
+
+    def __len__(self) -> int:
+        return len(self.urls)
+
+    @cached_property
+    def text(self) -> np.ndarray:
+        return np.array(self.urls, dtype=str)
+
+    @cached_property
+    def lower(self) -> np.ndarray:
+        return np.array([url.lower() for url in self.urls], dtype=str)
+
+    @cached_property
+    def depths(self) -> np.ndarray:
+        """Non-empty path segment count, as PathDepthScorer._quick_depth"""
+        def depth(url: str) -> int:
+            pos = url.find('/', url.find('://') + 3)
+            if pos == -1:
+                return 0
+            return sum(1 for segment in url[pos:].split('/') if segment)
+        return np.fromiter((depth(url) for url in self.urls), dtype=np.int64, count=len(self.urls))
+
+    @cached_property
+    def _joined(self) -> str:
+        # URLs never contain newlines, so one regex pass over the joined text
+        # replaces a pass per URL; match offsets map back through _offsets
+        return "\n".join(self.urls)
+
+    @cached_property
+    def _offsets(self) -> np.ndarray:
+        lengths = np.fromiter((len(url) + 1 for url in self.urls), dtype=np.int64, count=len(self.urls))
+        return np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    def _owner(self, positions: List[int]) -> np.ndarray:
+        """Index of the URL containing each position of the joined text"""
+        return np.searchsorted(self._offsets, np.asarray(positions, dtype=np.int64), side='right') - 1
+
+    @cached_property
+    def extensions(self) -> np.ndarray:
+        """Lowercased extension after the last '.' of each URL ('' if none)"""
+        extensions = np.full(len(self.urls), '', dtype=object)
+        matches = list(_EXTENSION_PATTERN.finditer(self._joined))
+        if matches:
+            owners = self._owner([m.start() for m in matches])
+            extensions[owners] = [m.group(1).lower() for m in matches]
+        return extensions.astype(str)
+
+    @cached_property
+    def domains(self) -> List[str]:
+        return [DomainAuthorityScorer._extract_domain(url) for url in self.urls]
+
+    @cached_property
+    def years(self) -> tuple:
+        """(url_index, year) arrays for every (19|20)YY date found in the batch"""
+        positions, years = [], []
+        for m in _DATE_PATTERN.finditer(self._joined):
+            positions.append(m.start())
+            years.append(int(m.group(1)))
+        return self._owner(positions), np.asarray(years, dtype=np.int64)
+
 class URLScorer(ABC):
     __slots__ = ('_weight', '_stats')
     
@@ -78,6 +178,34 @@ class URLScorer(ABC):
         score = self._calculate_score(url) * self._weight
         self._stats.update(score)
         return score
+
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        """Calculate raw scores for a parsed batch.
+
+        Falls back to per-URL scoring; built-in scorers override this with
+        vectorized versions.
+        """
+        return np.fromiter(
+            (self._calculate_score(url) for url in batch.urls),
+            dtype=np.float64,
+            count=len(batch),
+        )
+
+    def score_batch(self, urls: Union[Sequence[str], URLBatch]) -> np.ndarray:
+        """Score many URLs in one call.
+
+        Args:
+            urls: URLs to score, or an already parsed URLBatch
+
+        Returns:
+            Array of weighted scores, same order as ``urls``
+        """
+        batch = urls if isinstance(urls, URLBatch) else URLBatch(urls)
+        if not len(batch):
+            return np.zeros(0, dtype=np.float64)
+        scores = self._calculate_scores(batch) * self._weight
+        self._stats.update_batch(scores)
+        return scores
     
     @property
     def stats(self):
@@ -157,6 +285,21 @@ class CompositeScorer(URLScorer):
         self.stats.update(score)
         return score
 
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        """Vectorized combined score; the batch is parsed once for all children.
+
+        Child scores pass through float32 like the pre-allocated score array
+        used by score(), so both paths return the same values.
+        """
+        total = np.zeros(len(batch), dtype=np.float64)
+        for scorer in self._scorers:
+            total += scorer.score_batch(batch).astype(np.float32)
+
+        if self._normalize and self._scorers:
+            return total / len(self._scorers)
+
+        return total
+
 class KeywordRelevanceScorer(URLScorer):
     __slots__ = ('_weight', '_stats', '_keywords', '_case_sensitive')
     
@@ -187,6 +330,17 @@ class KeywordRelevanceScorer(URLScorer):
             
         return matches / len(self._keywords)
 
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        """Vectorized substring matching over the whole batch"""
+        if not self._keywords:
+            # Mirrors the scalar path, which divides by the keyword count
+            return np.zeros(len(batch), dtype=np.float64)
+        text = batch.text if self._case_sensitive else batch.lower
+        matches = np.zeros(len(batch), dtype=np.float64)
+        for keyword in self._keywords:
+            matches += np.char.find(text, keyword) >= 0
+        return matches / len(self._keywords)
+
 class PathDepthScorer(URLScorer):
     __slots__ = ('_weight', '_stats', '_optimal_depth')  # Remove _url_cache
     
@@ -244,6 +398,15 @@ class PathDepthScorer(URLScorer):
             
         return 1.0 / (1.0 + distance)                                             
 
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        distance = np.abs(batch.depths - self._optimal_depth)
+        lookup = np.array(_SCORE_LOOKUP)
+        return np.where(
+            distance < len(_SCORE_LOOKUP),
+            lookup[np.minimum(distance, len(_SCORE_LOOKUP) - 1)],
+            1.0 / (1.0 + distance),
+        )
+
 class ContentTypeScorer(URLScorer):
     __slots__ = ('_weight', '_exact_types', '_regex_types')
 
@@ -329,6 +492,25 @@ class ContentTypeScorer(URLScorer):
 
         return 0.0
 
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        """Extension lookup per unique extension, regex only for the misses"""
+        unique_exts, inverse = np.unique(batch.extensions, return_inverse=True)
+        exact = np.array(
+            [self._exact_types.get(ext, np.nan) if ext else np.nan for ext in unique_exts],
+            dtype=np.float64,
+        )
+        scores = exact[inverse.reshape(-1)] if len(unique_exts) else np.full(len(batch), np.nan)
+
+        misses = np.flatnonzero(np.isnan(scores))
+        scores[misses] = 0.0
+        for i in misses:
+            url = batch.urls[i]
+            for pattern, score in self._regex_types:
+                if pattern.search(url):
+                    scores[i] = score
+                    break
+        return scores
+
 class FreshnessScorer(URLScorer):
     __slots__ = ('_weight', '_date_pattern', '_current_year')
 
@@ -350,19 +532,7 @@ class FreshnessScorer(URLScorer):
         
         # Combined pattern for all date formats
         # Uses non-capturing groups (?:) and alternation
-        self._date_pattern = re.compile(
-            r'(?:/'  # Path separator
-            r'|[-_])'  # or date separators
-            r'((?:19|20)\d{2})'  # Year group (1900-2099)
-            r'(?:'  # Optional month/day group
-            r'(?:/|[-_])'  # Date separator  
-            r'(?:\d{2})'  # Month
-            r'(?:'  # Optional day
-            r'(?:/|[-_])'  # Date separator
-            r'(?:\d{2})'  # Day
-            r')?'  # Day is optional
-            r')?'  # Month/day group is optional
-        )
+        self._date_pattern = _DATE_PATTERN
 
     @lru_cache(maxsize=10000)
     def _extract_year(self, url: str) -> Optional[int]:
@@ -411,6 +581,22 @@ class FreshnessScorer(URLScorer):
         # Fallback calculation for older content
         return max(0.1, 1.0 - year_diff * 0.1)
 
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        current_year = self._current_year
+        owners, years = batch.years
+        valid = years <= current_year
+        latest = np.full(len(batch), -1, dtype=np.int64)
+        np.maximum.at(latest, owners[valid], years[valid])
+        year_diff = current_year - latest
+        lookup = np.array(_FRESHNESS_SCORES)
+        scores = np.where(
+            year_diff < len(_FRESHNESS_SCORES),
+            lookup[np.clip(year_diff, 0, len(_FRESHNESS_SCORES) - 1)],
+            np.maximum(0.1, 1.0 - year_diff * 0.1),
+        )
+        # No year found -> default score
+        return np.where(latest < 0, 0.5, scores)
+
 class DomainAuthorityScorer(URLScorer):
     __slots__ = ('_weight', '_domain_weights', '_default_weight', '_top_domains')
     
@@ -516,4 +702,16 @@ class DomainAuthorityScorer(URLScorer):
             return score
             
         # Regular path: check all domains
-        return self._domain_weights.get(domain, self._default_weight)
\ No newline at end of file
+        return self._domain_weights.get(domain, self._default_weight)
+
+    def _calculate_scores(self, batch: URLBatch) -> np.ndarray:
+        """One dict lookup per unique domain, broadcast back to the batch"""
+        unique_domains, inverse = np.unique(np.array(batch.domains, dtype=str), return_inverse=True)
+        table = np.array(
+            [
+                self._top_domains.get(domain, self._domain_weights.get(domain, self._default_weight))
+                for domain in unique_domains
+            ],
+            dtype=np.float64,
+        )
+        return table[inverse.reshape(-1)]
\ No newline at end of file
@@ -0,0 +1,183 @@
+# visited.py
+import math
+from collections.abc import MutableSet
+from typing import Iterable, List, Union
+
+import xxhash
+
+_MASK64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """
+    Fixed-capacity Bloom filter backed by a ``bytearray``.
+
+    Uses one 128-bit xxh3 digest per item split into two 64-bit halves and
+    Kirsch-Mitzenmacher double hashing to derive the ``hashes`` bit positions,
+    so adding or checking a URL costs a single hash call.
+
+    Args:
+        capacity: Number of items the filter is sized for.
+        error_rate: False-positive probability once ``capacity`` items are stored.
+    """
+    __slots__ = ("capacity", "error_rate", "size", "hashes", "bits", "count")
+
+    def __init__(self, capacity: int, error_rate: float):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hashes = max(1, int(round(self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    @staticmethod
+    def digest(item: str) -> int:
+        """128-bit hash of ``item``; compute once and reuse across filters."""
+        return xxhash.xxh3_128_intdigest(item.encode("utf-8"))
+
+    def _positions(self, digest: int) -> List[int]:
+        h1 = digest & _MASK64
+        h2 = (digest >> 64) | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hashes)]
+
+    def add_digest(self, digest: int) -> bool:
+        """Add a pre-hashed item. Returns True if it was (probably) not present before."""
+        bits = self.bits
+        added = False
+        for pos in self._positions(digest):
+            byte, mask = pos >> 3, 1 << (pos & 7)
+            if not bits[byte] & mask:
+                bits[byte] |= mask
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def contains_digest(self, digest: int) -> bool:
+        bits = self.bits
+        for pos in self._positions(digest):
+            if not bits[pos >> 3] & (1 << (pos & 7)):
+                return False
+        return True
+
+    def add(self, item: str) -> bool:
+        """Add an item. Returns True if it was (probably) not present before."""
+        return self.add_digest(self.digest(item))
+
+    def __contains__(self, item: str) -> bool:
+        return self.contains_digest(self.digest(item))
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def is_full(self) -> bool:
+        return self.count >= self.capacity
+
+
+class ScalableBloomFilter(MutableSet):
+    """
+    Bloom filter that grows as URLs are added while keeping the overall
+    false-positive rate bounded (Almeida et al., "Scalable Bloom Filters").
+
+    When the newest slice reaches its capacity a new slice is appended with
+    ``growth`` times the capacity and ``tightening`` times the error rate, so
+    the compounded error never exceeds ``error_rate``. Memory is roughly
+    ``1.44 * log2(1/error_rate)`` bits per URL instead of a full Python string.
+
+    Behaves like a ``set`` for the operations the deep crawl strategies use
+    (``in``, ``add``, ``update``, ``len``). Membership may return a false
+    positive, meaning a never-seen URL is occasionally skipped; it never
+    returns a false negative. Items cannot be removed or iterated.
+
+    Args:
+        initial_capacity: Capacity of the first slice.
+        error_rate: Upper bound on the overall false-positive probability.
+        growth: Capacity multiplier for each new slice.
+        tightening: Error-rate multiplier for each new slice (0 < r < 1).
+    """
+
+    def __init__(
+        self,
+        initial_capacity: int = 100_000,
+        error_rate: float = 1e-4,
+        growth: int = 2,
+        tightening: float = 0.5,
+    ):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self.growth = growth
+        self.tightening = tightening
+        self.filters: List[BloomFilter] = [
+            BloomFilter(initial_capacity, error_rate * (1 - tightening))
+        ]
+
+    def __contains__(self, item: object) -> bool:
+        digest = BloomFilter.digest(item)
+        return any(bloom.contains_digest(digest) for bloom in reversed(self.filters))
+
+    def add(self, item: str) -> None:
+        digest = BloomFilter.digest(item)
+        if any(bloom.contains_digest(digest) for bloom in reversed(self.filters)):
+            return
+        bloom = self.filters[-1]
+        if bloom.is_full:
+            bloom = BloomFilter(bloom.capacity * self.growth, bloom.error_rate * self.tightening)
+            self.filters.append(bloom)
+        bloom.add_digest(digest)
+
+    def update(self, items: Iterable[str]) -> None:
+        for item in items:
+            self.add(item)
+
+    def discard(self, item: str) -> None:
+        raise TypeError("Items cannot be removed from a Bloom filter")
+
+    def __iter__(self):
+        raise TypeError("A Bloom filter does not store its items and cannot be iterated")
+
+    def __len__(self) -> int:
+        return sum(len(bloom) for bloom in self.filters)
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the bit arrays."""
+        return sum(len(bloom.bits) for bloom in self.filters)
+
+
+VISITED_BACKENDS = ("set", "bloom", "auto")
+
+# "auto" keeps an exact set for crawls whose max_pages is at or below this
+AUTO_EXACT_SET_MAX_PAGES = 100_000
+
+
+def create_visited_set(
+    backend: str = "set",
+    error_rate: float = 1e-4,
+    max_pages: Union[int, float] = math.inf,
+) -> MutableSet:
+    """
+    Build the URL set used to track visited/seen URLs during a deep crawl.
+
+    Args:
+        backend: ``"set"`` for an exact Python set, ``"bloom"`` for a
+            :class:`ScalableBloomFilter`, or ``"auto"`` to use an exact set for
+            small crawls (``max_pages`` <= 100k) and a Bloom filter otherwise.
+        error_rate: False-positive bound for the Bloom filter.
+        max_pages: Page budget of the crawl, used by ``"auto"`` and to size the
+            first Bloom slice.
+    """
+    if backend not in VISITED_BACKENDS:
+        raise ValueError(f"visited_backend must be one of {VISITED_BACKENDS}, got {backend!r}")
+    if backend == "auto":
+        backend = "set" if max_pages <= AUTO_EXACT_SET_MAX_PAGES else "bloom"
+    if backend == "set":
+        return set()
+    # Pages link out to many more URLs than are crawled, so size the first slice generously
+    initial_capacity = 100_000 if math.isinf(max_pages) else min(10_000_000, max(10_000, int(max_pages) * 10))
+    return ScalableBloomFilter(initial_capacity=initial_capacity, error_rate=error_rate)
@@ -0,0 +1,328 @@
+"""
+embedding_store.py
+Persistent embedding cache and incremental nearest-neighbour index used by
+the embedding strategy of the adaptive crawler.
+
+* EmbeddingStore      - on-disk cache keyed by (model, text hash); vectors live
+                        in a memory-mapped float32 file, keys in SQLite
+* IncrementalNNIndex  - exact cosine index over a growable, pre-normalised matrix
+* QueryCoverage       - best similarity of each query point to a growing corpus,
+                        updated with the new rows only
+"""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import threading
+from typing import Awaitable, Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if vectors.ndim == 1:
+        vectors = vectors.reshape(1, -1)
+    return vectors / (np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-8)
+
+
+def _text_key(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class _ModelSpace:
+    """
+    Vectors of one embedding model: ``vectors.f32`` (memory-mapped rows) + ``keys.db`` (hash -> row).
+
+    Several processes may share a space: rows are allocated inside an
+    ``IMMEDIATE`` SQLite transaction, which holds the database write lock
+    until the keys are committed, and the next free row is derived from the
+    table rather than from a per-process counter.
+    """
+
+    def __init__(self, directory: str, initial_capacity: int):
+        os.makedirs(directory, exist_ok=True)
+        self.vectors_path = os.path.join(directory, "vectors.f32")
+        self.initial_capacity = initial_capacity
+        # Autocommit mode, transactions are opened explicitly in append()
+        self.conn = sqlite3.connect(
+            os.path.join(directory, "keys.db"), check_same_thread=False, isolation_level=None, timeout=30.0
+        )
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS keys (hash TEXT PRIMARY KEY, row INTEGER NOT NULL) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            """
+        )
+        self.dim: Optional[int] = None
+        self.vectors: Optional[np.memmap] = None
+        self.refresh()
+
+    def _next_row(self) -> int:
+        return self.conn.execute("SELECT COALESCE(MAX(row) + 1, 0) FROM keys").fetchone()[0]
+
+    def refresh(self, min_rows: int = 1) -> None:
+        """Pick up a dimension or rows written by another process."""
+        if self.dim is None:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+            if row is None:
+                return
+            self.dim = int(row[0])
+        if self.vectors is None or len(self.vectors) < min_rows:
+            self._open(max(min_rows, 1))
+
+    def _open(self, min_rows: int) -> None:
+        row_bytes = self.dim * 4
+        size = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+        capacity = size // row_bytes
+        if self.vectors is not None:
+            self.vectors.flush()
+            self.vectors = None
+        if capacity < min_rows:
+            capacity = max(min_rows, capacity * 2, self.initial_capacity)
+            with open(self.vectors_path, "ab") as f:
+                f.truncate(capacity * row_bytes)
+        self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dim))
+
+    def lookup(self, hashes: Sequence[str]) -> dict:
+        found = {}
+        for i in range(0, len(hashes), 500):
+            chunk = hashes[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT hash, row FROM keys WHERE hash IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            found.update(rows)
+        return found
+
+    def append(self, hashes: Sequence[str], vectors: np.ndarray) -> None:
+        vectors = np.asarray(vectors, dtype=np.float32)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+            if row is None:
+                self.conn.execute("INSERT INTO meta (key, value) VALUES ('dim', ?)", (str(vectors.shape[1]),))
+                row = (vectors.shape[1],)
+            self.dim = int(row[0])
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Embedding dimension changed from {self.dim} to {vectors.shape[1]}")
+
+            # Another process may have stored some of these since our lookup
+            existing = self.lookup(list(hashes))
+            keep = [i for i, h in enumerate(hashes) if h not in existing]
+            if keep:
+                start = self._next_row()
+                self.refresh(start + len(keep))
+                self.vectors[start:start + len(keep)] = vectors[keep]
+                self.vectors.flush()
+                # Keys are committed after the vectors are on disk, so a crash never
+                # leaves a key pointing at an unwritten row
+                self.conn.executemany(
+                    "INSERT INTO keys (hash, row) VALUES (?, ?)",
+                    [(hashes[i], start + n) for n, i in enumerate(keep)],
+                )
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+    def close(self) -> None:
+        if self.vectors is not None:
+            self.vectors.flush()
+            self.vectors = None
+        self.conn.close()
+
+
+class EmbeddingStore:
+    """
+    On-disk embedding cache keyed by ``(model, sha1(text))``.
+
+    Each model gets its own directory with a memory-mapped ``float32`` matrix
+    that grows by doubling, plus a small SQLite table mapping text hashes to
+    rows. Lookups touch only the rows they need, so the store can hold far
+    more vectors than fit in RAM, and embeddings survive across crawls and
+    processes: a text that was embedded once is never sent to the model again.
+    Processes may share one store directory.
+
+    Args:
+        path: Directory holding the store.
+        initial_capacity: Rows pre-allocated for a new model.
+    """
+
+    def __init__(self, path: str, initial_capacity: int = 1024):
+        self.path = path
+        self.initial_capacity = initial_capacity
+        self._spaces = {}
+        self._lock = threading.Lock()
+        os.makedirs(path, exist_ok=True)
+
+    def _space(self, model: str) -> _ModelSpace:
+        space = self._spaces.get(model)
+        if space is None:
+            directory = os.path.join(self.path, hashlib.sha1(model.encode("utf-8")).hexdigest()[:16])
+            space = self._spaces[model] = _ModelSpace(directory, self.initial_capacity)
+        return space
+
+    def get_many(self, model: str, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Cached vectors for ``texts`` (``None`` where missing)."""
+        hashes = [_text_key(t) for t in texts]
+        with self._lock:
+            space = self._space(model)
+            rows = space.lookup(list(set(hashes)))
+            if not rows:
+                return [None] * len(texts)
+            space.refresh(max(rows.values()) + 1)
+            return [np.array(space.vectors[rows[h]]) if h in rows else None for h in hashes]
+
+    def put_many(self, model: str, texts: Sequence[str], vectors: np.ndarray) -> None:
+        """Store vectors for ``texts``; texts already present are skipped."""
+        unique = {}
+        for text, vector in zip(texts, vectors):
+            unique.setdefault(_text_key(text), vector)
+        with self._lock:
+            space = self._space(model)
+            existing = space.lookup(list(unique))
+            new = [(h, v) for h, v in unique.items() if h not in existing]
+            if new:
+                space.append([h for h, _ in new], np.vstack([v for _, v in new]))
+
+    async def embed(
+        self,
+        model: str,
+        texts: Sequence[str],
+        embed_fn: Callable[[List[str]], Awaitable[np.ndarray]],
+    ) -> np.ndarray:
+        """
+        Return embeddings for ``texts``, calling ``embed_fn`` only for texts
+        that are not in the store yet (each distinct text once). Store reads
+        and writes run in a worker thread, off the event loop.
+        """
+        if not texts:
+            return np.array([])
+        cached = await asyncio.to_thread(self.get_many, model, texts)
+        missing = list(dict.fromkeys(t for t, v in zip(texts, cached) if v is None))
+        if missing:
+            fresh = np.asarray(await embed_fn(missing), dtype=np.float32)
+            await asyncio.to_thread(self.put_many, model, missing, fresh)
+            by_text = dict(zip(missing, fresh))
+            cached = [v if v is not None else by_text[t] for t, v in zip(texts, cached)]
+        return np.vstack(cached)
+
+    def close(self) -> None:
+        with self._lock:
+            for space in self._spaces.values():
+                space.close()
+            self._spaces.clear()
+
+
+class IncrementalNNIndex:
+    """
+    Exact cosine nearest-neighbour index that grows in place.
+
+    Vectors are normalised once on insert and appended to a buffer that
+    doubles when full, so adding a batch costs O(batch) and a query is a
+    single matrix product over the stored rows. At adaptive-crawl scale (up
+    to tens of thousands of pages) this is faster than an approximate index
+    and exact.
+    """
+
+    def __init__(self, capacity: int = 256):
+        self._capacity = capacity
+        self._data: Optional[np.ndarray] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Normalised stored vectors."""
+        if self._data is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._data[:self._size]
+
+    def add(self, vectors: np.ndarray) -> None:
+        vectors = _normalize(vectors)
+        if not len(vectors):
+            return
+        if self._data is None:
+            self._data = np.empty((max(self._capacity, len(vectors)), vectors.shape[1]), dtype=np.float32)
+        needed = self._size + len(vectors)
+        if needed > len(self._data):
+            grown = np.empty((max(needed, 2 * len(self._data)), self._data.shape[1]), dtype=np.float32)
+            grown[:self._size] = self._data[:self._size]
+            self._data = grown
+        self._data[self._size:needed] = vectors
+        self._size = needed
+
+    def similarities(self, queries: np.ndarray) -> np.ndarray:
+        """Cosine similarity of each query to every stored vector, shape ``(len(queries), len(self))``."""
+        return _normalize(queries) @ self.vectors.T
+
+    def max_similarity(self, queries: np.ndarray) -> np.ndarray:
+        """Best cosine similarity of each query (``-1`` when the index is empty)."""
+        queries = _normalize(queries)
+        if not self._size:
+            return np.full(len(queries), -1.0, dtype=np.float32)
+        return (queries @ self.vectors.T).max(axis=1)
+
+    def search(self, queries: np.ndarray, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """Top-``k`` ``(similarities, indices)`` per query, best first."""
+        sims = self.similarities(queries)
+        k = min(k, self._size)
+        if k == 0:
+            empty = np.empty((len(sims), 0))
+            return empty, empty.astype(int)
+        idx = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(sims, idx, axis=1)
+        order = np.argsort(-top, axis=1)
+        return np.take_along_axis(top, order, axis=1), np.take_along_axis(idx, order, axis=1)
+
+    def reset(self) -> None:
+        self._data = None
+        self._size = 0
+
+
+class QueryCoverage:
+    """
+    Best cosine similarity of each query point to a corpus that only grows.
+
+    ``sync(corpus)`` compares the query points against the rows added since
+    the previous call, so coverage and gap metrics cost O(new rows) per round
+    instead of a full query x corpus matrix. If the corpus or the query
+    points are replaced, the tracker starts over.
+    """
+
+    def __init__(self):
+        self._queries: Optional[np.ndarray] = None
+        self._query_key = None
+        self._best: Optional[np.ndarray] = None
+        self._rows = 0
+        self._anchor = None
+
+    @staticmethod
+    def _row_key(corpus: np.ndarray, i: int) -> int:
+        return hash(np.asarray(corpus[i]).tobytes())
+
+    def sync(self, queries: np.ndarray, corpus: np.ndarray) -> np.ndarray:
+        """Return the best similarity per query against ``corpus``."""
+        query_key = hash(np.asarray(queries).tobytes())
+        n = len(corpus)
+        # The corpus is unchanged up to the rows already seen iff its first and
+        # last-seen rows still match
+        same_prefix = (
+            self._rows <= n
+            and self._anchor == ((self._row_key(corpus, 0), self._row_key(corpus, self._rows - 1)) if self._rows else None)
+        )
+        if query_key != self._query_key or not same_prefix:
+            self._queries = _normalize(queries)
+            self._query_key = query_key
+            self._best = np.full(len(self._queries), -1.0, dtype=np.float32)
+            self._rows = 0
+        if n > self._rows:
+            block = self._queries @ _normalize(corpus[self._rows:]).T
+            self._best = np.maximum(self._best, block.max(axis=1))
+            self._rows = n
+            self._anchor = (self._row_key(corpus, 0), self._row_key(corpus, n - 1))
+        return self._best
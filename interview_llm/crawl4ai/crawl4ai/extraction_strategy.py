@@ -4,6 +4,7 @@ from typing import Any, List, Dict, Optional, Tuple, Pattern, Union
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
 import time
+import weakref
 from enum import IntFlag, auto
 
 from .prompts import PROMPT_EXTRACT_BLOCKS, PROMPT_EXTRACT_BLOCKS_WITH_INSTRUCTION, PROMPT_EXTRACT_SCHEMA_WITH_INSTRUCTION, JSON_SCHEMA_BUILDER_XPATH, PROMPT_EXTRACT_INFERRED_SCHEMA
@@ -32,9 +33,12 @@ from .models import TokenUsage
 from .model_loader import * # noqa: F403
 from .model_loader import (
     get_device,
+    get_model_registry,
     load_HF_embedding_model,
     load_text_multilabel_classifier,
-    calculate_batch_size
+    calculate_batch_size,
+    BatchedEmbeddingService,
+    _load_text_multilabel_classifier,
 )
 
 from .types import LLMConfig, create_llm_config
@@ -151,6 +155,10 @@ class CosineStrategy(ExtractionStrategy):
         top_k (int): Number of top categories to extract.
         model_name (str): The name of the sentence-transformers model.
         sim_threshold (float): The similarity threshold for clustering.
+
+    Models come from the process-wide ModelRegistry, so creating many
+    CosineStrategy instances loads the weights once; embeddings go through a
+    shared BatchedEmbeddingService that batches concurrent extraction calls.
     """
 
     def __init__(
@@ -205,9 +213,15 @@ class CosineStrategy(ExtractionStrategy):
         #     self.get_embedding_method = "direct"
         # else:
 
-        self.tokenizer, self.model = load_HF_embedding_model(model_name)
-        self.model.to(self.device)
-        self.model.eval()
+        # Shared, reference-counted models: released when this strategy is garbage collected
+        registry = get_model_registry()
+        service_key = ("embedding_service", model_name)
+        classifier_key = ("text_multilabel_classifier",)
+        self.embedding_service = registry.acquire(
+            service_key, lambda: BatchedEmbeddingService(model_name, registry=registry)
+        )
+        weakref.finalize(self, registry.release, service_key)
+        self.tokenizer, self.model = self.embedding_service.tokenizer, self.embedding_service.model
 
         self.get_embedding_method = "batch"
 
@@ -229,7 +243,8 @@ class CosineStrategy(ExtractionStrategy):
         if self.verbose:
             print(f"[LOG] Loading Multilabel Classifier for {self.device.type} device.")
 
-        self.nlp, _ = load_text_multilabel_classifier()
+        self.nlp, _ = registry.acquire(classifier_key, _load_text_multilabel_classifier)
+        weakref.finalize(self, registry.release, classifier_key)
         # self.default_batch_size = 16 if self.device.type == 'cpu' else 64
 
         if self.verbose:
@@ -311,31 +326,8 @@ class CosineStrategy(ExtractionStrategy):
         #     return self.buffer_embeddings
 
         if self.device.type in ["cpu", "gpu", "cuda", "mps"]:
-            import torch
-
-            # Tokenize sentences and convert to tensor
-            if batch_size is None:
-                batch_size = self.default_batch_size
-
-            all_embeddings = []
-            for i in range(0, len(sentences), batch_size):
-                batch_sentences = sentences[i : i + batch_size]
-                encoded_input = self.tokenizer(
-                    batch_sentences, padding=True, truncation=True, return_tensors="pt"
-                )
-                encoded_input = {
-                    key: tensor.to(self.device) for key, tensor in encoded_input.items()
-                }
-
-                # Ensure no gradients are calculated
-                with torch.no_grad():
-                    model_output = self.model(**encoded_input)
-
-                # Get embeddings from the last hidden state (mean pooling)
-                embeddings = model_output.last_hidden_state.mean(dim=1).cpu().numpy()
-                all_embeddings.append(embeddings)
-
-            self.buffer_embeddings = np.vstack(all_embeddings)
+            # Batched with concurrent calls from other strategy instances/threads
+            self.buffer_embeddings = self.embedding_service.embed(sentences)
         elif self.device.type == "cpu":
             # self.buffer_embeddings = self.model(sentences)
             if batch_size is None:
@@ -1276,7 +1268,7 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         schema_type: str = "CSS", # or XPATH
         query: str = None,
         target_json_example: str = None,
-        llm_config: 'LLMConfig' = create_llm_config(),
+        llm_config: 'LLMConfig' = None,
         provider: str = None,
         api_token: str = None,
         **kwargs
@@ -1289,7 +1281,7 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
             query (str, optional): Natural language description of what data to extract
             provider (str): Legacy Parameter. LLM provider to use 
             api_token (str): Legacy Parameter. API token for LLM provider
-            llm_config (LLMConfig): LLM configuration object
+            llm_config (LLMConfig): LLM configuration object (defaults to LLMConfig())
             prompt (str, optional): Custom prompt template to use
             **kwargs: Additional args passed to LLM processor
             
@@ -1298,6 +1290,8 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         """
         from .prompts import JSON_SCHEMA_BUILDER
         from .utils import perform_completion_with_backoff
+        if llm_config is None:
+            llm_config = create_llm_config()
         for name, message in JsonElementExtractionStrategy._GENERATE_SCHEMA_UNWANTED_PROPS.items():
             if locals()[name] is not None:
                 raise AttributeError(f"Setting '{name}' is deprecated. {message}")
@@ -0,0 +1,92 @@
+"""
+import_benchmark.py
+Cold-start import time of crawl4ai entry points, measured in fresh interpreters.
+
+    python -m crawl4ai.import_benchmark
+    python -m crawl4ai.import_benchmark --repeat 10 --budget 1.0 "from crawl4ai import AsyncWebCrawler"
+
+Each statement runs ``--repeat`` times in a new ``python -X importtime``
+process; the median wall time is reported together with the slowest modules
+of the last run. With ``--budget`` the command exits non-zero when any median
+exceeds it, so it can guard worker and CLI start-up time in CI.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+DEFAULT_STATEMENTS = [
+    "import crawl4ai",
+    "from crawl4ai import BrowserConfig, CrawlerRunConfig, CacheMode",
+    "from crawl4ai import AsyncWebCrawler",
+    "from crawl4ai import AdaptiveCrawler",
+    "import crawl4ai.cli",
+]
+
+_TIMER = "import time as _t; _s = _t.perf_counter(); {statement}; print(_t.perf_counter() - _s)"
+
+
+def _parse_importtime(stderr: str) -> List[Tuple[str, int]]:
+    """``(module, cumulative microseconds)`` pairs from ``-X importtime`` output."""
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            modules.append((name.strip(), int(cumulative)))
+        except ValueError:
+            continue
+    return modules
+
+
+def measure(statement: str, repeat: int = 5, top: int = 10) -> Dict:
+    """Run ``statement`` in ``repeat`` fresh interpreters and summarise the timings."""
+    timings = []
+    modules: List[Tuple[str, int]] = []
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _TIMER.format(statement=statement)],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"{statement!r} failed:\n{proc.stderr[-2000:]}")
+        timings.append(float(proc.stdout.strip().splitlines()[-1]))
+        modules = _parse_importtime(proc.stderr)
+    return {
+        "statement": statement,
+        "median": statistics.median(timings),
+        "min": min(timings),
+        "modules_loaded": len(modules),
+        "slowest": sorted(modules, key=lambda m: m[1], reverse=True)[:top],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Crawl4AI import-time benchmark")
+    parser.add_argument("statements", nargs="*", help="Import statements to time (defaults to common entry points)")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per statement")
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules to list per statement")
+    parser.add_argument("--budget", type=float, default=None, help="Fail if any median exceeds this many seconds")
+    args = parser.parse_args()
+
+    over_budget = []
+    for statement in args.statements or DEFAULT_STATEMENTS:
+        result = measure(statement, repeat=args.repeat, top=args.top)
+        print(f"{result['median'] * 1000:8.1f} ms  (min {result['min'] * 1000:.1f} ms, "
+              f"{result['modules_loaded']} modules)  {statement}")
+        for name, cumulative in result["slowest"]:
+            print(f"{'':12}{cumulative / 1000:8.1f} ms  {name}")
+        if args.budget is not None and result["median"] > args.budget:
+            over_budget.append(statement)
+
+    if over_budget:
+        print(f"Over budget ({args.budget}s): {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
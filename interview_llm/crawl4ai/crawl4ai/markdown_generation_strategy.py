@@ -4,6 +4,7 @@ from .models import MarkdownGenerationResult
 from .html2text import CustomHTML2Text
 # from .types import RelevantContentFilter
 from .content_filter_strategy import RelevantContentFilter
+import inspect
 import re
 from urllib.parse import urljoin
 
@@ -232,7 +233,11 @@ class DefaultMarkdownGenerator(MarkdownGenerationStrategy):
             if content_filter or self.content_filter:
                 try:
                     content_filter = content_filter or self.content_filter
-                    filtered_html = content_filter.filter_content(input_html)
+                    if base_url and "base_url" in inspect.signature(content_filter.filter_content).parameters:
+                        # Lets filters such as BM25ContentFilter keep per-site state
+                        filtered_html = content_filter.filter_content(input_html, base_url=base_url)
+                    else:
+                        filtered_html = content_filter.filter_content(input_html)
                     filtered_html = "\n".join(
                         "<div>{}</div>".format(s) for s in filtered_html
                     )
@@ -1,7 +1,15 @@
 from functools import lru_cache
 from pathlib import Path
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional
 import subprocess, os
+import asyncio
+import gc
+import queue
 import shutil
+import sys
+import threading
+import time
 from .model_loader import *
 import argparse
 from crawl4ai.config import MODEL_REPO_BRANCH
@@ -71,6 +79,300 @@ def get_home_folder():
     return home_folder
 
 
+class _RegistryEntry:
+    __slots__ = ("value", "refcount", "last_used", "lock", "loaded")
+
+    def __init__(self):
+        self.value = None
+        self.refcount = 0
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+        self.loaded = False
+
+
+class ModelRegistry:
+    """
+    Process-wide registry of loaded models, shared by every strategy instance.
+
+    Each model is loaded lazily, once, the first time a key is requested;
+    concurrent requests for the same key wait for that single load. Callers
+    that keep a model for their lifetime ``acquire`` it and ``release`` it when
+    done; once nobody holds a model and it has been idle for ``idle_timeout``
+    seconds it is dropped (and ``close()``d if it has one) to free memory.
+
+    Args:
+        idle_timeout: Seconds an unreferenced model is kept before eviction.
+    """
+
+    def __init__(self, idle_timeout: float = 300.0):
+        self.idle_timeout = idle_timeout
+        self._entries: Dict[Hashable, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+        self._sweeper: Optional[threading.Timer] = None
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], pin: bool) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _RegistryEntry()
+            if pin:
+                entry.refcount += 1
+        try:
+            with entry.lock:
+                if not entry.loaded:
+                    entry.value = loader()
+                    entry.loaded = True
+        except BaseException:
+            with self._lock:
+                if pin:
+                    entry.refcount -= 1
+                if not entry.loaded and entry.refcount == 0 and self._entries.get(key) is entry:
+                    del self._entries[key]
+            raise
+        entry.last_used = time.monotonic()
+        if not pin:
+            self._schedule_sweep()
+        return entry.value
+
+    def acquire(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the model for ``key`` (loading it with ``loader`` if needed) and hold a reference to it."""
+        return self._load(key, loader, pin=True)
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the model for ``key`` without holding a reference; it stays cached until idle."""
+        return self._load(key, loader, pin=False)
+
+    def release(self, key: Hashable) -> None:
+        """Drop a reference taken with ``acquire``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.refcount == 0:
+                return
+            entry.refcount -= 1
+            entry.last_used = time.monotonic()
+        self._schedule_sweep()
+
+    def evict_idle(self, max_idle: Optional[float] = None) -> List[Hashable]:
+        """Unload unreferenced models idle for more than ``max_idle`` seconds (default ``idle_timeout``)."""
+        max_idle = self.idle_timeout if max_idle is None else max_idle
+        now = time.monotonic()
+        with self._lock:
+            evicted = [
+                key for key, entry in self._entries.items()
+                if entry.loaded and entry.refcount == 0 and now - entry.last_used >= max_idle
+            ]
+            values = [self._entries.pop(key).value for key in evicted]
+        if values:
+            self._free(values)
+        return evicted
+
+    def clear(self) -> None:
+        """Unload every model, referenced or not."""
+        with self._lock:
+            values = [entry.value for entry in self._entries.values() if entry.loaded]
+            self._entries.clear()
+        self._free(values)
+
+    def loaded(self) -> Dict[Hashable, int]:
+        """Currently loaded keys and their reference counts."""
+        with self._lock:
+            return {key: entry.refcount for key, entry in self._entries.items() if entry.loaded}
+
+    def _free(self, values: List[Any]) -> None:
+        for value in values:
+            close = getattr(value, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception:
+                    pass
+        del values
+        gc.collect()
+        torch = sys.modules.get("torch")
+        if torch is not None and torch.cuda.is_available():
+            torch.cuda.empty_cache()
+
+    def _schedule_sweep(self) -> None:
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            if not any(entry.refcount == 0 for entry in self._entries.values()):
+                return
+            self._sweeper = threading.Timer(self.idle_timeout, self._sweep)
+            self._sweeper.daemon = True
+            self._sweeper.start()
+
+    def _sweep(self) -> None:
+        with self._lock:
+            self._sweeper = None
+        self.evict_idle()
+        self._schedule_sweep()
+
+
+@lru_cache()
+def get_model_registry() -> ModelRegistry:
+    """The process-wide ModelRegistry."""
+    return ModelRegistry()
+
+
+class BatchedEmbeddingService:
+    """
+    Embeds sentences with a Hugging Face model, batching concurrent requests.
+
+    ``embed`` may be called from any number of threads (for example the
+    section workers of ``CosineStrategy.run``). Requests are queued and a single
+    worker thread drains the queue, waiting up to ``max_wait`` seconds to fill
+    a batch of ``max_batch_size`` sentences, so many small calls share one
+    forward pass instead of each running its own. Sentences are sorted by
+    length inside a batch to minimise padding, and pooling is masked so a
+    sentence gets the same embedding whichever batch it lands in.
+
+    The underlying model is held in the ModelRegistry for the lifetime of the
+    service. Use ``get_embedding_service`` to share one service per model.
+
+    Args:
+        model_name: Hugging Face model to load.
+        max_batch_size: Sentences per forward pass; defaults to the device batch size.
+        max_wait: Seconds to wait for more requests before running a partial batch.
+        registry: Registry to load the model from; defaults to the shared one.
+    """
+
+    def __init__(
+        self,
+        model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+        max_batch_size: Optional[int] = None,
+        max_wait: float = 0.005,
+        registry: Optional[ModelRegistry] = None,
+    ):
+        self.model_name = model_name
+        self.max_wait = max_wait
+        self.registry = registry or get_model_registry()
+        self._model_key = ("hf_embedding", model_name)
+        self.tokenizer, self.model = self.registry.acquire(
+            self._model_key, lambda: _load_HF_embedding_model(model_name)
+        )
+        self.device = get_device()
+        self.max_batch_size = max_batch_size or calculate_batch_size(self.device)
+        self._queue: "queue.Queue" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._closed = False
+
+    def embed(self, sentences: List[str]) -> "np.ndarray":
+        """Embeddings for ``sentences``, one row each."""
+        return self.submit(sentences).result()
+
+    async def aembed(self, sentences: List[str]) -> "np.ndarray":
+        return await asyncio.wrap_future(self.submit(sentences))
+
+    def submit(self, sentences: List[str]) -> Future:
+        """Queue ``sentences`` and return a Future for their embeddings."""
+        if self._closed:
+            raise RuntimeError("BatchedEmbeddingService is closed")
+        future: Future = Future()
+        self._queue.put((list(sentences), future))
+        self._ensure_worker()
+        return future
+
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            # The worker clears _worker under this lock before it exits
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name=f"embedding-batcher-{self.model_name}", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                # Exit when idle; submit() restarts the worker on demand
+                item = self._queue.get(timeout=30)
+            except queue.Empty:
+                with self._worker_lock:
+                    # A submit() may have queued work after the timeout; it saw
+                    # this worker as running, so keep going instead of exiting
+                    if not self._queue.empty():
+                        continue
+                    self._worker = None
+                return
+            if item is None:
+                return
+            requests = [item]
+            size = len(item[0])
+            deadline = time.monotonic() + self.max_wait
+            while size < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None)
+                    break
+                requests.append(item)
+                size += len(item[0])
+            self._process(requests)
+
+    def _process(self, requests: List[tuple]) -> None:
+        import numpy as np
+
+        sentences = [sentence for batch, _ in requests for sentence in batch]
+        try:
+            embeddings = self._encode(sentences) if sentences else np.empty((0, 0), dtype=np.float32)
+        except Exception as e:
+            for _, future in requests:
+                future.set_exception(e)
+            return
+        offset = 0
+        for batch, future in requests:
+            future.set_result(embeddings[offset:offset + len(batch)])
+            offset += len(batch)
+
+    def _encode(self, sentences: List[str]) -> "np.ndarray":
+        import numpy as np
+        import torch
+
+        order = sorted(range(len(sentences)), key=lambda i: len(sentences[i]))
+        chunks = []
+        for i in range(0, len(order), self.max_batch_size):
+            batch = [sentences[j] for j in order[i:i + self.max_batch_size]]
+            encoded_input = self.tokenizer(batch, padding=True, truncation=True, return_tensors="pt")
+            encoded_input = {key: tensor.to(self.device) for key, tensor in encoded_input.items()}
+            with torch.no_grad():
+                model_output = self.model(**encoded_input)
+            # Mean pooling over real tokens only
+            mask = encoded_input["attention_mask"].unsqueeze(-1).to(model_output.last_hidden_state.dtype)
+            summed = (model_output.last_hidden_state * mask).sum(dim=1)
+            chunks.append((summed / mask.sum(dim=1).clamp(min=1e-9)).cpu().numpy())
+        sorted_embeddings = np.vstack(chunks)
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+
+    def close(self) -> None:
+        """Stop the worker and release the model."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self.registry.release(self._model_key)
+
+
+def get_embedding_service(
+    model_name: str = "sentence-transformers/all-MiniLM-L6-v2",
+    registry: Optional[ModelRegistry] = None,
+) -> BatchedEmbeddingService:
+    """Shared BatchedEmbeddingService for ``model_name``, cached in the registry (not referenced)."""
+    registry = registry or get_model_registry()
+    return registry.get(
+        ("embedding_service", model_name),
+        lambda: BatchedEmbeddingService(model_name, registry=registry),
+    )
+
+
 @lru_cache()
 def load_bert_base_uncased():
     from transformers import BertTokenizer, BertModel
@@ -82,16 +384,24 @@ def load_bert_base_uncased():
     return tokenizer, model
 
 
-@lru_cache()
 def load_HF_embedding_model(model_name="BAAI/bge-small-en-v1.5") -> tuple:
     """Load the Hugging Face model for embedding.
 
+    The model is cached in the shared ModelRegistry, so repeated calls return
+    the same instance until it is evicted as idle.
+
     Args:
         model_name (str, optional): The model name to load. Defaults to "BAAI/bge-small-en-v1.5".
 
     Returns:
         tuple: The tokenizer and model.
     """
+    return get_model_registry().get(
+        ("hf_embedding", model_name), lambda: _load_HF_embedding_model(model_name)
+    )
+
+
+def _load_HF_embedding_model(model_name: str) -> tuple:
     from transformers import AutoTokenizer, AutoModel
 
     tokenizer = AutoTokenizer.from_pretrained(model_name, resume_download=None)
@@ -118,8 +428,16 @@ def load_text_classifier():
     return pipe
 
 
-@lru_cache()
 def load_text_multilabel_classifier():
+    """Load the multilabel topic classifier, cached in the shared ModelRegistry.
+
+    Returns:
+        tuple: The classifier function and the device it runs on.
+    """
+    return get_model_registry().get(("text_multilabel_classifier",), _load_text_multilabel_classifier)
+
+
+def _load_text_multilabel_classifier():
     from transformers import AutoModelForSequenceClassification, AutoTokenizer
     from scipy.special import expit
     import torch
@@ -151,6 +151,8 @@ class CrawlResult(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    resource_blocking_stats: Optional[Dict[str, Any]] = None
+    page_timings: Optional[Dict[str, Any]] = None
     tables: List[Dict] = Field(default_factory=list)  # NEW – [{headers,rows,caption,summary}]
 
     class Config:
@@ -331,6 +333,8 @@ class AsyncCrawlResponse(BaseModel):
     redirected_url: Optional[str] = None
     network_requests: Optional[List[Dict[str, Any]]] = None
     console_messages: Optional[List[Dict[str, Any]]] = None
+    resource_blocking_stats: Optional[Dict[str, Any]] = None
+    page_timings: Optional[Dict[str, Any]] = None
 
     class Config:
         arbitrary_types_allowed = True
@@ -1,5 +1,6 @@
 from pathlib import Path
 import asyncio
+from typing import Optional, Tuple
 from dataclasses import asdict
 from crawl4ai.async_logger import AsyncLogger
 from crawl4ai.async_crawler_strategy import AsyncCrawlerStrategy
@@ -36,6 +37,13 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
         save_images_locally (bool): Whether to save images locally.
         extract_images (bool): Whether to extract images from PDF.
         image_save_dir (str): Directory to save extracted images.
+        batch_size (int): Number of threads when pages are processed with threads.
+        executor (str): "thread" or "process"; the process pool scales large PDFs with cores.
+            Its workers are spawned, so scripts using "process" need an
+            ``if __name__ == "__main__":`` guard; otherwise pages fall back to threads.
+        max_workers (int): Number of worker processes in process mode (defaults to CPU count).
+        page_range (tuple): ``(first, last)`` 1-based inclusive pages to process; all pages when None.
+        text_only (bool): Only extract text, skipping images even if ``extract_images`` is set.
         logger (AsyncLogger): Logger instance for recording events and errors.
         
     Methods:
@@ -58,13 +66,21 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
                  extract_images : bool = False,
                  image_save_dir : str = None,
                  batch_size: int = 4,
+                 executor: str = "thread",
+                 max_workers: int = None,
+                 page_range: Optional[Tuple[int, int]] = None,
+                 text_only: bool = False,
                  logger: AsyncLogger = None):
         self.logger = logger
+        self.page_range = page_range
+        self.text_only = text_only
         self.pdf_processor = NaivePDFProcessorStrategy(
             save_images_locally=save_images_locally,
             extract_images=extract_images,
             image_save_dir=image_save_dir,
-            batch_size=batch_size
+            batch_size=batch_size,
+            executor=executor,
+            max_workers=max_workers
         )
         self._temp_files = []  # Track temp files for cleanup
 
@@ -85,15 +101,17 @@ class PDFContentScrapingStrategy(ContentScrapingStrategy):
         try:
             # Process PDF
             # result = self.pdf_processor.process(Path(pdf_path))
-            result = self.pdf_processor.process_batch(Path(pdf_path))
+            result = self.pdf_processor.process_batch(
+                Path(pdf_path), page_range=self.page_range, text_only=self.text_only
+            )
             
             # Combine page HTML
             cleaned_html = f"""
         <html>
             <head><meta name="pdf-pages" content="{len(result.pages)}"></head>
             <body>
-                {''.join(f'<div class="pdf-page" data-page="{i+1}">{page.html}</div>'
-                         for i, page in enumerate(result.pages))}
+                {''.join(f'<div class="pdf-page" data-page="{page.page_number}">{page.html}</div>'
+                         for page in result.pages)}
             </body>
         </html>
         """
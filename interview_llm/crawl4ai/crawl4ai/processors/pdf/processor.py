@@ -5,8 +5,10 @@ from datetime import datetime
 from pathlib import Path
 from time import time
 from dataclasses import dataclass, asdict, field
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple, Union
 import base64
+import mmap
+import os
 import tempfile
 from .utils import *
 from .utils import (
@@ -21,6 +23,8 @@ from .utils import (
 
 logger = logging.getLogger(__name__)
 
+PDF_EXECUTORS = ("thread", "process")
+
 @dataclass
 class PDFMetadata:
     title: Optional[str] = None
@@ -55,13 +59,35 @@ class PDFProcessorStrategy(ABC):
         pass
 
 class NaivePDFProcessorStrategy(PDFProcessorStrategy):
+    """
+    PyPDF2-based PDF processor.
+
+    ``process`` handles pages sequentially. ``process_batch`` and ``iter_pages``
+    parallelize them with either a thread pool (``executor="thread"``) or a
+    process pool (``executor="process"``). PyPDF2 is pure Python, so threads
+    are GIL-bound; the process pool opens and memory-maps the file once per
+    worker, shards page ranges across workers and streams pages back in
+    order, scaling large PDFs with the number of cores.
+
+    Args:
+        batch_size: Number of threads in thread mode.
+        executor: ``"thread"`` or ``"process"``. Worker processes are spawned,
+            which re-imports the calling script, so scripts using ``"process"``
+            need an ``if __name__ == "__main__":`` guard. Without one the pool
+            breaks and the remaining pages are processed with threads, with a
+            warning.
+        max_workers: Number of worker processes in process mode (defaults to CPU count).
+    """
     def __init__(self, image_dpi: int = 144, image_quality: int = 85, extract_images: bool = True, 
-                 save_images_locally: bool = False, image_save_dir: Optional[Path] = None, batch_size: int = 4):
+                 save_images_locally: bool = False, image_save_dir: Optional[Path] = None, batch_size: int = 4,
+                 executor: str = "thread", max_workers: Optional[int] = None):
         # Import check at initialization time
         try:
             import PyPDF2
         except ImportError:
             raise ImportError("PyPDF2 is required for PDF processing. Install with 'pip install crawl4ai[pdf]'")
+        if executor not in PDF_EXECUTORS:
+            raise ValueError(f"executor must be one of {PDF_EXECUTORS}, got {executor!r}")
             
         self.image_dpi = image_dpi
         self.image_quality = image_quality
@@ -70,6 +96,8 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         self.save_images_locally = save_images_locally
         self.image_save_dir = image_save_dir
         self.batch_size = batch_size
+        self.executor = executor
+        self.max_workers = max_workers
         self._temp_dir = None
 
     def process(self, pdf_path: Path) -> PDFProcessResult:
@@ -121,21 +149,25 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         result.processing_time = time() - start_time
         return result
 
-    def process_batch(self, pdf_path: Path) -> PDFProcessResult:
-        """Like process() but processes PDF pages in parallel batches"""
+    def process_batch(
+        self,
+        pdf_path: Path,
+        page_range: Optional[Tuple[int, int]] = None,
+        text_only: bool = False,
+    ) -> PDFProcessResult:
+        """
+        Like process() but processes PDF pages in parallel batches.
+
+        Args:
+            pdf_path: PDF file to process.
+            page_range: ``(first, last)`` 1-based inclusive page numbers; all pages when None.
+            text_only: Skip image extraction regardless of ``extract_images``.
+        """
         # Import inside method to allow dependency to be optional
         try:
             from PyPDF2 import PdfReader
-            import PyPDF2  # For type checking
         except ImportError:
             raise ImportError("PyPDF2 is required for PDF processing. Install with 'pip install crawl4ai[pdf]'")
-            
-        import concurrent.futures
-        import threading
-        
-        # Initialize PyPDF2 thread support
-        if not hasattr(threading.current_thread(), "_children"): 
-            threading.current_thread()._children = set()
         
         start_time = time()
         result = PDFProcessResult(
@@ -151,44 +183,60 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
                 result.metadata = self._extract_metadata(pdf_path, reader)
                 total_pages = len(reader.pages)
 
-            # Handle image directory setup
-            image_dir = None
-            if self.extract_images and self.save_images_locally:
-                if self.image_save_dir:
-                    image_dir = Path(self.image_save_dir)
-                    image_dir.mkdir(exist_ok=True, parents=True)
-                else:
-                    self._temp_dir = tempfile.mkdtemp(prefix='pdf_images_')
-                    image_dir = Path(self._temp_dir)
-
-            def process_page_safely(page_num: int):
-                # Each thread opens its own file handle
-                with pdf_path.open('rb') as file:
-                    thread_reader = PdfReader(file)
-                    page = thread_reader.pages[page_num]
-                    self.current_page_number = page_num + 1
-                    return self._process_page(page, image_dir)
-
-            # Process pages in parallel batches
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.batch_size) as executor:
-                futures = []
-                for page_num in range(total_pages):
-                    future = executor.submit(process_page_safely, page_num)
-                    futures.append((page_num + 1, future))
-
-                # Collect results in order
-                result.pages = [None] * total_pages
-                for page_num, future in futures:
-                    try:
-                        pdf_page = future.result()
-                        result.pages[page_num - 1] = pdf_page
-                    except Exception as e:
-                        logger.error(f"Failed to process page {page_num}: {str(e)}")
-                        raise
+            result.pages = list(self._iter_pages(pdf_path, self._page_indices(total_pages, page_range), text_only))
 
         except Exception as e:
             logger.error(f"Failed to process PDF: {str(e)}")
             raise
+
+        result.processing_time = time() - start_time
+        return result
+
+    def iter_pages(
+        self,
+        pdf_path: Path,
+        page_range: Optional[Tuple[int, int]] = None,
+        text_only: bool = False,
+    ) -> Iterator[PDFPage]:
+        """
+        Process pages in parallel and yield them in page order as soon as each
+        is ready, without holding the whole document in memory.
+
+        Takes the same arguments as ``process_batch``.
+        """
+        try:
+            from PyPDF2 import PdfReader
+        except ImportError:
+            raise ImportError("PyPDF2 is required for PDF processing. Install with 'pip install crawl4ai[pdf]'")
+
+        with pdf_path.open('rb') as file:
+            total_pages = len(PdfReader(file).pages)
+        yield from self._iter_pages(pdf_path, self._page_indices(total_pages, page_range), text_only)
+
+    @staticmethod
+    def _page_indices(total_pages: int, page_range: Optional[Tuple[int, int]]) -> List[int]:
+        if page_range is None:
+            return list(range(total_pages))
+        first, last = page_range
+        return list(range(max(first, 1) - 1, min(last, total_pages)))
+
+    def _image_dir(self) -> Optional[Path]:
+        if not (self.extract_images and self.save_images_locally):
+            return None
+        if self.image_save_dir:
+            image_dir = Path(self.image_save_dir)
+            image_dir.mkdir(exist_ok=True, parents=True)
+            return image_dir
+        self._temp_dir = tempfile.mkdtemp(prefix='pdf_images_')
+        return Path(self._temp_dir)
+
+    def _iter_pages(self, pdf_path: Path, page_indices: List[int], text_only: bool) -> Iterator[PDFPage]:
+        image_dir = None if text_only else self._image_dir()
+        try:
+            if self.executor == "process":
+                yield from self._iter_pages_processes(pdf_path, page_indices, image_dir, text_only)
+            else:
+                yield from self._iter_pages_threads(pdf_path, page_indices, image_dir, text_only)
         finally:
             # Cleanup temp directory if it was created
             if self._temp_dir and not self.image_save_dir:
@@ -197,13 +245,94 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
                     shutil.rmtree(self._temp_dir)
                 except Exception as e:
                     logger.error(f"Failed to cleanup temp directory: {str(e)}")
+                self._temp_dir = None
 
-        result.processing_time = time() - start_time
-        return result
+    def _iter_pages_threads(
+        self, pdf_path: Path, page_indices: List[int], image_dir: Optional[Path], text_only: bool
+    ) -> Iterator[PDFPage]:
+        from PyPDF2 import PdfReader
+        import concurrent.futures
+        import threading
+        
+        # Initialize PyPDF2 thread support
+        if not hasattr(threading.current_thread(), "_children"): 
+            threading.current_thread()._children = set()
+
+        def process_page_safely(page_num: int):
+            # Each thread opens its own file handle
+            with pdf_path.open('rb') as file:
+                thread_reader = PdfReader(file)
+                page = thread_reader.pages[page_num]
+                self.current_page_number = page_num + 1
+                return self._process_page(page, image_dir, text_only=text_only, page_number=page_num + 1)
+
+        # Process pages in parallel batches
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.batch_size) as executor:
+            futures = [(page_num + 1, executor.submit(process_page_safely, page_num)) for page_num in page_indices]
+            try:
+                # Collect results in order
+                for page_num, future in futures:
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        logger.error(f"Failed to process page {page_num}: {str(e)}")
+                        raise
+            finally:
+                for _, future in futures:
+                    future.cancel()
 
-    def _process_page(self, page, image_dir: Optional[Path]) -> PDFPage:
+    def _iter_pages_processes(
+        self, pdf_path: Path, page_indices: List[int], image_dir: Optional[Path], text_only: bool
+    ) -> Iterator[PDFPage]:
+        import concurrent.futures
+        import multiprocessing
+        from concurrent.futures.process import BrokenProcessPool
+
+        if not page_indices:
+            return
+        workers = max(1, min(self.max_workers or os.cpu_count() or 1, len(page_indices)))
+        # Several small shards per worker balance uneven pages and let results
+        # stream back early; each worker parses the file only once regardless
+        shard_size = max(1, min(16, -(-len(page_indices) // (workers * 4))))
+        shards = [page_indices[i:i + shard_size] for i in range(0, len(page_indices), shard_size)]
+        settings = dict(
+            image_dpi=self.image_dpi,
+            image_quality=self.image_quality,
+            extract_images=self.extract_images and not text_only,
+            save_images_locally=self.save_images_locally,
+            image_save_dir=image_dir,
+        )
+        # Spawned workers: forking a process that runs an event loop and
+        # browser threads can deadlock on locks held by those threads
+        executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_pdf_worker,
+            initargs=(str(pdf_path), settings),
+        )
+        done = 0
+        try:
+            # map() yields shard results in submission order
+            for pages in executor.map(_process_pdf_shard, shards):
+                for page in pages:
+                    yield page
+                    done += 1
+        except BrokenProcessPool:
+            logger.warning(
+                "PDF worker processes died; processing the remaining pages with threads. "
+                "Scripts using executor=\"process\" need an `if __name__ == \"__main__\":` guard."
+            )
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        if done < len(page_indices):
+            yield from self._iter_pages_threads(pdf_path, page_indices[done:], image_dir, text_only)
+
+    def _process_page(
+        self, page, image_dir: Optional[Path], text_only: bool = False, page_number: Optional[int] = None
+    ) -> PDFPage:
+        page_number = page_number or self.current_page_number
         pdf_page = PDFPage(
-            page_number=self.current_page_number,
+            page_number=page_number,
         )
 
         # Text and font extraction
@@ -219,15 +348,15 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         page.extract_text(visitor_text=visitor_text)
 
         # Image extraction
-        if self.extract_images:
+        if self.extract_images and not text_only:
             pdf_page.images = self._extract_images(page, image_dir)
 
         # Link extraction
         pdf_page.links = self._extract_links(page)
         
         # Add markdown content
-        pdf_page.markdown = clean_pdf_text(self.current_page_number, pdf_page.raw_text)
-        pdf_page.html = clean_pdf_text_to_html(self.current_page_number, pdf_page.raw_text)
+        pdf_page.markdown = clean_pdf_text(page_number, pdf_page.raw_text)
+        pdf_page.html = clean_pdf_text_to_html(page_number, pdf_page.raw_text)
 
         return pdf_page
 
@@ -453,6 +582,34 @@ class NaivePDFProcessorStrategy(PDFProcessorStrategy):
         except:
             return None
 
+# Process-pool workers: each worker memory-maps and parses the PDF once in the
+# initializer, then processes the page shards it is handed
+_pdf_worker_state: Dict[str, Any] = {}
+
+
+def _init_pdf_worker(pdf_path: str, settings: Dict[str, Any]) -> None:
+    from PyPDF2 import PdfReader
+
+    file = open(pdf_path, 'rb')
+    buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    _pdf_worker_state.update(
+        file=file,
+        buffer=buffer,
+        reader=PdfReader(buffer),
+        strategy=NaivePDFProcessorStrategy(**settings),
+    )
+
+
+def _process_pdf_shard(page_indices: Sequence[int]) -> List[PDFPage]:
+    reader = _pdf_worker_state["reader"]
+    strategy = _pdf_worker_state["strategy"]
+    pages = []
+    for page_num in page_indices:
+        strategy.current_page_number = page_num + 1
+        pages.append(strategy._process_page(reader.pages[page_num], strategy.image_save_dir, page_number=page_num + 1))
+    return pages
+
+
 # Usage example
 if __name__ == "__main__":
     import json
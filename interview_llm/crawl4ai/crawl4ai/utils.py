@@ -16,10 +16,8 @@ from .config import MIN_WORD_THRESHOLD, IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD, IM
 import httpx
 from socket import gaierror
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable, Generator, Tuple, Iterable
+from typing import Dict, Any, List, Optional, Callable, Generator, Tuple, Iterable, NamedTuple
 from urllib.parse import urljoin
-import requests
-from requests.exceptions import InvalidSchema
 import xxhash
 import textwrap
 import cProfile
@@ -31,7 +29,6 @@ import sqlite3
 import hashlib
 
 from urllib.robotparser import RobotFileParser
-import aiohttp
 from functools import lru_cache
 
 from packaging import version
@@ -39,7 +36,9 @@ from . import __version__
 from typing import Sequence
 
 from itertools import chain
-from collections import deque
+from collections import deque, OrderedDict
+import threading
+from datetime import timedelta
 import psutil
 import numpy as np
 
@@ -252,12 +251,18 @@ class VersionManager:
 class RobotsParser:
     # Default 7 days cache TTL
     CACHE_TTL = 7 * 24 * 60 * 60
+    # Unreachable or missing robots.txt is remembered in memory only, briefly
+    FAILURE_TTL = 5 * 60
 
-    def __init__(self, cache_dir=None, cache_ttl=None):
+    def __init__(self, cache_dir=None, cache_ttl=None, memory_size: int = 1024):
         self.cache_dir = cache_dir or os.path.join(get_home_folder(), ".crawl4ai", "robots")
         self.cache_ttl = cache_ttl or self.CACHE_TTL
+        self.memory_size = memory_size
         os.makedirs(self.cache_dir, exist_ok=True)
         self.db_path = os.path.join(self.cache_dir, "robots_cache.db")
+        # domain -> (expires_at, parsed rules or None when everything is allowed)
+        self._memory: "OrderedDict[str, Tuple[float, Optional[RobotFileParser]]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
         self._init_db()
 
     def _init_db(self):
@@ -274,8 +279,8 @@ class RobotsParser:
             """)
             conn.execute("CREATE INDEX IF NOT EXISTS idx_domain ON robots_cache(domain)")
 
-    def _get_cached_rules(self, domain: str) -> tuple[str, bool]:
-        """Get cached rules. Returns (rules, is_fresh)"""
+    def _get_cached_rules(self, domain: str) -> tuple[str, float]:
+        """Get cached rules. Returns (rules, fetch_time), or (None, 0) if not cached"""
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT rules, fetch_time, hash FROM robots_cache WHERE domain = ?", 
@@ -284,11 +289,10 @@ class RobotsParser:
             result = cursor.fetchone()
             
             if not result:
-                return None, False
+                return None, 0
                 
             rules, fetch_time, _ = result
-            # Check if cache is still fresh based on TTL
-            return rules, (time.time() - fetch_time) < self.cache_ttl
+            return rules, fetch_time
 
     def _cache_rules(self, domain: str, content: str):
         """Cache robots.txt content with hash for change detection"""
@@ -310,9 +314,89 @@ class RobotsParser:
                     (domain, content, int(time.time()), hash_val)
                 )
 
+    def _memory_get(self, domain: str) -> Optional[Tuple[float, Optional[RobotFileParser]]]:
+        entry = self._memory.get(domain)
+        if entry is None:
+            return None
+        if entry[0] < time.time():
+            del self._memory[domain]
+            return None
+        self._memory.move_to_end(domain)
+        return entry
+
+    def _memory_set(self, domain: str, parser: Optional[RobotFileParser], expires_at: float) -> None:
+        self._memory[domain] = (expires_at, parser)
+        self._memory.move_to_end(domain)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _parse_rules(rules: str) -> Optional[RobotFileParser]:
+        if not rules:
+            return None
+        parser = RobotFileParser()
+        parser.parse(rules.splitlines())
+        # If parser can't read rules, allow access
+        if not parser.mtime():
+            return None
+        return parser
+
+    async def _load_rules(self, domain: str, scheme: str) -> Optional[RobotFileParser]:
+        """
+        Parsed rules for ``domain`` from the disk cache or the network, one lookup
+        per domain at a time. The lookup runs in its own task that every caller
+        shields, so cancelling one caller never cancels it for the others.
+        """
+        task = self._inflight.get(domain)
+        # A task left behind by an earlier event loop can no longer be awaited
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.create_task(self._fetch_rules(domain, scheme))
+            self._inflight[domain] = task
+            task.add_done_callback(lambda t: self._forget_inflight(domain, t))
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, domain: str, task: asyncio.Task) -> None:
+        if self._inflight.get(domain) is task:
+            del self._inflight[domain]
+        # Mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_rules(self, domain: str, scheme: str) -> Optional[RobotFileParser]:
+        rules, fetch_time = await asyncio.to_thread(self._get_cached_rules, domain)
+        expires_at = fetch_time + self.cache_ttl
+
+        # If rules not found or stale, fetch new ones
+        if expires_at <= time.time():
+            try:
+                robots_url = f"{scheme}://{domain}/robots.txt"
+                
+                import aiohttp
+
+                async with aiohttp.ClientSession() as session:
+                    async with session.get(robots_url, timeout=2, ssl=False) as response:
+                        if response.status != 200:
+                            self._memory_set(domain, None, time.time() + self.FAILURE_TTL)
+                            return None
+                        rules = await response.text()
+            except Exception as _ex:
+                # On any error (timeout, connection failed, etc), allow access
+                self._memory_set(domain, None, time.time() + self.FAILURE_TTL)
+                return None
+
+            await asyncio.to_thread(self._cache_rules, domain, rules)
+            expires_at = time.time() + self.cache_ttl
+
+        parser = self._parse_rules(rules)
+        self._memory_set(domain, parser, expires_at)
+        return parser
+
     async def can_fetch(self, url: str, user_agent: str = "*") -> bool:
         """
         Check if URL can be fetched according to robots.txt rules.
+
+        Parsed rules are kept in memory per domain; the SQLite cache is only
+        read or written, off the event loop, when a domain is not in memory.
         
         Args:
             url: The URL to check
@@ -330,49 +414,32 @@ class RobotsParser:
         except Exception as _ex:
             return True
 
-        # Fast path - check cache first
-        rules, is_fresh = self._get_cached_rules(domain)
-        
-        # If rules not found or stale, fetch new ones
-        if not is_fresh:
-            try:
-                # Ensure we use the same scheme as the input URL
-                scheme = parsed.scheme or 'http'
-                robots_url = f"{scheme}://{domain}/robots.txt"
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(robots_url, timeout=2, ssl=False) as response:
-                        if response.status == 200:
-                            rules = await response.text()
-                            self._cache_rules(domain, rules)
-                        else:
-                            return True
-            except Exception as _ex:
-                # On any error (timeout, connection failed, etc), allow access
-                return True
-
-        if not rules:
-            return True
+        # Fast path - parsed rules already in memory
+        entry = self._memory_get(domain)
+        if entry is not None:
+            parser = entry[1]
+        else:
+            # Ensure we use the same scheme as the input URL
+            parser = await self._load_rules(domain, parsed.scheme or 'http')
 
-        # Create parser for this check
-        parser = RobotFileParser() 
-        parser.parse(rules.splitlines())
-        
-        # If parser can't read rules, allow access
-        if not parser.mtime():
+        if parser is None:
             return True
             
         return parser.can_fetch(user_agent, url)
 
     def clear_cache(self):
         """Clear all cached robots.txt entries"""
+        self._memory.clear()
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("DELETE FROM robots_cache")
 
     def clear_expired(self):
         """Remove only expired entries from cache"""
+        now = time.time()
+        for domain in [d for d, (expires_at, _) in self._memory.items() if expires_at < now]:
+            del self._memory[domain]
         with sqlite3.connect(self.db_path) as conn:
-            expire_time = int(time.time()) - self.cache_ttl
+            expire_time = int(now) - self.cache_ttl
             conn.execute("DELETE FROM robots_cache WHERE fetch_time < ?", (expire_time,))
       
 
@@ -1279,6 +1346,9 @@ def get_content_of_website_optimized(
                 Returns:
                     The value of the "Content-Length" header as a string if available, otherwise None.
                 """
+                import requests
+                from requests.exceptions import InvalidSchema
+
                 img_url = urljoin(base_url, img.get("src"))
                 try:
                     response = requests.head(img_url)
@@ -2540,12 +2610,213 @@ def is_external_url(url: str, base_domain: str) -> bool:
         return False
 
 
+# Tokens removed by clean_tokens
+_CLEAN_TOKENS_NOISE = frozenset({
+    "ccp",
+    "up",
+    "↑",
+    "▲",
+    "⬆️",
+    "a",
+    "an",
+    "at",
+    "by",
+    "in",
+    "of",
+    "on",
+    "to",
+    "the",
+})
+
+_CLEAN_TOKENS_STOP_WORDS = frozenset({
+    "a",
+    "an",
+    "and",
+    "are",
+    "as",
+    "at",
+    "be",
+    "by",
+    "for",
+    "from",
+    "has",
+    "he",
+    "in",
+    "is",
+    "it",
+    "its",
+    "of",
+    "on",
+    "that",
+    "the",
+    "to",
+    "was",
+    "were",
+    "will",
+    "with",
+    # Pronouns
+    "i",
+    "you",
+    "he",
+    "she",
+    "it",
+    "we",
+    "they",
+    "me",
+    "him",
+    "her",
+    "us",
+    "them",
+    "my",
+    "your",
+    "his",
+    "her",
+    "its",
+    "our",
+    "their",
+    "mine",
+    "yours",
+    "hers",
+    "ours",
+    "theirs",
+    "myself",
+    "yourself",
+    "himself",
+    "herself",
+    "itself",
+    "ourselves",
+    "themselves",
+    # Common verbs
+    "am",
+    "is",
+    "are",
+    "was",
+    "were",
+    "be",
+    "been",
+    "being",
+    "have",
+    "has",
+    "had",
+    "having",
+    "do",
+    "does",
+    "did",
+    "doing",
+    # Prepositions
+    "about",
+    "above",
+    "across",
+    "after",
+    "against",
+    "along",
+    "among",
+    "around",
+    "at",
+    "before",
+    "behind",
+    "below",
+    "beneath",
+    "beside",
+    "between",
+    "beyond",
+    "by",
+    "down",
+    "during",
+    "except",
+    "for",
+    "from",
+    "in",
+    "inside",
+    "into",
+    "near",
+    "of",
+    "off",
+    "on",
+    "out",
+    "outside",
+    "over",
+    "past",
+    "through",
+    "to",
+    "toward",
+    "under",
+    "underneath",
+    "until",
+    "up",
+    "upon",
+    "with",
+    "within",
+    # Conjunctions
+    "and",
+    "but",
+    "or",
+    "nor",
+    "for",
+    "yet",
+    "so",
+    "although",
+    "because",
+    "since",
+    "unless",
+    # Articles
+    "a",
+    "an",
+    "the",
+    # Other common words
+    "this",
+    "that",
+    "these",
+    "those",
+    "what",
+    "which",
+    "who",
+    "whom",
+    "whose",
+    "when",
+    "where",
+    "why",
+    "how",
+    "all",
+    "any",
+    "both",
+    "each",
+    "few",
+    "more",
+    "most",
+    "other",
+    "some",
+    "such",
+    "can",
+    "cannot",
+    "can't",
+    "could",
+    "couldn't",
+    "may",
+    "might",
+    "must",
+    "mustn't",
+    "shall",
+    "should",
+    "shouldn't",
+    "will",
+    "won't",
+    "would",
+    "wouldn't",
+    "not",
+    "n't",
+    "no",
+    "nor",
+    "none",
+})
+
+
 def clean_tokens(tokens: list[str]) -> list[str]:
     """
     Clean a list of tokens by removing noise, stop words, and short tokens.
 
     How it works:
-    1. Defines a set of noise words and stop words.
+    1. Uses the module-level sets of noise words and stop words.
     2. Filters tokens based on length and exclusion criteria.
     3. Excludes tokens starting with certain symbols (e.g., "↑", "▲").
 
@@ -2556,219 +2827,24 @@ def clean_tokens(tokens: list[str]) -> list[str]:
         list[str]: The cleaned list of tokens.
     """
 
-    # Set of tokens to remove
-    noise = {
-        "ccp",
-        "up",
-        "↑",
-        "▲",
-        "⬆️",
-        "a",
-        "an",
-        "at",
-        "by",
-        "in",
-        "of",
-        "on",
-        "to",
-        "the",
-    }
-
-    STOP_WORDS = {
-        "a",
-        "an",
-        "and",
-        "are",
-        "as",
-        "at",
-        "be",
-        "by",
-        "for",
-        "from",
-        "has",
-        "he",
-        "in",
-        "is",
-        "it",
-        "its",
-        "of",
-        "on",
-        "that",
-        "the",
-        "to",
-        "was",
-        "were",
-        "will",
-        "with",
-        # Pronouns
-        "i",
-        "you",
-        "he",
-        "she",
-        "it",
-        "we",
-        "they",
-        "me",
-        "him",
-        "her",
-        "us",
-        "them",
-        "my",
-        "your",
-        "his",
-        "her",
-        "its",
-        "our",
-        "their",
-        "mine",
-        "yours",
-        "hers",
-        "ours",
-        "theirs",
-        "myself",
-        "yourself",
-        "himself",
-        "herself",
-        "itself",
-        "ourselves",
-        "themselves",
-        # Common verbs
-        "am",
-        "is",
-        "are",
-        "was",
-        "were",
-        "be",
-        "been",
-        "being",
-        "have",
-        "has",
-        "had",
-        "having",
-        "do",
-        "does",
-        "did",
-        "doing",
-        # Prepositions
-        "about",
-        "above",
-        "across",
-        "after",
-        "against",
-        "along",
-        "among",
-        "around",
-        "at",
-        "before",
-        "behind",
-        "below",
-        "beneath",
-        "beside",
-        "between",
-        "beyond",
-        "by",
-        "down",
-        "during",
-        "except",
-        "for",
-        "from",
-        "in",
-        "inside",
-        "into",
-        "near",
-        "of",
-        "off",
-        "on",
-        "out",
-        "outside",
-        "over",
-        "past",
-        "through",
-        "to",
-        "toward",
-        "under",
-        "underneath",
-        "until",
-        "up",
-        "upon",
-        "with",
-        "within",
-        # Conjunctions
-        "and",
-        "but",
-        "or",
-        "nor",
-        "for",
-        "yet",
-        "so",
-        "although",
-        "because",
-        "since",
-        "unless",
-        # Articles
-        "a",
-        "an",
-        "the",
-        # Other common words
-        "this",
-        "that",
-        "these",
-        "those",
-        "what",
-        "which",
-        "who",
-        "whom",
-        "whose",
-        "when",
-        "where",
-        "why",
-        "how",
-        "all",
-        "any",
-        "both",
-        "each",
-        "few",
-        "more",
-        "most",
-        "other",
-        "some",
-        "such",
-        "can",
-        "cannot",
-        "can't",
-        "could",
-        "couldn't",
-        "may",
-        "might",
-        "must",
-        "mustn't",
-        "shall",
-        "should",
-        "shouldn't",
-        "will",
-        "won't",
-        "would",
-        "wouldn't",
-        "not",
-        "n't",
-        "no",
-        "nor",
-        "none",
-    }
-
     # Single comprehension, more efficient than multiple passes
     return [
         token
         for token in tokens
         if len(token) > 2
-        and token not in noise
-        and token not in STOP_WORDS
+        and token not in _CLEAN_TOKENS_NOISE
+        and token not in _CLEAN_TOKENS_STOP_WORDS
         and not token.startswith("↑")
         and not token.startswith("▲")
         and not token.startswith("⬆")
     ]
 
 
+def is_clean_token(token: str) -> bool:
+    """True if ``clean_tokens`` keeps ``token``."""
+    return bool(clean_tokens([token]))
+
+
 def profile_and_time(func):
     """
     Decorator to profile a function's execution time and performance.
@@ -2941,38 +3017,322 @@ def optimize_html(html_str, threshold=200):
     
     return lxml.html.tostring(root, encoding='unicode', pretty_print=False)
 
+class HeadResult(NamedTuple):
+    """Outcome of a HeadFetcher fetch. Unpacks as ``(ok, html, final_url)``."""
+    ok: bool
+    html: str
+    final_url: str
+
+
+class HeadFetcher:
+    """
+    Shared, connection-pooled fetcher for the ``<head>`` section of web pages.
+
+    Every head-consuming component (``HeadPeekr`` and the filters built on it,
+    ``AsyncUrlSeeder``) goes through a shared instance per User-Agent and TTL,
+    so a URL is fetched at most once per TTL no matter how many consumers ask
+    for it:
+
+      - One pooled ``httpx.AsyncClient`` (HTTP/2 when ``h2`` is installed,
+        keep-alive) is reused across calls instead of a client per URL.
+      - A single streamed GET follows redirects and stops reading as soon as
+        ``</head>`` arrives or ``max_bytes`` is reached.
+      - Results are cached in memory (LRU) and in a SQLite file on disk, keyed
+        by the final URL with the requested URL kept as an alias.
+      - Concurrent requests for the same URL share one in-flight fetch.
+
+    Only successful fetches are cached.
+
+    Args:
+        client: Optional client to use. When omitted the fetcher creates and
+            owns a pooled client.
+        ttl: How long a cached head stays fresh.
+        memory_size: Maximum number of entries kept in the in-memory LRU.
+        cache_path: SQLite file for the disk cache. Defaults to
+            ``~/.crawl4ai/cache/head_cache.db``.
+        use_disk_cache: Set to False to keep the cache in memory only.
+        max_connections: Pool size of the owned client.
+        user_agent: User-Agent header sent with each request.
+        logger: Optional AsyncLogger for debug output.
+    """
+
+    DEFAULT_TTL = timedelta(days=1)
+    DEFAULT_USER_AGENT = "Mozilla/5.0 (compatible; CrawlBot/1.0)"
+
+    _shared: Dict[Tuple[str, timedelta], "HeadFetcher"] = {}
+
+    def __init__(
+        self,
+        client: Optional[httpx.AsyncClient] = None,
+        ttl: timedelta = DEFAULT_TTL,
+        memory_size: int = 10_000,
+        cache_path: Optional[str] = None,
+        use_disk_cache: bool = True,
+        max_connections: int = 100,
+        user_agent: str = DEFAULT_USER_AGENT,
+        logger=None,
+    ):
+        self.ttl = ttl
+        self.memory_size = memory_size
+        self.max_connections = max_connections
+        self.user_agent = user_agent
+        self.logger = logger
+        self._client = client
+        self._owns_client = client is None
+        self._client_loop = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._memory: "OrderedDict[str, Tuple[float, HeadResult]]" = OrderedDict()
+
+        self.cache_path = None
+        self._db = None
+        self._db_lock = threading.Lock()
+        if use_disk_cache:
+            self.cache_path = cache_path or os.path.join(get_home_folder(), "cache", "head_cache.db")
+            os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            self._db = sqlite3.connect(self.cache_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("""
+                CREATE TABLE IF NOT EXISTS head_cache (
+                    url TEXT PRIMARY KEY,
+                    final_url TEXT NOT NULL,
+                    html TEXT NOT NULL,
+                    fetch_time REAL NOT NULL
+                )
+            """)
+            self._db.commit()
+
+    @classmethod
+    def shared(cls, user_agent: str = DEFAULT_USER_AGENT, ttl: timedelta = DEFAULT_TTL) -> "HeadFetcher":
+        """
+        Process-wide instance for the given User-Agent and TTL, used by
+        HeadPeekr and AsyncUrlSeeder. All of them share the disk cache.
+        """
+        key = (user_agent, ttl)
+        fetcher = cls._shared.get(key)
+        if fetcher is None:
+            fetcher = cls._shared[key] = cls(ttl=ttl, user_agent=user_agent)
+        return fetcher
+
+    def _log(self, message: str, **params):
+        if self.logger:
+            self.logger.debug(message=message, tag="HEAD", params=params)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # httpx clients are bound to the loop they were first used on; a
+        # shared fetcher can outlive several asyncio.run() calls.
+        loop = asyncio.get_running_loop()
+        if self._owns_client and (self._client is None or self._client_loop is not loop):
+            try:
+                import h2  # noqa: F401
+                http2 = True
+            except ImportError:
+                http2 = False
+            self._client = httpx.AsyncClient(
+                http2=http2,
+                timeout=20,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                headers={"User-Agent": self.user_agent},
+            )
+            self._client_loop = loop
+            self._inflight.clear()
+        return self._client
+
+    # Cache -------------------------------------------------------------------
+
+    def _memory_get(self, url: str) -> Optional[HeadResult]:
+        entry = self._memory.get(url)
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if expires_at < time.time():
+            del self._memory[url]
+            return None
+        self._memory.move_to_end(url)
+        return result
+
+    def _memory_set(self, keys: Iterable[str], result: HeadResult, fetch_time: float) -> None:
+        expires_at = fetch_time + self.ttl.total_seconds()
+        for key in keys:
+            self._memory[key] = (expires_at, result)
+            self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _disk_get(self, url: str) -> Optional[Tuple[HeadResult, float]]:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT final_url, html, fetch_time FROM head_cache WHERE url = ?", (url,)
+            ).fetchone()
+        if not row or time.time() - row[2] > self.ttl.total_seconds():
+            return None
+        return HeadResult(True, row[1], row[0]), row[2]
+
+    def _disk_set(self, keys: Iterable[str], result: HeadResult, fetch_time: float) -> None:
+        with self._db_lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO head_cache (url, final_url, html, fetch_time) VALUES (?, ?, ?, ?)",
+                [(key, result.final_url, result.html, fetch_time) for key in keys],
+            )
+            self._db.commit()
+
+    # Fetching ----------------------------------------------------------------
+
+    async def fetch(
+        self,
+        url: str,
+        timeout: float = 10,
+        max_redirects: int = 5,
+        max_bytes: int = 65_536,
+        chunk_size: int = 4096,
+        force: bool = False,
+    ) -> HeadResult:
+        """
+        Return the ``<head>`` of ``url``, from cache when fresh.
+
+        Args:
+            url: Page to fetch.
+            timeout: Per-request timeout in seconds.
+            max_redirects: Redirects to follow before giving up.
+            max_bytes: Stop reading after this many bytes even without ``</head>``.
+            chunk_size: Bytes read per await.
+            force: Skip the cache lookup (the result is still cached).
+
+        Returns:
+            HeadResult: ``(ok, html, final_url)``.
+        """
+        if not force:
+            cached = self._memory_get(url)
+            if cached is not None:
+                return cached
+            if self._db is not None:
+                hit = await asyncio.to_thread(self._disk_get, url)
+                if hit is not None:
+                    result, fetch_time = hit
+                    self._memory_set({url, result.final_url}, result, fetch_time)
+                    return result
+
+        client = self._get_client()
+        # The fetch runs in its own task that every caller shields, so
+        # cancelling one caller never cancels it for the others
+        task = self._inflight.get(url)
+        if task is None:
+            task = asyncio.create_task(
+                self._fetch_and_cache(client, url, timeout, max_redirects, max_bytes, chunk_size)
+            )
+            self._inflight[url] = task
+            task.add_done_callback(lambda t: self._forget_inflight(url, t))
+        return await asyncio.shield(task)
+
+    def _forget_inflight(self, url: str, task: asyncio.Task) -> None:
+        if self._inflight.get(url) is task:
+            del self._inflight[url]
+        # Mark the exception as retrieved when every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch_and_cache(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        timeout: float,
+        max_redirects: int,
+        max_bytes: int,
+        chunk_size: int,
+    ) -> HeadResult:
+        result = await self._fetch(client, url, timeout, max_redirects, max_bytes, chunk_size)
+        if result.ok:
+            fetch_time = time.time()
+            keys = {url, result.final_url}
+            self._memory_set(keys, result, fetch_time)
+            if self._db is not None:
+                await asyncio.to_thread(self._disk_set, keys, result, fetch_time)
+        return result
+
+    async def _fetch(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        timeout: float,
+        max_redirects: int,
+        max_bytes: int,
+        chunk_size: int,
+    ) -> HeadResult:
+        headers = {"Accept": "text/html", "Accept-Encoding": "identity"}
+        for _ in range(max_redirects + 1):
+            try:
+                async with client.stream(
+                    "GET", url, timeout=timeout, headers=headers, follow_redirects=False
+                ) as r:
+                    if r.status_code in (301, 302, 303, 307, 308):
+                        location = r.headers.get("Location")
+                        if not location:
+                            return HeadResult(False, "", str(r.url))
+                        url = urljoin(str(r.url), location)
+                        self._log("Redirect {from_url} -> {to_url}", from_url=str(r.url), to_url=url)
+                        continue
+
+                    if not (200 <= r.status_code < 400):
+                        self._log("Status {status} fetching head of {url}", status=r.status_code, url=url)
+                        return HeadResult(False, "", str(r.url))
+
+                    # Scan only the newly read bytes (plus an overlap for a tag
+                    # split across chunks) so the search stays linear.
+                    buf = bytearray()
+                    end = -1
+                    async for chunk in r.aiter_bytes(chunk_size):
+                        scan_from = max(0, len(buf) - 6)
+                        buf.extend(chunk)
+                        idx = buf[scan_from:].lower().find(b"</head>")
+                        if idx != -1:
+                            end = scan_from + idx + 7
+                            break
+                        if len(buf) >= max_bytes:
+                            break
+
+                    # If no </head> is found, keep at most 10KB
+                    html_bytes = buf[:end] if end != -1 else buf[:10240]
+                    return HeadResult(True, html_bytes.decode("utf-8", "replace"), str(r.url))
+            except (httpx.HTTPError, gaierror) as e:
+                self._log("Fetch head error for {url}: {error}", url=url, error=str(e))
+                return HeadResult(False, "", url)
+
+        self._log("Exceeded max redirects ({max_redirects}) for {url}", max_redirects=max_redirects, url=url)
+        return HeadResult(False, "", url)
+
+    async def close(self):
+        """Close the owned client and the disk cache."""
+        if self._owns_client and self._client is not None:
+            try:
+                await self._client.aclose()
+            except RuntimeError:
+                # Client was bound to a loop that is already closed
+                pass
+            self._client = None
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+            self._db = None
+        for key, fetcher in list(HeadFetcher._shared.items()):
+            if fetcher is self:
+                del HeadFetcher._shared[key]
+
+
 class HeadPeekr:
     @staticmethod
     async def fetch_head_section(url, timeout=0.3):
-        headers = {
-            "User-Agent": "Mozilla/5.0 (compatible; CrawlBot/1.0)",
-            "Accept": "text/html",
-            "Connection": "close"  # Force close after response
-        }
-        try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.get(url, headers=headers, follow_redirects=True)
-                
-                # Handle redirects explicitly by using the final URL
-                if response.url != url:
-                    url = str(response.url)
-                    response = await client.get(url, headers=headers)
-                
-                content = b""
-                async for chunk in response.aiter_bytes():
-                    content += chunk
-                    if b"</head>" in content:
-                        break  # Stop after detecting </head>
-                return content.split(b"</head>")[0] + b"</head>"
-        except (httpx.HTTPError, gaierror) :
+        result = await HeadFetcher.shared().fetch(url, timeout=timeout)
+        if not result.ok:
             return None
+        return result.html.encode("utf-8")
 
     @staticmethod
     async def peek_html(url, timeout=0.3):
-        head_section = await HeadPeekr.fetch_head_section(url, timeout=timeout)
-        if head_section:
-            return head_section.decode("utf-8", errors="ignore")
-        return None
+        result = await HeadFetcher.shared().fetch(url, timeout=timeout)
+        return result.html if result.ok and result.html else None
 
     @staticmethod
     def extract_meta_tags(head_content: str):
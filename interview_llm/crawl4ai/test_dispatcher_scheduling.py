@@ -0,0 +1,174 @@
+"""
+Scheduling checks for MemoryAdaptiveDispatcher and its AgingTaskQueue:
+retry and aging order, per-domain rate limits, and URLs added to a
+running stream.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from crawl4ai import CrawlerRunConfig
+from crawl4ai.async_dispatcher import AgingTaskQueue, MemoryAdaptiveDispatcher, RateLimiter
+
+ROOT = "https://example.com/"
+
+
+class FakeCrawler:
+    """Stands in for AsyncWebCrawler.arun."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.calls = []
+
+    async def arun(self, url, config=None, session_id=None):
+        self.calls.append(url)
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(url=url, success=True, status_code=200, error_message="")
+
+
+def _dispatcher(**kwargs):
+    # Thresholds no real machine reaches, so memory never throttles the tests
+    return MemoryAdaptiveDispatcher(
+        memory_threshold_percent=100.0,
+        critical_threshold_percent=100.0,
+        recovery_threshold_percent=99.0,
+        check_interval=0.05,
+        **kwargs,
+    )
+
+
+def _drain(queue):
+    urls = []
+    while True:
+        try:
+            urls.append(queue.get_nowait()[0])
+        except asyncio.QueueEmpty:
+            return urls
+
+
+def test_queue_serves_fewest_retries_then_arrival_order():
+    queue = AgingTaskQueue(fairness_timeout=600)
+    now = time.time()
+    queue.put_nowait(f"{ROOT}retried-twice", "t1", 2, now)
+    queue.put_nowait(f"{ROOT}new-first", "t2", 0, now + 1)
+    queue.put_nowait(f"{ROOT}retried-once", "t3", 1, now)
+    queue.put_nowait(f"{ROOT}new-second", "t4", 0, now + 2)
+
+    assert queue.wait_statistics()[0] == 4
+    assert _drain(queue) == [
+        f"{ROOT}new-first",
+        f"{ROOT}new-second",
+        f"{ROOT}retried-once",
+        f"{ROOT}retried-twice",
+    ]
+    assert queue.empty()
+
+
+def test_tasks_waiting_past_fairness_timeout_go_first_longest_wait_first():
+    queue = AgingTaskQueue(fairness_timeout=10)
+    now = time.time()
+    queue.put_nowait(f"{ROOT}fresh", "t1", 0, now)
+    queue.put_nowait(f"{ROOT}aged", "t2", 5, now - 60)
+    queue.put_nowait(f"{ROOT}oldest", "t3", 3, now - 120)
+
+    assert _drain(queue) == [f"{ROOT}oldest", f"{ROOT}aged", f"{ROOT}fresh"]
+
+
+def test_backing_off_domain_does_not_block_a_ready_one():
+    limiter = RateLimiter(base_delay=(30, 30))
+    limiter.reserve("https://slow.com/")  # slow.com may not be hit again for 30s
+    queue = AgingTaskQueue(rate_limiter=limiter)
+    now = time.time()
+    queue.put_nowait("https://slow.com/1", "t1", 0, now - 5)
+    queue.put_nowait("https://fast.com/1", "t2", 1, now)
+
+    assert _drain(queue) == ["https://fast.com/1"]
+    assert len(queue) == 1
+    assert queue.next_ready_time() == pytest.approx(limiter.ready_time("slow.com"))
+
+
+def test_stream_keeps_crawling_other_domains_while_one_backs_off():
+    fast = [f"https://fast{i}.com/" for i in range(4)]
+
+    async def run():
+        dispatcher = _dispatcher(rate_limiter=RateLimiter(base_delay=(30, 30)), max_session_permit=2)
+        urls = ["https://slow.com/1", "https://slow.com/2", *fast]
+        stream = dispatcher.run_urls_stream(urls, FakeCrawler(), CrawlerRunConfig())
+        seen = []
+        started = time.monotonic()
+        async for result in stream:
+            seen.append(result.url)
+            if len(seen) == 5:
+                break
+        await stream.aclose()
+        return seen, time.monotonic() - started
+
+    seen, elapsed = asyncio.run(run())
+    assert set(seen) == {"https://slow.com/1", *fast}
+    assert elapsed < 5
+
+
+def test_urls_added_to_a_running_stream_are_crawled():
+    children = [f"{ROOT}{i}" for i in range(3)]
+
+    async def run():
+        dispatcher = _dispatcher()
+        seen = []
+        async for result in dispatcher.run_urls_stream([ROOT], FakeCrawler(), CrawlerRunConfig()):
+            seen.append(result.url)
+            if result.url == ROOT:
+                dispatcher.add_urls(children)
+            elif result.url == children[0]:
+                dispatcher.add_urls([f"{ROOT}0/child"])
+        return seen
+
+    seen = asyncio.run(run())
+    assert sorted(seen) == sorted([ROOT, *children, f"{ROOT}0/child"])
+
+
+def test_requeued_task_gives_its_rate_limit_slot_back():
+    limiter = RateLimiter(base_delay=(30, 30))
+
+    async def run():
+        dispatcher = _dispatcher(rate_limiter=limiter)
+        dispatcher.crawler = FakeCrawler()
+        dispatcher.current_memory_percent = 100.0  # critical
+        dispatcher.task_queue.put_nowait(ROOT, "t1")
+        active_tasks = set()
+        dispatcher._dispatch_ready(active_tasks, CrawlerRunConfig())
+        assert limiter.ready_time("example.com") > time.time()
+        result = await active_tasks.pop()
+        return dispatcher, result
+
+    dispatcher, result = asyncio.run(run())
+    assert result.result.metadata["status"] == "requeued"
+    assert dispatcher.crawler.calls == []
+    assert limiter.ready_time("example.com") <= time.time()
+    assert dispatcher.task_queue.get_nowait()[:3] == (ROOT, "t1", 1)
+
+
+def test_stream_yields_the_crawl_not_the_requeued_placeholder(monkeypatch):
+    # Critical on the first reading, fine afterwards
+    readings = iter([100.0])
+    monkeypatch.setattr(
+        "crawl4ai.async_dispatcher.get_true_memory_usage_percent", lambda: next(readings, 0.0)
+    )
+
+    async def run():
+        dispatcher = _dispatcher()
+        crawler = FakeCrawler()
+        results = [r async for r in dispatcher.run_urls_stream([ROOT], crawler, CrawlerRunConfig())]
+        return results, crawler.calls
+
+    results, calls = asyncio.run(run())
+    assert calls == [ROOT]
+    assert len(results) == 1
+    assert results[0].result.success
+    assert results[0].retry_count == 1
@@ -0,0 +1,156 @@
+"""
+Kill-and-resume checks for deep crawls backed by a SQLiteFrontier.
+
+A crawl is stopped after a few pages, then resumed from the same frontier
+file with a fresh strategy; together the two runs must cover the whole site.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from crawl4ai import CrawlerRunConfig
+from crawl4ai.deep_crawling import BestFirstCrawlingStrategy, BFSDeepCrawlStrategy, DFSDeepCrawlStrategy
+from crawl4ai.deep_crawling.frontier import SQLiteFrontier
+
+ROOT = "https://example.com/"
+
+
+def _site():
+    """Root -> a1..a3 -> b11..b33: 13 pages, two levels deep."""
+    links = {ROOT: [f"{ROOT}a{i}" for i in range(1, 4)]}
+    for i in range(1, 4):
+        links[f"{ROOT}a{i}"] = [f"{ROOT}b{i}{j}" for j in range(1, 4)]
+    return links
+
+
+SITE = _site()
+ALL_PAGES = set(SITE) | {url for children in SITE.values() for url in children}
+
+
+class FakeCrawler:
+    """Stands in for AsyncWebCrawler.arun_many in stream mode."""
+
+    def __init__(self):
+        self.crawled = []
+
+    async def arun_many(self, urls, config):
+        async def results():
+            for url in urls:
+                await asyncio.sleep(0)
+                self.crawled.append(url)
+                yield SimpleNamespace(
+                    url=url,
+                    success=True,
+                    metadata={},
+                    links={"internal": [{"href": href} for href in SITE.get(url, [])]},
+                )
+        return results()
+
+
+async def _crawl(strategy_cls, path, stop_after=None):
+    crawler = FakeCrawler()
+    frontier = SQLiteFrontier(path)
+    strategy = strategy_cls(max_depth=2, frontier=frontier)
+    config = CrawlerRunConfig(deep_crawl_strategy=strategy, stream=True)
+    stream = await strategy.arun(start_url=ROOT, crawler=crawler, config=config)
+    seen = []
+    async for result in stream:
+        seen.append(result.url)
+        if stop_after is not None and len(seen) >= stop_after:
+            break
+    await stream.aclose()
+    frontier.close()
+    return seen
+
+
+@pytest.mark.parametrize("stop_after", [1, 3, 5, 8])
+@pytest.mark.parametrize(
+    "strategy_cls", [BFSDeepCrawlStrategy, BestFirstCrawlingStrategy, DFSDeepCrawlStrategy]
+)
+def test_killed_crawl_resumes_without_losing_pages(strategy_cls, stop_after):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "frontier.db")
+        first = asyncio.run(_crawl(strategy_cls, path, stop_after=stop_after))
+        second = asyncio.run(_crawl(strategy_cls, path))
+
+        assert len(first) == stop_after
+        assert set(first) | set(second) == ALL_PAGES
+
+
+@pytest.mark.parametrize("strategy_cls", [BestFirstCrawlingStrategy, DFSDeepCrawlStrategy])
+def test_resume_after_finished_crawl_crawls_nothing(strategy_cls):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "frontier.db")
+        first = asyncio.run(_crawl(strategy_cls, path))
+        second = asyncio.run(_crawl(strategy_cls, path))
+
+        assert set(first) == ALL_PAGES
+        assert second == []
+
+
+def _adaptive_pages(batch):
+    return [
+        SimpleNamespace(
+            url=f"{ROOT}{batch}/{i}",
+            markdown=SimpleNamespace(raw_markdown=f"alpha beta gamma{batch} word{i} " * (i + 1)),
+            links={},
+            metadata={},
+        )
+        for i in range(3)
+    ]
+
+
+def _adaptive_snapshot(state):
+    return (
+        [cr.url for cr in state.knowledge_base],
+        dict(state.term_frequencies),
+        dict(state.document_frequencies),
+        {term: sorted(ids) for term, ids in state.documents_with_terms.items()},
+        state.total_documents,
+        state.new_terms_history,
+        state.crawl_order,
+        state.kb_embeddings.tolist(),
+        state.metrics,
+    )
+
+
+def test_adaptive_state_saves_incrementally():
+    import numpy as np
+
+    from crawl4ai.adaptive_crawler import CrawlState, StatisticalStrategy
+
+    async def run(path):
+        strategy = StatisticalStrategy()
+        state = CrawlState(query="alpha beta")
+        blob_sizes = []
+        for batch in range(4):
+            pages = _adaptive_pages(batch)
+            state.knowledge_base.extend(pages)
+            await strategy.update_state(state, pages)
+            rows = np.full((len(pages), 2), float(batch))
+            state.kb_embeddings = rows if state.kb_embeddings is None else np.vstack([state.kb_embeddings, rows])
+            state.metrics = {"confidence": batch / 10}
+            state.save(path)
+
+            loaded = CrawlState.load(path)
+            assert _adaptive_snapshot(loaded) == _adaptive_snapshot(state)
+            if batch == 1:
+                state = loaded  # resume and keep appending to the same file
+
+            with SQLiteFrontier(path) as frontier:
+                assert frontier.log_length("knowledge_base") == len(state.knowledge_base)
+                blob_sizes.append(len(str(frontier.get_state("adaptive_state"))))
+        return blob_sizes
+
+    with tempfile.TemporaryDirectory() as tmp:
+        blob_sizes = asyncio.run(run(os.path.join(tmp, "adaptive.db")))
+
+    # The scalar state does not grow with the knowledge base
+    assert max(blob_sizes) - min(blob_sizes) < 10
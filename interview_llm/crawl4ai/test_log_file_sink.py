@@ -0,0 +1,60 @@
+"""
+LogFileSink writes records in order from its background thread, flush()
+waits for them, and size-based rotation keeps at most ``backup_count`` old
+files.
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from crawl4ai.async_logger import LogFileSink
+
+
+def _lines(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read().splitlines()
+
+
+def test_flush_waits_for_every_queued_record():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "crawl.log")
+        sink = LogFileSink(path, max_batch=16)
+        for i in range(500):
+            sink.emit("INFO", "TEST", f"record {i}")
+        sink.flush()
+
+        lines = _lines(path)
+        assert [line.split("] ", 1)[1] for line in lines] == [f"record {i}" for i in range(500)]
+
+
+def test_rotation_keeps_backup_count_files():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "crawl.log")
+        sink = LogFileSink(path, max_bytes=2_000, backup_count=2)
+        for i in range(1_000):
+            sink.emit("INFO", "TEST", f"record {i}")
+        sink.flush()
+
+        files = [path, f"{path}.1", f"{path}.2"]
+        assert all(os.path.getsize(p) <= 2_000 for p in files)
+        assert not os.path.exists(f"{path}.3")
+        # The newest records survive, contiguous across the rotated files
+        kept = [int(line.rsplit(" ", 1)[1]) for p in reversed(files) for line in _lines(p)]
+        assert kept == list(range(1_000 - len(kept), 1_000))
+
+
+def test_json_lines_strip_markup_and_keep_bad_markup_records():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "crawl.jsonl")
+        sink = LogFileSink(path, json_lines=True)
+        sink.emit("INFO", "FETCH", "[green]ok[/green]", markup=True, params={"url": "https://example.com"})
+        sink.emit("ERROR", "FETCH", "closing [/bold] tag without opener", markup=True)
+        sink.flush()
+
+        first, second = [json.loads(line) for line in _lines(path)]
+        assert (first["level"], first["message"], first["params"]) == ("INFO", "ok", {"url": "https://example.com"})
+        assert second["message"] == "closing [/bold] tag without opener"
@@ -0,0 +1,74 @@
+"""
+RobotsParser loads each domain's rules once, however many crawls ask for
+them at the same time, and a caller that gives up does not cancel the load
+for the others.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from crawl4ai.utils import RobotsParser
+
+ROBOTS_TXT = "User-agent: *\nDisallow: /private\n"
+
+
+def test_concurrent_checks_share_one_lookup():
+    with tempfile.TemporaryDirectory() as tmp:
+        robots = RobotsParser(cache_dir=tmp)
+        robots._cache_rules("example.com", ROBOTS_TXT)
+
+        lookups = []
+        read_cache = robots._get_cached_rules
+
+        def counting_read(domain):
+            lookups.append(domain)
+            return read_cache(domain)
+
+        robots._get_cached_rules = counting_read
+
+        async def run():
+            urls = [f"https://example.com/{'private' if i % 2 else 'public'}/{i}" for i in range(20)]
+            first = await asyncio.gather(*(robots.can_fetch(url) for url in urls))
+            again = await robots.can_fetch("https://example.com/private/x")
+            return first, again
+
+        first, again = asyncio.run(run())
+
+        assert lookups == ["example.com"]
+        assert first == [i % 2 == 0 for i in range(20)]
+        assert again is False
+        assert robots._inflight == {}
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_load():
+    with tempfile.TemporaryDirectory() as tmp:
+        robots = RobotsParser(cache_dir=tmp)
+        fetches = []
+
+        async def run():
+            release = asyncio.Event()
+
+            async def slow_fetch(domain, scheme):
+                fetches.append(domain)
+                await release.wait()
+                return RobotsParser._parse_rules(ROBOTS_TXT)
+
+            robots._fetch_rules = slow_fetch
+            impatient = asyncio.create_task(robots.can_fetch("https://example.com/private/a"))
+            patient = asyncio.create_task(robots.can_fetch("https://example.com/private/b"))
+            await asyncio.sleep(0)
+            impatient.cancel()
+            await asyncio.sleep(0)
+            release.set()
+            return impatient, await patient
+
+        impatient, allowed = asyncio.run(run())
+
+        assert impatient.cancelled()
+        assert allowed is False
+        assert fetches == ["example.com"]
+        assert robots._inflight == {}
@@ -0,0 +1,56 @@
+"""
+URLPatternFilter merges its rules into one regex; every decision must match
+the rule-by-rule fallback path, including patterns with backreferences.
+"""
+
+import os
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from crawl4ai.deep_crawling.filters import URLPatternFilter
+
+URLS = [
+    "https://a.com/ab-ab",
+    "https://a.com/ab-cd",
+    "https://a.com/zzz/page",
+    "https://a.com/docs/index.html",
+    "https://a.com/docs/index.html?x=1",
+    "https://a.com/api/v1/users",
+    "https://a.com/apiv2/users",
+    "https://blog.example.com/post/1",
+    "https://example.com/post/1",
+    "https://a.com/files/report.pdf",
+    "https://a.com/2024/05/title",
+    "https://a.com/en/guide",
+    "https://a.com/fr/guide",
+    "https://a.com/",
+]
+
+PATTERN_SETS = [
+    [re.compile(r"/(zz+)/"), re.compile(r"/(\w+)-\1\b")],
+    [re.compile(r"/zz+/"), re.compile(r"/(\w+)-\1\b")],
+    [r"/(\w+)-\1\b", "*.html"],
+    [r"^https://a\.com/(\w+)/\1$", "*/api/*"],
+    ["*.html", "*.pdf", "https://a.com/api/*"],
+    ["*.example.com/*", r"\d{4}/\d{2}"],
+    ["*/{en,fr}/*", "*guide*"],
+    ["**/docs/**"],
+]
+
+
+@pytest.mark.parametrize("patterns", PATTERN_SETS)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_compiled_matches_fallback(patterns, reverse):
+    compiled = URLPatternFilter(patterns=patterns, reverse=reverse)
+    for url in URLS:
+        assert compiled.apply(url) == compiled._apply_uncompiled(url), url
+
+
+def test_backreference_keeps_its_group():
+    f = URLPatternFilter(patterns=[re.compile(r"/(zz+)/"), re.compile(r"/(\w+)-\1\b")])
+    assert f.apply("https://a.com/ab-ab")
+    assert not f.apply("https://a.com/ab-cd")
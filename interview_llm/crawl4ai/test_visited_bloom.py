@@ -0,0 +1,27 @@
+"""
+ScalableBloomFilter keeps its false-positive rate under ``error_rate`` as it
+grows past the first slice, and never forgets a URL it was given.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from crawl4ai.deep_crawling.visited import ScalableBloomFilter
+
+
+def test_false_positive_rate_stays_bounded_across_slices():
+    error_rate = 0.01
+    bloom = ScalableBloomFilter(initial_capacity=1_000, error_rate=error_rate)
+    added = [f"https://example.com/page/{i}" for i in range(20_000)]
+    bloom.update(added)
+
+    assert len(bloom.filters) > 3
+    assert sum(slice_.error_rate for slice_ in bloom.filters) < error_rate
+    assert all(url in bloom for url in added)
+
+    probes = 100_000
+    false_positives = sum(f"https://example.org/other/{i}" in bloom for i in range(probes))
+    # The bound holds in expectation; allow for sampling noise (~3 sigma)
+    assert false_positives / probes < error_rate * 1.1
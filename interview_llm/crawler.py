@@ -6,9 +6,6 @@ import os
 from datetime import datetime
 from pathlib import Path
 from bs4 import BeautifulSoup
-from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
-from crawl4ai.async_configs import LLMConfig
-from crawl4ai.extraction_strategy import LLMExtractionStrategy
 from pydantic import BaseModel, Field
 import importlib.util
 
@@ -43,6 +40,8 @@ def sanitize_filename(name):
 
 async def search_duckduckgo(crawler, company, position):
     """搜尋 DuckDuckGo 找 104/1111 連結"""
+    from crawl4ai import CrawlerRunConfig, CacheMode
+
     print(f"   └── 🔎 Search: {company} {position}")
     # 優先找 104，也可以加入 1111
     query = f"{company} {position} (site:104.com.tw/job/ OR site:1111.com.tw/job/)"
@@ -52,7 +51,8 @@ async def search_duckduckgo(crawler, company, position):
     config = CrawlerRunConfig(
         cache_mode=CacheMode.BYPASS, 
         wait_for="body", 
-        delay_before_return_html=2.0
+        delay_before_return_html=2.0,
+        readiness_mode="adaptive"
     )
     result = await crawler.arun(url=url, config=config)
     
@@ -70,6 +70,8 @@ async def search_duckduckgo(crawler, company, position):
 
 async def analyze_page(crawler, url, hint_company, hint_position):
     """進入職缺頁面進行 AI 分析"""
+    from crawl4ai import CrawlerRunConfig, CacheMode, LLMConfig, LLMExtractionStrategy
+
     print(f"   └── 🚀 Analyzing: {url}")
     llm_config = LLMConfig(provider="openai/gpt-4o-mini", api_token=API_KEY)
     
@@ -133,7 +135,8 @@ async def analyze_page(crawler, url, hint_company, hint_position):
         cache_mode=CacheMode.BYPASS, 
         extraction_strategy=strategy, 
         wait_for="h1",
-        delay_before_return_html=3.0
+        delay_before_return_html=3.0,
+        readiness_mode="adaptive"
     )
     
     result = await crawler.arun(url=url, config=config)
@@ -160,6 +163,9 @@ async def run_crawler(company_name: str, position: str = "軟體工程師"):
     這是主要的 Entry Point。
     回傳 dict: { "summary": ..., "values": ..., "raw_data": ... }
     """
+    # crawl4ai 在第一次執行時才載入，避免拖慢 FastAPI / worker 啟動
+    from crawl4ai import AsyncWebCrawler, BrowserConfig
+
     print(f"🔄 Crawler started for {company_name}")
     
     browser_cfg = BrowserConfig(headless=True, verbose=False) # Server 上通常用 headless=True